@@ -1,9 +1,7 @@
-import os
 from typing import List
-from Script.Core import json_handle,game_type,get_text
+from Script.Core import game_type,get_text
+from Script.Config import game_config
 
-character_config_file = os.path.join("data","Character.json")
-""" 角色模板配置文件路径 """
 character_config_data = {}
 """ 原始角色模板数据 """
 character_tem_list:List[game_type.NpcTem] = []
@@ -12,13 +10,16 @@ character_tem_list:List[game_type.NpcTem] = []
 def init_character_tem_data():
     """ 初始化预设角色数据 """
     global character_config_data
-    character_config_data = json_handle.load_json(character_config_file)
+    # 角色模板数据已由game_config载入，从翻译包中载入时不再逐字段翻译
+    character_config_data = game_config.character_data
     for character_name in character_config_data:
         now_tem = game_type.NpcTem()
         now_data = character_config_data[character_name]
         for k in now_data:
             # print("k :",k)
-            v = get_text._(now_data[k])
+            v = now_data[k]
+            if not game_config.config_translated and isinstance(v, str):
+                v = get_text._(v)
             # print("v :",v)
             if k.startswith("A|"):
                 now_k = int(k.lstrip("A|"))
@@ -505,6 +505,21 @@ class Talent:
     """ 备注说明 """
 
 
+class ThresholdTable:
+    """ 属性分段表，按数值所在的分段取值，同一分段表内的分段按上界升序排列 """
+
+    cid: int
+    """ 编号id """
+    table_name: str
+    """ 分段表名 """
+    upper: float
+    """ 分段上界(最后一段留空) """
+    include_upper: bool
+    """ 上界是否属于本段(0为数值小于上界时属于本段，1为小于等于上界时属于本段) """
+    value: float
+    """ 该段对应的值 """
+
+
 class TalentType:
     """ 角色能力类型 """
 
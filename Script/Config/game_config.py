@@ -1,6 +1,6 @@
 import os
-from typing import Dict, List, Set
-from Script.Config import config_def
+from typing import Dict, List, Set, Tuple
+from Script.Config import config_def, normal_config
 from Script.Core import json_handle, get_text, game_type
 
 
@@ -13,6 +13,8 @@ config_data = {}
 """ 原始json数据 """
 character_data = {}
 """ 原始角色数据 """
+config_translated: bool = False
+""" 配置数据是否已从翻译包中载入，载入后不再逐字段翻译 """
 config_bar: Dict[int, config_def.BarConfig] = {}
 """ 比例条配置数据 """
 config_bar_data: Dict[str, int] = {}
@@ -140,6 +142,8 @@ config_talent_up_data: Dict[int, Dict[int, config_def.TalentUp]] = {}
 """
 config_instruct_judge_data: Dict[int, config_def.InstructJudge] = {}
 """ 每个指令的实行值判定数据 """
+config_instruct_judge_name_data: Dict[str, config_def.InstructJudge] = {}
+""" 指令名字对应的实行值判定数据，同名时取id最靠前的 """
 config_recipes: Dict[int, config_def.Recipes] = {}
 """ 菜谱配置 """
 config_season: Dict[int, config_def.Season] = {}
@@ -152,6 +156,13 @@ config_tip_tem: Dict[int, config_def.Tip] = {}
 """ 提示对应描述 """
 config_sun_time: Dict[int, config_def.SunTime] = {}
 """ 太阳时间配置 """
+config_threshold_table: Dict[int, config_def.ThresholdTable] = {}
+""" 属性分段表配置 """
+config_threshold_table_data: Dict[str, Tuple[List[float], List[float], bool]] = {}
+"""
+按分段表名整理的属性分段表
+分段表名:([按升序排列的分段上界], [各分段的值], 上界是否属于本段)
+"""
 config_random_npc_sex_region: Dict[int, int] = {}
 """
 生成随机npc时性别权重
@@ -194,11 +205,41 @@ config_event_effect_target_data: Dict[int, Set] = {}
 """ 能达成效果的目标集合 """
 
 
+def load_config_bundle(language: str) -> dict:
+    """
+    载入指定语言已翻译的配置数据包，由buildbundle.py生成
+    Keyword arguments:
+    language -- 语言
+    Return arguments:
+    dict -- 配置数据包，不存在或源文件已变化时为空
+    """
+    bundle_path = os.path.join("data", "po", language, "config.json")
+    if not os.path.exists(bundle_path):
+        return {}
+    bundle_data = json_handle.load_json(bundle_path)
+    if not isinstance(bundle_data, dict) or "source" not in bundle_data:
+        return {}
+    for now_path, source_stat in bundle_data["source"].items():
+        if not os.path.exists(now_path):
+            return {}
+        now_stat = os.stat(now_path)
+        if [now_stat.st_mtime_ns, now_stat.st_size] != source_stat:
+            return {}
+    return bundle_data
+
+
 def load_data_json():
-    """载入data.json与character.json内配置数据"""
-    global config_data,character_data
+    """载入data.json与character.json内配置数据，有当前语言的翻译包时直接载入翻译包"""
+    global config_data,character_data,config_translated
+    bundle_data = load_config_bundle(normal_config.config_normal.language)
+    if bundle_data:
+        config_data = bundle_data["config"]
+        character_data = bundle_data["character"]
+        config_translated = True
+        return
     config_data = json_handle.load_json(data_path)
     character_data = json_handle.load_json(character_path)
+    config_translated = False
 
 
 def translate_data(data: dict):
@@ -285,6 +326,28 @@ def load_talent_up_data():
         config_talent_up_data[now_tem.talent_id][now_tem.cid] = now_tem
 
 
+def load_threshold_table():
+    """载入属性分段表"""
+    now_data = config_data["ThresholdTable"]
+    translate_data(now_data)
+    for tem_data in now_data["data"]:
+        now_tem = config_def.ThresholdTable()
+        now_tem.__dict__ = tem_data
+        config_threshold_table[now_tem.cid] = now_tem
+        config_threshold_table_data.setdefault(now_tem.table_name, ([], [], bool(now_tem.include_upper)))
+        upper_list, value_list, _ = config_threshold_table_data[now_tem.table_name]
+        # 最后一段没有上界
+        if "upper" in tem_data:
+            upper_list.append(now_tem.upper)
+        value_list.append(now_tem.value)
+    for table_name, (upper_list, value_list, _) in config_threshold_table_data.items():
+        if len(value_list) != len(upper_list) + 1 or upper_list != sorted(upper_list):
+            raise ValueError(f"属性分段表{table_name}的分段上界需按升序排列，且只有最后一段没有上界")
+        # 全为整数的值按整数返回，用于等级
+        if all(float(value).is_integer() for value in value_list):
+            value_list[:] = [int(value) for value in value_list]
+
+
 def load_instruct_judge_data():
     """每个指令的实行值判定数据"""
     now_data = config_data["InstructJudge"]
@@ -293,6 +356,7 @@ def load_instruct_judge_data():
         now_tem = config_def.InstructJudge()
         now_tem.__dict__ = tem_data
         config_instruct_judge_data[now_tem.cid] = now_tem
+        config_instruct_judge_name_data.setdefault(now_tem.instruct_name, now_tem)
 
 
 def load_experience():
@@ -871,6 +935,7 @@ def init():
     load_font_data()
     load_instruct_type()
     load_instruct_judge_data()
+    load_threshold_table()
     load_item()
     load_juel()
     load_moon()
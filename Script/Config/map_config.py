@@ -1,8 +1,13 @@
 import os
+import json
 import pickle
-from typing import Dict, List
-from dijkstar import Graph, find_path
+import hashlib
+import multiprocessing
+from typing import Dict, List, Set, Tuple
+from dijkstar import Graph
+from dijkstar.algorithm import single_source_shortest_paths, extract_shortest_path_from_predecessor_list
 from Script.Core import game_type, json_handle, get_text, text_handle, cache_control, constant, rich_text
+from Script.Config import normal_config
 from Script.Design import map_handle
 
 cache: game_type.Cache = cache_control.cache
@@ -17,15 +22,31 @@ all_place_data_path = os.path.join("data", "PlaceData")
 """ 预处理的所有地点数据路径 """
 all_map_data_path = os.path.join("data", "MapData")
 """ 预处理的所有地图数据路径 """
+map_cache_path = os.path.join("data", "MapCache")
+""" 各地图预处理结果的缓存路径 """
+map_manifest_path = os.path.join("data", "MapManifest")
+""" 预处理数据清单路径，记录生成预处理数据时的源文件摘要与游戏版本 """
+map_manifest_version: int = 2
+""" 预处理数据格式的版本号，预处理数据的结构改变后需递增 """
+map_cache_data: Dict[str, Tuple[game_type.MapDraw, Dict[str, Dict[str, game_type.TargetPath]]]] = {}
+"""
+各地图预处理结果的缓存
+地图源文件摘要:(地图绘制数据, 最短路径数据)
+"""
 
 
 def init_map_data():
-    """载入地图和场景数据"""
+    """载入地图和场景数据，预处理数据与清单一致时直接载入，只有部分源文件改变时增量更新，否则全部重新生成"""
+    manifest_data = load_map_manifest()
+    old_source_data = manifest_data.get("source", {})
+    source_data = get_map_source_data(old_source_data)
     if (
         os.path.exists(all_scene_data_path)
         and os.path.exists(all_map_data_path)
         and os.path.exists(all_place_data_path)
         and os.path.exists(scene_path_edge_path)
+        and manifest_data.get("manifest_version") == map_manifest_version
+        and manifest_data.get("game_version") == normal_config.config_normal.verson
     ):
         with open(all_scene_data_path, "rb") as all_scene_data_file:
             cache.scene_data = pickle.load(all_scene_data_file)
@@ -33,23 +54,152 @@ def init_map_data():
             cache.map_data = pickle.load(all_map_data_file)
         with open(all_place_data_path, "rb") as all_place_data_file:
             constant.place_data = pickle.load(all_place_data_file)
-        map_handle.scene_path_edge = json_handle.load_json(scene_path_edge_path)
+        change_set = {
+            now_path
+            for now_path in set(source_data) | set(old_source_data)
+            if now_path not in source_data
+            or now_path not in old_source_data
+            or source_data[now_path][2] != old_source_data[now_path][2]
+        }
+        if change_set:
+            load_map_cache()
+            patch_map_data(change_set)
+            save_map_cache()
+            save_map_data()
+            map_handle.init_scene_edge_path_data()
+        else:
+            map_handle.scene_path_edge = json_handle.load_json(scene_path_edge_path)
     else:
-        load_dir_now(map_data_path)
-        with open(all_map_data_path, "wb") as all_map_data_file:
-            pickle.dump(cache.map_data, all_map_data_file)
-        with open(all_scene_data_path, "wb") as all_scene_data_file:
-            pickle.dump(cache.scene_data, all_scene_data_file)
-        with open(all_place_data_path, "wb") as all_place_data_file:
-            pickle.dump(constant.place_data, all_place_data_file)
+        cache.scene_data = {}
+        cache.map_data = {}
+        constant.place_data = {}
+        load_map_cache()
+        map_job_list = []
+        load_dir_now(map_data_path, map_job_list)
+        handle_map_job_list(map_job_list)
+        # 全部重新生成时只保留现有地图的缓存
+        now_hash_set = {map_hash for _, map_hash, _ in map_job_list}
+        for map_hash in set(map_cache_data) - now_hash_set:
+            del map_cache_data[map_hash]
+        save_map_cache()
+        save_map_data()
         map_handle.init_scene_edge_path_data()
+    if source_data != old_source_data or manifest_data.get("game_version") != normal_config.config_normal.verson:
+        save_map_manifest(source_data)
+
+
+def save_map_data():
+    """写入预处理的场景、地图与地点数据"""
+    with open(all_map_data_path, "wb") as all_map_data_file:
+        pickle.dump(cache.map_data, all_map_data_file)
+    with open(all_scene_data_path, "wb") as all_scene_data_file:
+        pickle.dump(cache.scene_data, all_scene_data_file)
+    with open(all_place_data_path, "wb") as all_place_data_file:
+        pickle.dump(constant.place_data, all_place_data_file)
+
+
+def load_map_manifest() -> dict:
+    """
+    读取预处理数据清单，清单不存在或无法读取时返回空清单
+    Return arguments:
+    dict -- 清单数据
+    """
+    if not os.path.exists(map_manifest_path):
+        return {}
+    try:
+        with open(map_manifest_path, "r", encoding="utf-8") as manifest_file:
+            return json.load(manifest_file)
+    except Exception:
+        return {}
+
+
+def save_map_manifest(source_data: Dict[str, List]):
+    """
+    写入预处理数据清单
+    Keyword arguments:
+    source_data -- 源文件数据 源文件相对路径:[修改时间(ns), 文件大小, 摘要]
+    """
+    manifest_data = {
+        "manifest_version": map_manifest_version,
+        "game_version": normal_config.config_normal.verson,
+        "source": source_data,
+    }
+    with open(map_manifest_path, "w", encoding="utf-8") as manifest_file:
+        json.dump(manifest_data, manifest_file, ensure_ascii=False)
+
+
+def get_map_source_data(old_source_data: Dict[str, List]) -> Dict[str, List]:
+    """
+    获取所有地图源文件(Scene.json、Map.json与Map绘制文件)的状态，修改时间与大小和清单记录一致的文件直接沿用记录的摘要
+    Keyword arguments:
+    old_source_data -- 清单记录的源文件数据
+    Return arguments:
+    dict -- 源文件数据 源文件相对路径:[修改时间(ns), 文件大小, 摘要]
+    """
+    source_data = {}
+    for now_dir, _, file_list in os.walk(map_data_path):
+        for file_name in file_list:
+            if file_name not in {"Scene.json", "Map.json", "Map"}:
+                continue
+            now_path = os.path.join(now_dir, file_name)
+            now_key = os.path.relpath(now_path, map_data_path)
+            now_stat = os.stat(now_path)
+            old_data = old_source_data.get(now_key)
+            if old_data is not None and old_data[0] == now_stat.st_mtime_ns and old_data[1] == now_stat.st_size:
+                source_data[now_key] = old_data
+                continue
+            with open(now_path, "rb") as now_file:
+                now_hash = hashlib.sha1(now_file.read()).hexdigest()
+            source_data[now_key] = [now_stat.st_mtime_ns, now_stat.st_size, now_hash]
+    return source_data
 
 
-def load_dir_now(data_path: str):
+def patch_map_data(change_set: Set[str]):
     """
-    获取路径下的地图数据
+    按改变的源文件增量更新已载入的场景、地图与地点数据
+    Keyword arguments:
+    change_set -- 改变(包括新增与删除)的源文件相对路径集合
+    """
+    map_job_list = []
+    map_dir_set = set()
+    old_hash_set = set()
+    for now_key in sorted(change_set):
+        now_path = os.path.join(map_data_path, now_key)
+        now_dir, file_name = os.path.split(now_path)
+        if file_name == "Scene.json":
+            scene_path = get_map_system_path_str(get_map_system_path_for_path(now_path))
+            if scene_path in cache.scene_data:
+                for scene_tag in cache.scene_data[scene_path].scene_tag:
+                    if scene_path in constant.place_data.get(scene_tag, []):
+                        constant.place_data[scene_tag].remove(scene_path)
+                        if not constant.place_data[scene_tag]:
+                            del constant.place_data[scene_tag]
+                del cache.scene_data[scene_path]
+            if os.path.exists(now_path):
+                load_scene_file(now_path)
+        else:
+            map_dir_set.add(now_dir)
+    for now_dir in sorted(map_dir_set):
+        map_json_path = os.path.join(now_dir, "Map.json")
+        map_path = get_map_system_path_str(get_map_system_path_for_path(map_json_path))
+        old_map_data = cache.map_data.pop(map_path, None)
+        if old_map_data is not None:
+            old_hash_set.add(old_map_data.source_hash)
+        if os.path.exists(map_json_path) and os.path.exists(os.path.join(now_dir, "Map")):
+            load_map_file(map_json_path, map_job_list)
+    handle_map_job_list(map_job_list)
+    # 删除被替换或删除的地图的旧缓存，内容相同的其他地图仍在使用的除外
+    now_hash_set = {now_map_data.source_hash for now_map_data in cache.map_data.values()}
+    for map_hash in old_hash_set - now_hash_set:
+        map_cache_data.pop(map_hash, None)
+
+
+def load_dir_now(data_path: str, map_job_list: List[Tuple[game_type.Map, str, str]]):
+    """
+    获取路径下的地图数据，地图的绘制与寻路数据只登记到任务列表，之后统一处理
     Keyword arguments:
     data_path -- 地图路径
+    map_job_list -- 地图任务列表 (地图对象, 源文件摘要, 绘制原始数据)
     """
     for i in os.listdir(data_path):
         now_path = os.path.join(data_path, i)
@@ -58,43 +208,136 @@ def load_dir_now(data_path: str):
             if len(now_file) > 1:
                 if now_file[1] == "json":
                     if now_file[0] == "Scene":
-                        now_scene_data = game_type.Scene()
-                        now_scene_data.scene_path = get_map_system_path_str(
-                            get_map_system_path_for_path(now_path)
-                        )
-                        load_scene_data = json_handle.load_json(now_path)
-                        now_scene_data.scene_name = get_text._(load_scene_data["SceneName"])
-                        now_scene_data.in_door = load_scene_data["InOutDoor"] == "In"
-                        now_scene_data.exposed = int(load_scene_data["Exposed"])
-                        now_scene_data.have_furniture = int(load_scene_data["Have_Furniture"])
-                        now_scene_data.close_type = int(load_scene_data["Close_Type"])
-                        now_scene_data.close_flag = 0
-                        scene_tag_list = load_scene_data["SceneTag"]
-                        if "|" not in scene_tag_list:
-                            now_scene_data.scene_tag.append(scene_tag_list)
-                        else:
-                            scene_tag_list = scene_tag_list.split('|')
-                            for scene_tag in scene_tag_list:
-                                now_scene_data.scene_tag.append(scene_tag)
-                        cache.scene_data[now_scene_data.scene_path] = now_scene_data
-                        for scene_tag in now_scene_data.scene_tag:
-                            constant.place_data.setdefault(scene_tag, [])
-                            constant.place_data[scene_tag].append(now_scene_data.scene_path)
+                        load_scene_file(now_path)
                     elif now_file[0] == "Map":
-                        now_map_data = game_type.Map()
-                        now_map_data.map_path = get_map_system_path_str(
-                            get_map_system_path_for_path(now_path)
-                        )
-                        with open(os.path.join(data_path, "Map"), "r",encoding="utf-8") as now_read_file:
-                            draw_data = now_read_file.read()
-                            now_map_data.map_draw = get_print_map_data(draw_data)
-                        load_map_data = json_handle.load_json(now_path)
-                        now_map_data.map_name = get_text._(load_map_data["MapName"])
-                        now_map_data.path_edge = load_map_data["PathEdge"]
-                        now_map_data.sorted_path = get_sorted_map_path_data(now_map_data.path_edge)
-                        cache.map_data[now_map_data.map_path] = now_map_data
+                        load_map_file(now_path, map_job_list)
         else:
-            load_dir_now(now_path)
+            load_dir_now(now_path, map_job_list)
+
+
+def load_scene_file(now_path: str):
+    """
+    载入场景配置文件
+    Keyword arguments:
+    now_path -- Scene.json路径
+    """
+    now_scene_data = game_type.Scene()
+    now_scene_data.scene_path = get_map_system_path_str(
+        get_map_system_path_for_path(now_path)
+    )
+    load_scene_data = json_handle.load_json(now_path)
+    now_scene_data.scene_name = get_text._(load_scene_data["SceneName"])
+    now_scene_data.in_door = load_scene_data["InOutDoor"] == "In"
+    now_scene_data.exposed = int(load_scene_data["Exposed"])
+    now_scene_data.have_furniture = int(load_scene_data["Have_Furniture"])
+    now_scene_data.close_type = int(load_scene_data["Close_Type"])
+    now_scene_data.close_flag = 0
+    scene_tag_list = load_scene_data["SceneTag"]
+    if "|" not in scene_tag_list:
+        now_scene_data.scene_tag.append(scene_tag_list)
+    else:
+        scene_tag_list = scene_tag_list.split('|')
+        for scene_tag in scene_tag_list:
+            now_scene_data.scene_tag.append(scene_tag)
+    cache.scene_data[now_scene_data.scene_path] = now_scene_data
+    for scene_tag in now_scene_data.scene_tag:
+        constant.place_data.setdefault(scene_tag, [])
+        constant.place_data[scene_tag].append(now_scene_data.scene_path)
+
+
+def load_map_file(now_path: str, map_job_list: List[Tuple[game_type.Map, str, str]]):
+    """
+    载入地图配置文件，地图的绘制与寻路数据登记到任务列表
+    Keyword arguments:
+    now_path -- Map.json路径
+    map_job_list -- 地图任务列表 (地图对象, 源文件摘要, 绘制原始数据)
+    """
+    data_path = os.path.dirname(now_path)
+    now_map_data = game_type.Map()
+    now_map_data.map_path = get_map_system_path_str(
+        get_map_system_path_for_path(now_path)
+    )
+    with open(os.path.join(data_path, "Map"), "r",encoding="utf-8") as now_read_file:
+        draw_data = now_read_file.read()
+    load_map_data = json_handle.load_json(now_path)
+    now_map_data.map_name = get_text._(load_map_data["MapName"])
+    now_map_data.path_edge = load_map_data["PathEdge"]
+    map_hash = get_map_source_hash(now_path, os.path.join(data_path, "Map"))
+    now_map_data.source_hash = map_hash
+    map_job_list.append((now_map_data, map_hash, draw_data))
+    cache.map_data[now_map_data.map_path] = now_map_data
+
+
+def get_map_source_hash(map_json_path: str, map_draw_path: str) -> str:
+    """
+    计算地图源文件(Map.json与Map绘制文件)的摘要
+    Keyword arguments:
+    map_json_path -- Map.json路径
+    map_draw_path -- Map绘制文件路径
+    Return arguments:
+    str -- 摘要
+    """
+    now_hash = hashlib.sha1()
+    for now_path in (map_json_path, map_draw_path):
+        with open(now_path, "rb") as now_file:
+            now_hash.update(now_file.read())
+        now_hash.update(b"\0")
+    return now_hash.hexdigest()
+
+
+def load_map_cache():
+    """读取各地图预处理结果的缓存，缓存不存在或无法读取时视为空"""
+    global map_cache_data
+    map_cache_data = {}
+    if not os.path.exists(map_cache_path):
+        return
+    try:
+        with open(map_cache_path, "rb") as map_cache_file:
+            map_cache_data = pickle.load(map_cache_file)
+    except Exception:
+        map_cache_data = {}
+
+
+def save_map_cache():
+    """写入各地图预处理结果的缓存"""
+    with open(map_cache_path, "wb") as map_cache_file:
+        pickle.dump(map_cache_data, map_cache_file)
+
+
+def handle_map_job(map_job: Tuple[str, str, Dict[str, Dict[str, int]]]) -> Tuple[game_type.MapDraw, Dict[str, Dict[str, game_type.TargetPath]]]:
+    """
+    预处理一张地图的绘制与寻路数据
+    Keyword arguments:
+    map_job -- (源文件摘要, 绘制原始数据, 地图节点数据)
+    Return arguments:
+    game_type.MapDraw -- 地图绘制数据
+    dict -- 最短路径数据
+    """
+    _, draw_data, path_edge = map_job
+    return get_print_map_data(draw_data), get_sorted_map_path_data(path_edge)
+
+
+def handle_map_job_list(map_job_list: List[Tuple[game_type.Map, str, str]]):
+    """
+    处理登记的地图任务，源文件未改变的地图直接使用缓存，其余地图在支持fork时分到进程池中并行预处理
+    Keyword arguments:
+    map_job_list -- 地图任务列表 (地图对象, 源文件摘要, 绘制原始数据)
+    """
+    new_job_data = {}
+    for now_map_data, map_hash, draw_data in map_job_list:
+        if map_hash not in map_cache_data:
+            new_job_data[map_hash] = (map_hash, draw_data, now_map_data.path_edge)
+    new_job_list = list(new_job_data.values())
+    process_count = min(len(new_job_list), multiprocessing.cpu_count())
+    if process_count > 1 and "fork" in multiprocessing.get_all_start_methods():
+        with multiprocessing.get_context("fork").Pool(process_count) as pool:
+            result_list = pool.map(handle_map_job, new_job_list)
+    else:
+        result_list = [handle_map_job(map_job) for map_job in new_job_list]
+    for map_job, result in zip(new_job_list, result_list):
+        map_cache_data[map_job[0]] = result
+    for now_map_data, map_hash, _ in map_job_list:
+        now_map_data.map_draw, now_map_data.sorted_path = map_cache_data[map_hash]
 
 
 def get_map_system_path_for_path(now_path: str) -> List[str]:
@@ -238,9 +481,11 @@ def get_sorted_map_path_data(
     cost_func = lambda u, v, e, prev_e: e["cost"]
     for node in map_data.keys():
         new_data = {node: {}}
+        # 每个节点只做一次单源最短路径计算，再从前驱表中取出到各目标的路径
+        predecessors = single_source_shortest_paths(graph, node, cost_func=cost_func)
         for target in map_data.keys():
             if target != node:
-                find_path_data = find_path(graph, node, target, cost_func=cost_func)
+                find_path_data = extract_shortest_path_from_predecessor_list(predecessors, target)
                 target_path = game_type.TargetPath()
                 target_path.path = find_path_data.nodes[1:]
                 target_path.time = find_path_data.costs
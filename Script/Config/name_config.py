@@ -1,6 +1,6 @@
 import os
 from typing import Dict
-from Script.Core import json_handle, value_handle, cache_control, game_type, constant
+from Script.Core import json_handle, weight_sampler, cache_control, game_type, constant
 
 cache: game_type.Cache = cache_control.cache
 """ 游戏缓存数据 """
@@ -44,13 +44,10 @@ def init_name_region(name_data: Dict[str, int], man_judge: int):
     name_data -- 名字数据
     man_judge -- 类型校验(0:男,1:女,2:姓)
     """
-    region_list = value_handle.get_region_list(name_data)
+    name_sampler = weight_sampler.get_sampler_for_weight(name_data)
     if man_judge == 0:
-        constant.boys_region_list = region_list
-        constant.boys_region_int_list = list(map(int, region_list))
+        constant.boys_name_sampler = name_sampler
     elif man_judge == 1:
-        constant.girls_region_list = region_list
-        constant.girls_region_int_list = list(map(int, region_list))
+        constant.girls_name_sampler = name_sampler
     else:
-        constant.family_region_list = region_list
-        constant.family_region_int_list = list(map(int, region_list))
+        constant.family_name_sampler = name_sampler
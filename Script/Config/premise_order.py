@@ -0,0 +1,85 @@
+import os
+import json
+from typing import Dict, Iterable, List, Tuple
+from Script.Core import json_handle, constant
+from Script.Config import game_config
+
+premise_cost_path = os.path.join("data", "PremiseCost.json")
+""" 前提开销模型文件路径，由处理器调用统计生成 """
+premise_cost_data: Dict[str, List[float]] = {}
+"""
+各前提的实测开销
+前提id:[平均耗时(us), 通过率, 统计次数]
+"""
+default_cost: float = 5.0
+""" 没有实测数据的前提的默认平均耗时(us) """
+default_pass_rate: float = 0.5
+""" 没有实测数据的前提的默认通过率 """
+
+
+def load_premise_cost():
+    """载入前提开销模型"""
+    premise_cost_data.clear()
+    if os.path.exists(premise_cost_path):
+        premise_cost_data.update(json_handle.load_json(premise_cost_path))
+
+
+def get_premise_rank(premise: str) -> float:
+    """
+    计算前提的排序值，前提的连续判断中按该值升序判断，能以最低期望开销尽早否决
+    Keyword arguments:
+    premise -- 前提id
+    Return arguments:
+    float -- 平均耗时/否决率
+    """
+    cost, pass_rate = default_cost, default_pass_rate
+    if premise in premise_cost_data:
+        cost, pass_rate = premise_cost_data[premise][:2]
+    return cost / max(1 - pass_rate, 0.001)
+
+
+def sort_premise(premise_iter: Iterable[str]) -> Tuple[str, ...]:
+    """
+    将前提集合排序为元组，排序值相同时按前提id排序以保证顺序固定
+    Keyword arguments:
+    premise_iter -- 前提集合
+    Return arguments:
+    Tuple[str, ...] -- 排序后的前提元组
+    """
+    return tuple(sorted(premise_iter, key=lambda premise: (get_premise_rank(premise), premise)))
+
+
+def init_premise_order():
+    """载入前提开销模型，并将目标/口上/事件/指令的前提集合排序为元组，需在指令登记后调用"""
+    load_premise_cost()
+    for premise_data in (game_config.config_target_premise_data, game_config.config_talk_premise_data):
+        for cid in premise_data:
+            premise_data[cid] = sort_premise(premise_data[cid])
+    for event_data in game_config.config_event.values():
+        event_data.premise = {premise: event_data.premise[premise] for premise in sort_premise(event_data.premise)}
+    for instruct_id in constant.instruct_premise_data:
+        constant.instruct_premise_data[instruct_id] = sort_premise(constant.instruct_premise_data[instruct_id])
+
+
+def update_premise_cost(premise_profile_data: Dict[str, List]):
+    """
+    用本次的前提调用统计更新前提开销模型文件，与已有数据按统计次数加权合并
+    Keyword arguments:
+    premise_profile_data -- 前提调用统计 前提id:[处理器函数名, 调用次数, 总耗时(ns), 返回值:次数]
+    """
+    load_premise_cost()
+    for premise, now_data in premise_profile_data.items():
+        call_count = now_data[1]
+        if not call_count:
+            continue
+        now_cost = now_data[2] / call_count / 1000
+        now_pass_rate = 1 - now_data[3].get(0, 0) / call_count
+        if premise in premise_cost_data:
+            old_cost, old_pass_rate, old_count = premise_cost_data[premise]
+            all_count = old_count + call_count
+            now_cost = (old_cost * old_count + now_cost * call_count) / all_count
+            now_pass_rate = (old_pass_rate * old_count + now_pass_rate * call_count) / all_count
+            call_count = all_count
+        premise_cost_data[premise] = [round(now_cost, 3), round(now_pass_rate, 4), call_count]
+    with open(premise_cost_path, "w", encoding="utf-8") as cost_file:
+        json.dump(premise_cost_data, cost_file, ensure_ascii=False, indent=1, sort_keys=True)
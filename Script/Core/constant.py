@@ -1,5 +1,6 @@
 from typing import Dict, List, Set
 from types import FunctionType
+from Script.Core import lazy_registry, weight_sampler
 
 
 class CharacterStatus:
@@ -1642,20 +1643,14 @@ instruct_type_data: Dict[int, Set] = {}
 """ 指令类型拥有的指令集合 """
 instruct_premise_data: Dict[int, Set] = {}
 """ 指令显示的所需前提集合 """
-handle_state_machine_data: Dict[int, FunctionType] = {}
-""" 角色状态机函数 """
-family_region_list: Dict[int, str] = {}
-""" 姓氏区间数据 """
-boys_region_list: Dict[int, str] = {}
-""" 男孩名字区间数据 """
-girls_region_list: Dict[int, str] = {}
-""" 女孩名字区间数据 """
-family_region_int_list: List[int] = []
-""" 姓氏权重区间数据 """
-boys_region_int_list: List[int] = []
-""" 男孩名字权重区间数据 """
-girls_region_int_list: List[int] = []
-""" 女孩名字权重区间数据 """
+handle_state_machine_data: Dict[int, FunctionType] = lazy_registry.LazyRegistry("Script.StateMachine")
+""" 角色状态机函数，首次调用时才导入Script.StateMachine """
+family_name_sampler: weight_sampler.WeightSampler = None
+""" 姓氏抽样器 """
+boys_name_sampler: weight_sampler.WeightSampler = None
+""" 男孩名字抽样器 """
+girls_name_sampler: weight_sampler.WeightSampler = None
+""" 女孩名字抽样器 """
 panel_data: Dict[int, FunctionType] = {}
 """
 面板id对应的面板绘制函数集合
@@ -1665,10 +1660,10 @@ place_data: Dict[str, List[str]] = {}
 """ 按房间类型分类的场景列表 场景标签:场景路径列表 """
 cmd_map: Dict[int, FunctionType] = {}
 """ cmd存储 """
-settle_behavior_effect_data: Dict[int, FunctionType] = {}
-""" 角色行为结算处理器 处理器id:处理器 """
-settle_second_behavior_effect_data: Dict[int, FunctionType] = {}
-""" 角色二段行为结算处理器 处理器id:处理器 """
+settle_behavior_effect_data: Dict[int, FunctionType] = lazy_registry.LazyRegistry("Script.Settle")
+""" 角色行为结算处理器 处理器id:处理器，首次调用时才导入Script.Settle """
+settle_second_behavior_effect_data: Dict[int, FunctionType] = lazy_registry.LazyRegistry("Script.Settle")
+""" 角色二段行为结算处理器 处理器id:处理器，首次调用时才导入Script.Settle """
 
 instruct_en2cn = {"VIBRATOR_INSERTION" : "震动棒","VIBRATOR_INSERTION_ANAL" : "肛门震动棒","NORMAL_SEX" : "正常位","BACK_SEX" : "背后位","RIDING_SEX" : "骑乘位","FACE_SEAT_SEX" : "对面座位","BACK_SEAT_SEX" : "背面座位","FACE_STAND_SEX" : "对面立位","BACK_STAND_SEX" : "背面立位","NORMAL_ANAL_SEX" : "正常位肛交","BACK_ANAL_SEX" : "后背位肛交","RIDING_ANAL_SEX" : "骑乘位肛交","FACE_SEAT_ANAL_SEX" : "对面座位肛交","BACK_SEAT_ANAL_SEX" : "背面座位肛交","FACE_STAND_ANAL_SEX" : "对面立位肛交","BACK_STAND_ANAL_SEX" : "背面立位肛交"}
 
@@ -0,0 +1,101 @@
+import os
+import time
+import logging
+from functools import wraps
+from types import FunctionType
+from typing import Dict, List
+from Script.Config import premise_order
+
+enable_flag: bool = False
+""" 是否统计处理器的调用情况，需在处理器登记前开启 """
+profile_path = os.path.join("dispatch_profile.txt")
+""" 统计结果的输出路径 """
+profile_data: Dict[str, Dict] = {}
+"""
+各处理器的调用统计
+处理器类型:处理器id:[处理器函数名, 调用次数, 总耗时(ns), 返回值:次数]
+"""
+result_max: int = 16
+""" 单个处理器最多分别记录的返回值种类数，超出后记为"其他" """
+
+
+def start():
+    """开启处理器调用统计，之后登记的处理器都会被包装"""
+    global enable_flag
+    enable_flag = True
+
+
+def wrap(handle_type: str, handle_id, func: FunctionType) -> FunctionType:
+    """
+    为登记的处理器包装调用统计，未开启统计时原样返回
+    Keyword arguments:
+    handle_type -- 处理器类型(premise/settle/second_settle/state_machine)
+    handle_id -- 处理器id
+    func -- 处理器函数
+    Return arguments:
+    FunctionType -- 登记用的处理器函数
+    """
+    if not enable_flag:
+        return func
+    now_data = [func.__name__, 0, 0, {}]
+    profile_data.setdefault(handle_type, {})
+    profile_data[handle_type][handle_id] = now_data
+
+    @wraps(func)
+    def return_wrapper(*args, **kwargs):
+        begin_time = time.perf_counter_ns()
+        result = func(*args, **kwargs)
+        now_data[1] += 1
+        now_data[2] += time.perf_counter_ns() - begin_time
+        result_data = now_data[3]
+        result_key = result
+        if not isinstance(result_key, (int, float, str, type(None))):
+            result_key = type(result_key).__name__
+        if result_key not in result_data and len(result_data) >= result_max:
+            result_key = "其他"
+        result_data[result_key] = result_data.get(result_key, 0) + 1
+        return result
+
+    return return_wrapper
+
+
+def get_profile_text() -> List[str]:
+    """
+    生成处理器调用统计表，各类型内按总耗时降序
+    Return arguments:
+    List[str] -- 统计表文本行列表
+    """
+    text_list = []
+    for handle_type, type_data in profile_data.items():
+        call_count = sum(now_data[1] for now_data in type_data.values())
+        all_time = sum(now_data[2] for now_data in type_data.values())
+        never_count = sum(1 for now_data in type_data.values() if not now_data[1])
+        text_list.append(
+            f"[{handle_type}] 共{len(type_data)}个处理器，未被调用{never_count}个，调用{call_count}次，总耗时{all_time / 1e6:.2f}ms"
+        )
+        text_list.append(f"{'id':<40}{'函数名':<40}{'次数':>10}{'总耗时ms':>12}{'平均us':>10}{'返回0占比':>10}  返回值分布")
+        for handle_id, now_data in sorted(type_data.items(), key=lambda x: x[1][2], reverse=True):
+            if not now_data[1]:
+                continue
+            zero_rate = now_data[3].get(0, 0) / now_data[1]
+            result_text = " ".join(
+                f"{result}:{count}" for result, count in sorted(now_data[3].items(), key=lambda x: x[1], reverse=True)
+            )
+            text_list.append(
+                f"{str(handle_id):<40}{now_data[0]:<40}{now_data[1]:>10}{now_data[2] / 1e6:>12.2f}"
+                f"{now_data[2] / now_data[1] / 1000:>10.2f}{zero_rate:>10.1%}  {result_text}"
+            )
+        text_list.append("")
+    return text_list
+
+
+def save():
+    """将处理器调用统计写入统计文件，并据此更新前提开销模型，未开启统计时不做任何事"""
+    if not enable_flag:
+        return
+    text_list = get_profile_text()
+    with open(profile_path, "w", encoding="utf-8") as profile_file:
+        profile_file.write("\n".join(text_list) + "\n")
+    logging.info(f"处理器调用统计已写入{profile_path}")
+    if "premise" in profile_data:
+        premise_order.update_premise_cost(profile_data["premise"])
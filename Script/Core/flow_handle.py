@@ -8,6 +8,7 @@ from Script.Core import (
     game_type,
     cache_control,
     constant,
+    record_handle,
 )
 
 cache: game_type.Cache = cache_control.cache
@@ -218,11 +219,18 @@ def order_deal(flag="order", print_order=True, donot_return_null_str=True):
     global __skip_flag__
     __skip_flag__ = False
     while True:
-        time.sleep(0.01)
+        # 回放时不等待前端，输入队列取空后立即送入下一条记录
+        if record_handle.replay_flag:
+            if io_init._order_queue.empty():
+                io_init.put_order(record_handle.get_replay_order())
+        else:
+            time.sleep(0.01)
         if not donot_return_null_str and cache.wframe_mouse.w_frame_up:
+            record_handle.record("order", "")
             return ""
         while not io_init._order_queue.empty():
             order = io_init.get_order()
+            record_handle.record("order", order)
             if print_order and order != "":
                 io_init.era_print("\n" + order + "\n")
             if flag == "str":
@@ -251,6 +259,7 @@ def askfor_str(donot_return_null_str=True, print_order=False):
     while True:
         if not donot_return_null_str and cache.wframe_mouse.w_frame_up:
             cache.wframe_mouse.w_frame_up = 0
+            record_handle.record("order", "")
             return ""
         order = order_deal("str", print_order, donot_return_null_str)
         if donot_return_null_str and order != "":
@@ -1,7 +1,7 @@
 # -*- coding: UTF-8 -*-
 import os
 import traceback
-from Script.Core import flow_handle, io_init, key_listion_event
+from Script.Core import flow_handle, io_init, key_listion_event, trace_handle, dispatch_profile, record_handle
 from Script.Config import normal_config
 
 # 字符串定义###########################################################
@@ -50,6 +50,9 @@ def init(main_flow: object):
         run_main_flow()
     except Exception:
         traceback.print_exc(file=open(error_path, "a"))
+        trace_handle.save()
+        dispatch_profile.save()
+        record_handle.save()
         os._exit(0)
 
 
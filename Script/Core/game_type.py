@@ -1,6 +1,33 @@
 from uuid import UUID
-from typing import List, Dict, Set
+from typing import List, Dict, Set, Tuple
 import datetime
+import random
+
+
+class SlotsData:
+    """
+    使用__slots__的结构体基类，省去每个对象的__dict__
+    以__dict__形式保存的旧存档对象在载入时按当前属性重建，缺少的属性取__init__中的默认值，已废弃的属性直接丢弃
+    """
+
+    __slots__ = ()
+
+    def __getstate__(self) -> dict:
+        return {key: getattr(self, key) for key in self.__slots__ if hasattr(self, key)}
+
+    def __setstate__(self, state):
+        if isinstance(state, tuple):
+            # 默认的slots序列化格式为(__dict__状态, slots状态)
+            now_state = {}
+            for state_data in state:
+                if state_data:
+                    now_state.update(state_data)
+            state = now_state
+        if not all(key in state for key in self.__slots__):
+            self.__init__()
+        for key, value in state.items():
+            if key in self.__slots__:
+                setattr(self, key, value)
 
 
 class FlowContorl:
@@ -106,9 +133,13 @@ class NpcTem:
 #         """ 每日胸围差增量 """
 
 
-class Food:
+class Food(SlotsData):
     """食物数据结构体"""
 
+    __slots__ = (
+        "id", "name", "uid", "recipe", "drink",
+    )
+
     def __init__(self):
         self.id: str = ""
         """ 食物配置表id """
@@ -231,6 +262,28 @@ class NormalConfig:
     """ 字体大小 """
     order_font_size: int
     """ 输入框字体大小 """
+    import_time_report: int
+    """ 是否在日志中输出模块导入耗时统计 """
+    trace_mode: int
+    """ 是否记录耗时追踪，退出游戏时写入trace.json与trace_summary.txt """
+    dispatch_profile: int
+    """ 是否统计前提/结算器/状态机的调用情况，退出游戏时写入dispatch_profile.txt """
+    fast_forward_time: int
+    """ 睡觉或等待的时长达到该分钟数时进入快进模式，为0时不快进 """
+    fast_forward_block: int
+    """ 快进模式下玩家所在场景以外的角色单次行动的最短分钟数 """
+    decision_process: int
+    """ npc决策阶段并行使用的进程数，为0时不并行，非0时按固定的角色随机种子决策以便复现 """
+    rng_seed: int
+    """ 新游戏的随机种子，为0时随机生成，固定后同样的输入会得到同样的游戏过程 """
+    order_record: int
+    """ 是否记录本次游戏被流程取走的全部输入，退出游戏时写入order_record.json """
+    order_replay: str
+    """ 要回放的输入记录文件路径，非空时以无界面模式尽快回放，结束后输出order_replay.txt并退出，需与记录时有相同的存档 """
+    save_compress: int
+    """ 存档的压缩方式，0不压缩，1为zlib，2为lzma """
+    save_compress_level: int
+    """ 存档的压缩等级，zlib为0~9，lzma为0~9 """
 
 
 # class Clothing:
@@ -491,9 +544,15 @@ class PLAYER_ABILITY:
 #         """ 预期的最终身高 """
 
 
-class Behavior:
+class Behavior(SlotsData):
     """角色行为状态数据"""
 
+    __slots__ = (
+        "start_time", "duration", "behavior_id", "move_target", "move_src", "eat_food",
+        "food_name", "food_quality", "make_food_time", "pan_name", "socks_name", "book_id",
+        "book_name",
+    )
+
     def __init__(self):
         self.start_time: datetime.datetime = None
         """ 行为开始时间 """
@@ -523,9 +582,13 @@ class Behavior:
         """ 前提结算用:书籍名字 """
 
 
-class Chara_Event:
+class Chara_Event(SlotsData):
     """角色事件状态数据"""
 
+    __slots__ = (
+        "event_id", "son_event_id",
+    )
+
     def __init__(self):
         self.event_id: str = ""
         """ 角色当前事件id """
@@ -553,6 +616,8 @@ class Map:
         地图下场景间寻路路径
         当前节点:目标节点:路径对象
         """
+        self.source_hash: str = ""
+        """ 地图源文件摘要，对应预处理结果缓存的键 """
 
 
 class MapDraw:
@@ -595,9 +660,14 @@ class TargetPath:
         """ 移动所需时间列表 """
 
 
-class Scene:
+class Scene(SlotsData):
     """场景数据"""
 
+    __slots__ = (
+        "scene_path", "scene_name", "in_door", "exposed", "have_furniture", "close_type",
+        "close_flag", "scene_tag", "character_list",
+    )
+
     def __init__(self):
         self.scene_path: str = ""
         """ 场景路径 """
@@ -678,8 +748,14 @@ class Base_resouce:
         """ 图书馆管理员干员id合集 """
         self.book_borrow_dict: Dict[int, int] = {}
         """ 书籍借出情况 书籍id:借出人id(-1为未借出) """
+        self.book_free_data: Dict[int, List[int]] = {}
+        """ 未借出的书籍 书籍类型:按id排序的书籍id列表 """
+        self.book_borrow_time: Dict[int, datetime.datetime] = {}
+        """ 已借出书籍的借出时间 书籍id:借出时间 """
         self.reader_now: int = 0
         """ 当前图书馆中的读者数量 """
+        self.work_people_state: Dict[int, Tuple[int, bool, bool]] = {}
+        """ 各干员当前计入部门人员统计的状态 干员id:(职位id, 是否在工作场所, 是否在图书馆) """
         self.recommend_book_type_set: Set = set()
         """ 推荐的阅读类别 """
 
@@ -731,9 +807,23 @@ class Base_resouce:
 '''
 
 
-class Character:
+class Character(SlotsData):
     """角色数据结构体"""
 
+    __slots__ = (
+        "cid", "name", "nick_name", "sex", "hit_point_max", "hit_point", "mana_point_max",
+        "mana_point", "eja_point_max", "eja_point", "angry_point", "sleep_point", "urinate_point",
+        "hunger_point", "state", "item", "cloth", "behavior", "second_behavior", "event",
+        "position", "officeroom", "dormitory", "birthday", "status_data", "hit_point_tem",
+        "mana_point_tem", "social_contact", "social_contact_data", "favorability", "trust",
+        "food_bag", "target_character_id", "adv", "no_wear", "dead", "collection_character",
+        "last_hunger_time", "ability", "experience", "juel", "profession", "race", "talent",
+        "wait_flag", "is_h", "is_follow", "token_text", "tired", "angry_with_player",
+        "first_record", "dirty", "h_state", "assistant_character_id", "assistant_state",
+        "pl_ability", "pl_collection", "action_info", "move_stop", "work", "entertainment",
+        "pregnancy",
+    )
+
     def __init__(self):
         self.cid: int = 0
         """ 角色id """
@@ -948,12 +1038,21 @@ class Cache:
         # """ 可穿戴道具类型数据 """
         self.over_behavior_character: Set = set()
         """ 本次update中已结束结算的npc """
+        self.rng_seed: int = 0
+        """ 本局游戏的随机种子 """
+        self.rng_stream_data: Dict[str, random.Random] = {}
+        """
+        各子系统的随机流
+        流名:随机数生成器
+        """
+        self.rng_global_state: tuple = None
+        """ 存档时全局随机数生成器的状态 """
         self.recipe_data: Dict[int, Recipes] = {}
         """ 菜谱数据 """
-        self.restaurant_data: Dict[str, Dict[UUID, Food]] = {}
+        self.restaurant_data: Dict[str, int] = {}
         """
         食堂内贩卖的食物数据
-        食物名字:食物唯一id:食物对象
+        菜谱id:份数
         """
         self.makefood_data: Dict[str, Dict[UUID, Food]] = {}
         """
@@ -982,9 +1081,14 @@ class Cache:
         """ 基地的资源情况 """
 
 
-class TargetChange:
+class TargetChange(SlotsData):
     """交互对象角色变化结构体"""
 
+    __slots__ = (
+        "hit_point", "mana_point", "eja_point", "status_data", "favorability", "trust",
+        "target_change", "ability", "experience",
+    )
+
     def __init__(self):
         self.hit_point: int = 0
         """ hp变化 """
@@ -1006,9 +1110,14 @@ class TargetChange:
         """ 经验变化 """
 
 
-class CharacterStatusChange:
+class CharacterStatusChange(SlotsData):
     """角色属性状态变更结构体"""
 
+    __slots__ = (
+        "hit_point", "mana_point", "eja_point", "status_data", "favorability", "trust", "language",
+        "knowledge", "target_change", "sex_experience", "ability", "experience",
+    )
+
     def __init__(self):
         self.hit_point: int = 0
         """ hp变化 """
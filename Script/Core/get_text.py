@@ -2,6 +2,7 @@
 import gettext
 import os
 from types import FunctionType
+from typing import Set
 from Script.Config import normal_config
 
 po_data = os.path.join("data", "po")
@@ -11,8 +12,21 @@ translation: gettext.GNUTranslations = gettext.translation(
     "erArk", po_data, [normal_config.config_normal.language, "zh_CN"]
 )
 """ 翻译对象类型 """
-translation_values = set(translation._catalog.values())
-""" 翻译后的文本数据 """
+translation_values: Set[str] = set()
+""" 翻译后的文本数据，首次判断时生成 """
 
 _: FunctionType = translation.gettext
 """ 翻译api """
+
+
+def is_translation_text(text: str) -> bool:
+    """
+    判断文本是否为翻译文本的原文或译文
+    Keyword arguments:
+    text -- 文本
+    Return arguments:
+    bool -- 是否为翻译文本
+    """
+    if not translation_values:
+        translation_values.update(translation._catalog.values())
+    return text in translation_values or text in translation._catalog
@@ -0,0 +1,116 @@
+import sys
+import time
+import logging
+from typing import Dict, List, Tuple
+
+enable_flag: bool = False
+""" 是否已开启导入耗时统计 """
+import_time_data: Dict[str, Tuple[float, float]] = {}
+"""
+尚未输出的模块导入耗时
+模块名:(自身耗时, 含子模块的累计耗时)
+"""
+import_stack: List[List] = []
+""" 正在导入的模块栈 [模块名, 开始时间, 子模块累计耗时] """
+
+
+class ProfileLoader:
+    """记录模块执行耗时的加载器代理，其余接口全部转交给原加载器"""
+
+    def __init__(self, loader):
+        """
+        包装原加载器
+        Keyword arguments:
+        loader -- 原加载器
+        """
+        self.loader = loader
+        """ 原加载器 """
+
+    def __getattr__(self, name: str):
+        return getattr(self.loader, name)
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        now_import = [module.__name__, time.perf_counter(), 0.0]
+        import_stack.append(now_import)
+        try:
+            self.loader.exec_module(module)
+        finally:
+            import_stack.pop()
+            total_time = time.perf_counter() - now_import[1]
+            import_time_data[now_import[0]] = (total_time - now_import[2], total_time)
+            if len(import_stack):
+                import_stack[-1][2] += total_time
+
+
+class ProfileFinder:
+    """挂在sys.meta_path最前面的查找器，给找到的模块套上计时加载器"""
+
+    def find_spec(self, fullname: str, path=None, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = ProfileLoader(spec.loader)
+            return spec
+        return None
+
+
+def start():
+    """开启导入耗时统计，之后导入的模块都会被记录"""
+    global enable_flag
+    if enable_flag:
+        return
+    enable_flag = True
+    sys.meta_path.insert(0, ProfileFinder())
+
+
+def get_subsystem(module_name: str) -> str:
+    """
+    获取模块所属的子系统，Script.UI下再按Panel/Flow/Moudle细分，其余按顶层包归类
+    Keyword arguments:
+    module_name -- 模块名
+    Return arguments:
+    str -- 子系统名
+    """
+    name_list = module_name.split(".")
+    if name_list[0] != "Script":
+        return name_list[0]
+    if len(name_list) > 2 and name_list[1] == "UI":
+        return ".".join(name_list[:3])
+    return ".".join(name_list[:2])
+
+
+def report(title: str, top_count: int = 10):
+    """
+    按子系统汇总输出上次输出以来的导入耗时，并列出自身耗时最高的模块
+    Keyword arguments:
+    title -- 本次统计的标题
+    top_count -- 列出的子系统与模块数量
+    """
+    if not enable_flag or not len(import_time_data):
+        return
+    subsystem_data: Dict[str, List] = {}
+    for module_name, time_data in import_time_data.items():
+        subsystem = get_subsystem(module_name)
+        subsystem_data.setdefault(subsystem, [0, 0.0])
+        subsystem_data[subsystem][0] += 1
+        subsystem_data[subsystem][1] += time_data[0]
+    all_time = sum(now_data[1] for now_data in subsystem_data.values())
+    logging.info(f"导入耗时统计[{title}]：共{len(import_time_data)}个模块，自身耗时合计{all_time * 1000:.1f}ms")
+    subsystem_list = sorted(subsystem_data.items(), key=lambda x: x[1][1], reverse=True)
+    for subsystem, now_data in subsystem_list[:top_count]:
+        logging.info(f"    {subsystem:<24}{now_data[0]:>5}个模块{now_data[1] * 1000:>10.1f}ms")
+    if len(subsystem_list) > top_count:
+        other_count = sum(now_data[0] for _, now_data in subsystem_list[top_count:])
+        other_time = sum(now_data[1] for _, now_data in subsystem_list[top_count:])
+        logging.info(f"    {'其余' + str(len(subsystem_list) - top_count) + '个子系统':<24}{other_count:>5}个模块{other_time * 1000:>10.1f}ms")
+    logging.info("    自身耗时最高的模块：")
+    for module_name, time_data in sorted(import_time_data.items(), key=lambda x: x[1][0], reverse=True)[:top_count]:
+        logging.info(f"    {module_name:<48}自身{time_data[0] * 1000:>8.1f}ms 累计{time_data[1] * 1000:>8.1f}ms")
+    import_time_data.clear()
@@ -1,5 +1,5 @@
 from tkinter import Event
-from Script.Core import main_frame, py_cmd, game_type, cache_control
+from Script.Core import main_frame, py_cmd, game_type, cache_control, record_handle
 
 wframe = main_frame.root
 
@@ -42,6 +42,7 @@ def mouse_right_check(event: Event):
     cache.wframe_mouse.mouse_right = 1
     cache.text_wait = 0
     cache.wframe_mouse.w_frame_skip_wait_mouse = 1
+    record_handle.record("skip", "")
     if not cache.wframe_mouse.w_frame_up:
         set_wframe_up()
     else:
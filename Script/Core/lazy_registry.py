@@ -0,0 +1,49 @@
+import time
+import logging
+import importlib
+from Script.Core import import_profile
+
+
+class LazyRegistry(dict):
+    """
+    按需加载的处理器注册表
+    实现模块只在第一次查询注册表时才导入，导入时模块内的装饰器会把处理器登记进来
+    """
+
+    def __init__(self, module_name: str):
+        """
+        创建注册表
+        Keyword arguments:
+        module_name -- 实现注册表内处理器的模块名
+        """
+        super().__init__()
+        self.module_name: str = module_name
+        """ 实现模块名 """
+        self.load_flag: bool = False
+        """ 实现模块是否已经导入 """
+
+    def load(self):
+        """导入实现模块，重复调用不会重复导入"""
+        if self.load_flag:
+            return
+        self.load_flag = True
+        start_time = time.perf_counter()
+        importlib.import_module(self.module_name)
+        logging.debug(f"按需加载{self.module_name}，耗时{(time.perf_counter() - start_time) * 1000:.1f}ms")
+        import_profile.report(self.module_name)
+
+    def __missing__(self, key):
+        if self.load_flag:
+            raise KeyError(key)
+        self.load()
+        return self[key]
+
+    def __contains__(self, key) -> bool:
+        if not self.load_flag and not dict.__contains__(self, key):
+            self.load()
+        return dict.__contains__(self, key)
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
@@ -22,6 +22,9 @@ from Script.Core import (
     text_handle,
     game_type,
     cache_control,
+    trace_handle,
+    dispatch_profile,
+    record_handle,
 )
 from Script.Config import normal_config, game_config
 
@@ -33,6 +36,9 @@ def close_window():
     """
     关闭游戏，会终止当前进程和所有子进程
     """
+    trace_handle.save()
+    dispatch_profile.save()
+    record_handle.save()
     parent = psutil.Process(os.getpid())
     children = parent.children(recursive=True)
     for process in children:
@@ -0,0 +1,118 @@
+import sys
+import logging
+from types import FunctionType, ModuleType
+from typing import Dict, List, Tuple
+from Script.Core import cache_control, game_type
+
+cache: game_type.Cache = cache_control.cache
+""" 游戏缓存数据 """
+skip_type_tuple = (type, ModuleType, FunctionType)
+""" 统计时不展开的对象类型 """
+
+
+def get_slots_value_list(now_object) -> List:
+    """
+    获取使用__slots__的对象的全部属性值
+    Keyword arguments:
+    now_object -- 对象
+    Return arguments:
+    List -- 属性值列表
+    """
+    value_list = []
+    for now_type in type(now_object).__mro__:
+        for key in now_type.__dict__.get("__slots__", ()):
+            if hasattr(now_object, key):
+                value_list.append(getattr(now_object, key))
+    return value_list
+
+
+def get_deep_size(now_object, seen_set: set, type_data: Dict[str, List[int]]) -> int:
+    """
+    统计对象及其引用的全部对象的内存占用，已统计过的对象不重复计算
+    Keyword arguments:
+    now_object -- 要统计的对象
+    seen_set -- 已统计过的对象id集合
+    type_data -- 按类型记录的统计结果 类型名:[对象数, 字节数]
+    Return arguments:
+    int -- 字节数
+    """
+    all_size = 0
+    object_list = [now_object]
+    while len(object_list):
+        now_object = object_list.pop()
+        if id(now_object) in seen_set or isinstance(now_object, skip_type_tuple):
+            continue
+        seen_set.add(id(now_object))
+        now_size = sys.getsizeof(now_object)
+        type_name = type(now_object).__name__
+        type_data.setdefault(type_name, [0, 0])
+        type_data[type_name][0] += 1
+        type_data[type_name][1] += now_size
+        all_size += now_size
+        if isinstance(now_object, dict):
+            object_list.extend(now_object.keys())
+            object_list.extend(now_object.values())
+        elif isinstance(now_object, (list, tuple, set, frozenset)):
+            object_list.extend(now_object)
+        elif isinstance(now_object, (str, bytes, int, float)):
+            continue
+        else:
+            if hasattr(now_object, "__dict__"):
+                object_list.append(now_object.__dict__)
+            if hasattr(type(now_object), "__slots__"):
+                object_list.extend(get_slots_value_list(now_object))
+    return all_size
+
+
+def get_memory_report(now_cache: game_type.Cache) -> Tuple[Dict[str, int], Dict[str, List[int]], int]:
+    """
+    统计游戏缓存的内存占用
+    Keyword arguments:
+    now_cache -- 游戏缓存数据
+    Return arguments:
+    Dict[str, int] -- 按缓存字段统计的字节数 字段名:字节数
+    Dict[str, List[int]] -- 按类型统计的结果 类型名:[对象数, 字节数]
+    int -- 总字节数
+    """
+    seen_set = {id(now_cache), id(now_cache.__dict__)}
+    type_data: Dict[str, List[int]] = {}
+    field_data: Dict[str, int] = {}
+    for key, value in now_cache.__dict__.items():
+        field_data[key] = get_deep_size(value, seen_set, type_data)
+    all_size = sys.getsizeof(now_cache) + sys.getsizeof(now_cache.__dict__) + sum(field_data.values())
+    return field_data, type_data, all_size
+
+
+def get_report_text(now_cache: game_type.Cache = None, top_count: int = 15) -> List[str]:
+    """
+    生成内存占用统计文本
+    Keyword arguments:
+    now_cache -- 游戏缓存数据，为空时统计当前游戏缓存
+    top_count -- 列出的字段与类型数量
+    Return arguments:
+    List[str] -- 统计文本行列表
+    """
+    if now_cache is None:
+        now_cache = cache
+    field_data, type_data, all_size = get_memory_report(now_cache)
+    text_list = [f"缓存内存占用合计{all_size / 1024:.1f}KB"]
+    character_count = len(getattr(now_cache, "character_data", {}))
+    if character_count:
+        text_list.append(f"    角色数据{field_data['character_data'] / 1024:.1f}KB，平均每名角色{field_data['character_data'] / character_count / 1024:.1f}KB")
+    text_list.append("    按缓存字段：")
+    for key, now_size in sorted(field_data.items(), key=lambda x: x[1], reverse=True)[:top_count]:
+        text_list.append(f"    {key:<32}{now_size / 1024:>10.1f}KB")
+    text_list.append("    按对象类型：")
+    for type_name, now_data in sorted(type_data.items(), key=lambda x: x[1][1], reverse=True)[:top_count]:
+        text_list.append(f"    {type_name:<32}{now_data[0]:>8}个{now_data[1] / 1024:>10.1f}KB 平均{now_data[1] / now_data[0]:>6.0f}B")
+    return text_list
+
+
+def report(now_cache: game_type.Cache = None):
+    """
+    在日志中输出内存占用统计
+    Keyword arguments:
+    now_cache -- 游戏缓存数据，为空时统计当前游戏缓存
+    """
+    for text in get_report_text(now_cache):
+        logging.info(text)
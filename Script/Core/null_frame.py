@@ -0,0 +1,104 @@
+# -*- coding: UTF-8 -*-
+import queue
+import threading
+from Script.Config import normal_config
+
+
+def null_func(*args, **kwargs):
+    """忽略调用"""
+
+
+class NullWidget:
+    """代替tk控件，忽略所有操作"""
+
+    def __getattr__(self, name: str):
+        return null_func
+
+
+class NullOrder:
+    """代替命令框的输入变量"""
+
+    def __init__(self):
+        self.value: str = ""
+        """ 命令框中的内容 """
+
+    def get(self) -> str:
+        return self.value
+
+    def set(self, value):
+        self.value = str(value)
+
+
+# 与窗体相同的字号计算，样式初始化时会用到
+now_font_size = int(normal_config.config_normal.window_width / normal_config.config_normal.text_width) * 2
+normal_config.config_normal.font_size = now_font_size
+normal_config.config_normal.order_font_size = now_font_size - 2
+root = NullWidget()
+""" 代替窗体 """
+inputbox = NullWidget()
+""" 代替命令输入框 """
+order = NullOrder()
+""" 命令框中的内容 """
+input_event_func = None
+""" 输入处理函数 """
+main_queue: queue.Queue = None
+""" 流程推送给前端的信息队列 """
+message_count: int = 0
+""" 已丢弃的信息条数 """
+message_size: int = 0
+""" 已丢弃的信息字符数 """
+message_lock = threading.Lock()
+""" 统计信息数量的锁 """
+
+
+def bind_return(func):
+    """
+    绑定输入处理函数
+    Keyword arguments:
+    func -- 输入处理函数
+    """
+    global input_event_func
+    input_event_func = func
+
+
+def bind_queue(q: queue.Queue):
+    """
+    绑定信息队列
+    Keyword arguments:
+    q -- 消息队列
+    """
+    global main_queue
+    main_queue = q
+
+
+def send_input(*args):
+    """发送命令框中的内容"""
+    input_event_func(order.get())
+    order.set("")
+
+
+def discard(message: str):
+    """
+    丢弃一条信息，只统计数量
+    Keyword arguments:
+    message -- 信息
+    """
+    global message_count, message_size
+    with message_lock:
+        message_count += 1
+        message_size += len(message)
+
+
+def drain():
+    """立即取走并丢弃队列中剩余的信息，用于在统计前清空队列"""
+    while 1:
+        try:
+            discard(main_queue.get_nowait())
+        except queue.Empty:
+            return
+
+
+def run():
+    """代替前端主循环，持续取走并丢弃流程推送的信息"""
+    while 1:
+        discard(main_queue.get())
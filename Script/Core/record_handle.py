@@ -0,0 +1,166 @@
+import os
+import json
+import time
+import logging
+from typing import Dict, List
+from Script.Core import cache_control, game_type, trace_handle, dispatch_profile, null_frame, rng_handle
+
+cache: game_type.Cache = cache_control.cache
+""" 游戏缓存数据 """
+record_flag: bool = False
+""" 是否正在记录输入 """
+replay_flag: bool = False
+""" 是否正在回放输入 """
+record_path = os.path.join("order_record.json")
+""" 输入记录的保存路径 """
+report_path = os.path.join("order_replay.txt")
+""" 回放报告的输出路径 """
+record_list: List[list] = []
+"""
+输入记录
+[距开始的毫秒数, 类型, 内容, 当时的面板id]
+类型为order(被流程取走的输入)/skip(右键跳过等待)/seed(新游戏的随机种子)
+"""
+replay_index: int = 0
+""" 下一条要回放的记录的位置 """
+start_time: int = 0
+""" 开始记录或回放的时间(ns) """
+order_time: int = 0
+""" 回放时当前输入送入流程的时间(ns) """
+order_panel: str = ""
+""" 回放时当前输入所在的面板id """
+latency_data: Dict[str, List[int]] = {}
+"""
+回放时各面板处理输入的耗时
+面板id:[输入数, 总耗时(ns), 最大耗时(ns)]
+"""
+diverge_list: List[int] = []
+""" 回放时面板与记录不一致的记录位置 """
+
+
+def start_record():
+    """开始记录输入，清空之前的记录"""
+    global record_flag, start_time
+    record_list.clear()
+    start_time = time.perf_counter_ns()
+    record_flag = True
+
+
+def record(record_type: str, data):
+    """
+    记录一条输入，未开启记录时不做任何事
+    Keyword arguments:
+    record_type -- 记录类型(order/skip/seed)
+    data -- 记录内容
+    """
+    if not record_flag:
+        return
+    now_time = (time.perf_counter_ns() - start_time) // 1000000
+    record_list.append([now_time, record_type, data, cache.now_panel_id])
+
+
+def save():
+    """将输入记录写入记录文件，未开启记录时不做任何事"""
+    if not record_flag:
+        return
+    with open(record_path, "w", encoding="utf-8") as record_file:
+        json.dump(record_list, record_file, ensure_ascii=False, separators=(",", ":"))
+    logging.info(f"输入记录已写入{record_path}，共{len(record_list)}条")
+
+
+def start_replay(replay_path: str):
+    """
+    开始回放输入记录，回放时流程不再等待前端，输入取完后输出报告并退出游戏
+    Keyword arguments:
+    replay_path -- 输入记录文件路径
+    """
+    global replay_flag, start_time
+    with open(replay_path, "r", encoding="utf-8") as record_file:
+        record_list[:] = json.load(record_file)
+    start_time = time.perf_counter_ns()
+    replay_flag = True
+
+
+def handle_seed(seed: int) -> int:
+    """
+    处理新游戏的随机种子，记录时记下种子，回放时换为记录中的种子
+    Keyword arguments:
+    seed -- 本次生成的随机种子
+    Return arguments:
+    int -- 实际使用的随机种子
+    """
+    global replay_index
+    if replay_flag:
+        if replay_index < len(record_list) and record_list[replay_index][1] == "seed":
+            seed = record_list[replay_index][2]
+            replay_index += 1
+        return seed
+    record("seed", seed)
+    return seed
+
+
+def get_replay_order() -> str:
+    """
+    流程请求输入时取出下一条要回放的输入，并结算上一条输入的处理耗时
+    Return arguments:
+    str -- 输入内容
+    """
+    global replay_index, order_time, order_panel
+    now_time = time.perf_counter_ns()
+    if order_time:
+        now_data = latency_data.setdefault(order_panel, [0, 0, 0])
+        now_data[0] += 1
+        now_data[1] += now_time - order_time
+        now_data[2] = max(now_data[2], now_time - order_time)
+    while replay_index < len(record_list):
+        _, record_type, data, panel_id = record_list[replay_index]
+        replay_index += 1
+        if record_type == "skip":
+            cache.wframe_mouse.mouse_right = 1
+            cache.wframe_mouse.w_frame_skip_wait_mouse = 1
+            continue
+        if record_type != "order":
+            continue
+        if panel_id != cache.now_panel_id:
+            diverge_list.append(replay_index - 1)
+        order_panel = str(cache.now_panel_id)
+        order_time = time.perf_counter_ns()
+        return data
+    finish_replay()
+
+
+def get_report_text() -> List[str]:
+    """
+    生成回放报告，各面板按总耗时降序
+    Return arguments:
+    List[str] -- 报告文本行列表
+    """
+    all_time = time.perf_counter_ns() - start_time
+    null_frame.drain()
+    order_count = sum(now_data[0] for now_data in latency_data.values())
+    text_list = [
+        f"回放{len(record_list)}条记录，处理{order_count}条输入，总耗时{all_time / 1e9:.2f}s，"
+        f"每秒{order_count / max(all_time / 1e9, 1e-9):.1f}条",
+        f"前端输出{null_frame.message_count}条，共{null_frame.message_size}字符",
+        f"随机数状态摘要：{rng_handle.get_rng_digest()}",
+    ]
+    if diverge_list:
+        text_list.append(f"有{len(diverge_list)}条输入所在面板与记录不一致，首次出现在第{diverge_list[0]}条，回放已偏离记录")
+    text_list.append(f"{'面板id':<10}{'输入数':>8}{'总耗时ms':>12}{'平均ms':>10}{'最大ms':>10}")
+    for panel_id, now_data in sorted(latency_data.items(), key=lambda x: x[1][1], reverse=True):
+        text_list.append(
+            f"{panel_id:<10}{now_data[0]:>8}{now_data[1] / 1e6:>12.2f}{now_data[1] / now_data[0] / 1e6:>10.3f}{now_data[2] / 1e6:>10.3f}"
+        )
+    return text_list
+
+
+def finish_replay():
+    """输入取完后写入回放报告与其他统计，并退出游戏"""
+    text_list = get_report_text()
+    with open(report_path, "w", encoding="utf-8") as report_file:
+        report_file.write("\n".join(text_list) + "\n")
+    for text in text_list:
+        logging.info(text)
+    trace_handle.save()
+    dispatch_profile.save()
+    os._exit(0)
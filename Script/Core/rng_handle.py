@@ -0,0 +1,65 @@
+import random
+import hashlib
+import pickle
+from Script.Core import cache_control, game_type, record_handle
+from Script.Config import normal_config
+
+cache: game_type.Cache = cache_control.cache
+""" 游戏缓存数据 """
+
+
+def init_rng(seed: int = 0):
+    """
+    为新游戏初始化随机种子，清空已有的随机流，并以种子重置全局随机数生成器
+    Keyword arguments:
+    seed -- 随机种子，为0时使用配置中的种子，配置也为0时随机生成
+    """
+    if not seed:
+        seed = normal_config.config_normal.rng_seed
+    if not seed:
+        seed = random.SystemRandom().getrandbits(63)
+    seed = record_handle.handle_seed(seed)
+    cache.rng_seed = seed
+    cache.rng_stream_data = {}
+    cache.rng_global_state = None
+    random.seed(f"{seed}-global")
+
+
+def get_random(name: str, character_id: int = -1) -> random.Random:
+    """
+    获取指定子系统的随机流，随机流由存档的随机种子与流名确定，并随存档保存
+    Keyword arguments:
+    name -- 子系统名
+    character_id -- 角色id，为-1时获取子系统共用的随机流，否则获取该角色独立的随机流
+    Return arguments:
+    random.Random -- 随机数生成器
+    """
+    stream_key = name if character_id < 0 else f"{name}-{character_id}"
+    if stream_key not in cache.rng_stream_data:
+        cache.rng_stream_data[stream_key] = random.Random(f"{cache.rng_seed}-{stream_key}")
+    return cache.rng_stream_data[stream_key]
+
+
+def save_global_state():
+    """将全局随机数生成器的状态记入缓存，需在写入存档前调用"""
+    cache.rng_global_state = random.getstate()
+
+
+def load_global_state():
+    """载入存档后恢复全局随机数生成器的状态，没有随机种子的旧存档重新生成种子"""
+    if not getattr(cache, "rng_seed", 0):
+        init_rng()
+        return
+    if cache.rng_global_state is not None:
+        random.setstate(cache.rng_global_state)
+
+
+def get_rng_digest() -> str:
+    """
+    计算全局随机数生成器与所有随机流当前状态的摘要，状态相同即之后的随机结果相同，用于校验回放与基准是否一致
+    Return arguments:
+    str -- 摘要
+    """
+    stream_state_list = [(stream_key, cache.rng_stream_data[stream_key].getstate()) for stream_key in sorted(cache.rng_stream_data)]
+    state_data = (cache.rng_seed, random.getstate(), stream_state_list)
+    return hashlib.sha1(pickle.dumps(state_data)).hexdigest()
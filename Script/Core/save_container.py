@@ -0,0 +1,321 @@
+import io
+import os
+import lzma
+import zlib
+import pickle
+import struct
+from typing import BinaryIO, Dict, Iterator, Tuple
+
+save_magic = b"ERAKSAVE"
+""" 存档容器文件头标识 """
+save_format_version: int = 1
+""" 存档容器格式版本号 """
+chunk_size: int = 1 << 20
+""" 写入时每个数据块压缩前的最大字节数 """
+compress_none: int = 0
+""" 不压缩 """
+compress_zlib: int = 1
+""" zlib压缩 """
+compress_lzma: int = 2
+""" lzma压缩 """
+head_struct = struct.Struct("<8sBB")
+""" 文件头 标识, 格式版本号, 压缩方式 """
+chunk_struct = struct.Struct("<I")
+""" 数据块头 压缩后的字节数，为0时表示分段结束 """
+section_end_struct = struct.Struct("<QI")
+""" 分段尾 压缩前的总字节数, 压缩前数据的crc32 """
+
+
+class SaveContainerError(Exception):
+    """存档容器格式错误或校验失败"""
+
+
+def get_compressor(compress_type: int, compress_level: int):
+    """
+    获取压缩器
+    Keyword arguments:
+    compress_type -- 压缩方式
+    compress_level -- 压缩等级
+    Return arguments:
+    object -- 压缩器，不压缩时为None
+    """
+    if compress_type == compress_zlib:
+        return zlib.compressobj(compress_level)
+    if compress_type == compress_lzma:
+        return lzma.LZMACompressor(preset=compress_level)
+    return None
+
+
+def get_decompressor(compress_type: int):
+    """
+    获取解压器
+    Keyword arguments:
+    compress_type -- 压缩方式
+    Return arguments:
+    object -- 解压器，不压缩时为None
+    """
+    if compress_type == compress_zlib:
+        return zlib.decompressobj()
+    if compress_type == compress_lzma:
+        return lzma.LZMADecompressor()
+    if compress_type == compress_none:
+        return None
+    raise SaveContainerError(f"未知的压缩方式{compress_type}")
+
+
+class SectionWriter(io.RawIOBase):
+    """
+    将写入的数据按块压缩并写入存档文件的一个分段，只在内存中保留一个数据块
+    Keyword arguments:
+    save_file -- 存档文件
+    compress_type -- 压缩方式
+    compress_level -- 压缩等级
+    """
+
+    def __init__(self, save_file: BinaryIO, compress_type: int, compress_level: int):
+        """初始化写入对象"""
+        self.save_file: BinaryIO = save_file
+        """ 存档文件 """
+        self.compressor = get_compressor(compress_type, compress_level)
+        """ 压缩器 """
+        self.buffer = bytearray()
+        """ 未写出的数据 """
+        self.data_size: int = 0
+        """ 压缩前的总字节数 """
+        self.crc: int = 0
+        """ 压缩前数据的crc32 """
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        """
+        写入数据
+        Keyword arguments:
+        data -- 数据
+        Return arguments:
+        int -- 写入的字节数
+        """
+        data = memoryview(data).cast("B")
+        self.data_size += len(data)
+        self.crc = zlib.crc32(data, self.crc)
+        self.buffer += data
+        if len(self.buffer) >= chunk_size:
+            self.write_chunk(bytes(self.buffer))
+            self.buffer.clear()
+        return len(data)
+
+    def write_chunk(self, data: bytes):
+        """
+        压缩并写出一个数据块
+        Keyword arguments:
+        data -- 压缩前的数据
+        """
+        if self.compressor is not None:
+            data = self.compressor.compress(data)
+        if data:
+            self.save_file.write(chunk_struct.pack(len(data)))
+            self.save_file.write(data)
+
+    def finish(self):
+        """写出剩余数据与分段尾"""
+        self.write_chunk(bytes(self.buffer))
+        self.buffer.clear()
+        if self.compressor is not None:
+            data = self.compressor.flush()
+            if data:
+                self.save_file.write(chunk_struct.pack(len(data)))
+                self.save_file.write(data)
+        self.save_file.write(chunk_struct.pack(0))
+        self.save_file.write(section_end_struct.pack(self.data_size, self.crc))
+
+
+class SectionReader(io.RawIOBase):
+    """
+    从存档文件的一个分段中按块读取并解压数据，读完后校验长度与crc32
+    Keyword arguments:
+    save_file -- 存档文件
+    compress_type -- 压缩方式
+    """
+
+    def __init__(self, save_file: BinaryIO, compress_type: int):
+        """初始化读取对象"""
+        self.save_file: BinaryIO = save_file
+        """ 存档文件 """
+        self.decompressor = get_decompressor(compress_type)
+        """ 解压器 """
+        self.buffer = bytearray()
+        """ 已解压未读取的数据 """
+        self.data_size: int = 0
+        """ 已解压的总字节数 """
+        self.crc: int = 0
+        """ 已解压数据的crc32 """
+        self.end: bool = False
+        """ 是否已读到分段尾 """
+
+    def readable(self) -> bool:
+        return True
+
+    def read_exact(self, size: int) -> bytes:
+        """
+        从存档文件读取指定字节数
+        Keyword arguments:
+        size -- 字节数
+        Return arguments:
+        bytes -- 数据
+        """
+        data = self.save_file.read(size)
+        if len(data) != size:
+            raise SaveContainerError("存档文件不完整")
+        return data
+
+    def fill(self):
+        """读取并解压下一个数据块，读到分段尾时校验"""
+        (now_size,) = chunk_struct.unpack(self.read_exact(chunk_struct.size))
+        if not now_size:
+            if self.decompressor is not None and not self.decompressor.eof:
+                raise SaveContainerError("存档数据不完整")
+            data_size, crc = section_end_struct.unpack(self.read_exact(section_end_struct.size))
+            if data_size != self.data_size or crc != self.crc:
+                raise SaveContainerError("存档数据校验失败")
+            self.end = True
+            return
+        data = self.read_exact(now_size)
+        if self.decompressor is not None:
+            try:
+                data = self.decompressor.decompress(data)
+            except (zlib.error, lzma.LZMAError) as error:
+                raise SaveContainerError("存档数据无法解压") from error
+        self.data_size += len(data)
+        self.crc = zlib.crc32(data, self.crc)
+        self.buffer += data
+
+    def readinto(self, target) -> int:
+        """
+        读取数据到指定缓冲区
+        Keyword arguments:
+        target -- 缓冲区
+        Return arguments:
+        int -- 读取的字节数，为0时表示分段已读完
+        """
+        while not self.buffer and not self.end:
+            self.fill()
+        now_size = min(len(target), len(self.buffer))
+        target[:now_size] = self.buffer[:now_size]
+        del self.buffer[:now_size]
+        return now_size
+
+    def finish(self):
+        """读完分段剩余数据，确保已校验"""
+        while not self.end:
+            self.buffer.clear()
+            self.fill()
+
+
+def is_save_container(file_path: str) -> bool:
+    """
+    判断文件是否为存档容器，旧版存档为直接pickle的数据
+    Keyword arguments:
+    file_path -- 文件路径
+    Return arguments:
+    bool -- 是否为存档容器
+    """
+    with open(file_path, "rb") as save_file:
+        return save_file.read(len(save_magic)) == save_magic
+
+
+def get_file_crc(file_path: str) -> int:
+    """
+    计算文件内容的crc32，用于校验存档文件是否完整且与存档头对应
+    Keyword arguments:
+    file_path -- 文件路径
+    Return arguments:
+    int -- crc32
+    """
+    crc = 0
+    with open(file_path, "rb") as now_file:
+        while 1:
+            data = now_file.read(chunk_size)
+            if not data:
+                return crc
+            crc = zlib.crc32(data, crc)
+
+
+def read_container_head(save_file: BinaryIO) -> int:
+    """
+    读取并校验存档容器的文件头
+    Keyword arguments:
+    save_file -- 存档文件
+    Return arguments:
+    int -- 压缩方式
+    """
+    head_data = save_file.read(head_struct.size)
+    if len(head_data) != head_struct.size:
+        raise SaveContainerError("存档文件不完整")
+    magic, format_version, compress_type = head_struct.unpack(head_data)
+    if magic != save_magic:
+        raise SaveContainerError("不是存档容器文件")
+    if format_version > save_format_version:
+        raise SaveContainerError(f"存档格式版本{format_version}高于当前支持的版本")
+    get_decompressor(compress_type)
+    return compress_type
+
+
+def write_container(file_path: str, section_data: Dict[str, object], compress_type: int, compress_level: int):
+    """
+    将数据按分段写入存档容器，先写入临时文件，写完后替换原文件，写入中途出错不会损坏原文件
+    Keyword arguments:
+    file_path -- 文件路径
+    section_data -- 分段数据 分段名:数据
+    compress_type -- 压缩方式
+    compress_level -- 压缩等级
+    """
+    temp_path = file_path + ".tmp"
+    with open(temp_path, "wb") as save_file:
+        save_file.write(head_struct.pack(save_magic, save_format_version, compress_type))
+        for section_name, data in section_data.items():
+            name_data = section_name.encode("utf-8")
+            save_file.write(bytes([len(name_data)]) + name_data)
+            section_writer = SectionWriter(save_file, compress_type, compress_level)
+            pickle.Pickler(section_writer, protocol=5).dump(data)
+            section_writer.finish()
+        save_file.flush()
+        os.fsync(save_file.fileno())
+    os.replace(temp_path, file_path)
+
+
+def iter_container(file_path: str) -> Iterator[Tuple[str, object]]:
+    """
+    按写入顺序逐个读取存档容器中的分段，边读取边解压与校验，前面的分段可以在后面的分段读出前使用
+    Keyword arguments:
+    file_path -- 文件路径
+    Return arguments:
+    Iterator[Tuple[str, object]] -- (分段名, 数据)
+    """
+    with open(file_path, "rb") as save_file:
+        compress_type = read_container_head(save_file)
+        while 1:
+            name_size = save_file.read(1)
+            if not name_size:
+                break
+            section_name = save_file.read(name_size[0]).decode("utf-8")
+            section_reader = SectionReader(save_file, compress_type)
+            try:
+                data = pickle.Unpickler(io.BufferedReader(section_reader, chunk_size)).load()
+            except SaveContainerError:
+                raise
+            except Exception as error:
+                raise SaveContainerError("存档数据无法读取") from error
+            section_reader.finish()
+            yield section_name, data
+
+
+def read_container(file_path: str) -> Dict[str, object]:
+    """
+    读取存档容器中的全部分段
+    Keyword arguments:
+    file_path -- 文件路径
+    Return arguments:
+    dict -- 分段数据 分段名:数据
+    """
+    return dict(iter_container(file_path))
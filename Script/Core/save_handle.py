@@ -11,6 +11,9 @@ from Script.Core import (
     game_path_config,
     game_type,
     get_text,
+    trace_handle,
+    rng_handle,
+    save_container,
 )
 from Script.Config import normal_config
 
@@ -19,6 +22,10 @@ cache: game_type.Cache = cache_control.cache
 """ 游戏缓存数据 """
 _: FunctionType = get_text._
 """ 翻译api """
+save_section_list = ["scene_data", "character_data"]
+""" 在存档中单独分段的缓存字段，按顺序写在world分段之后，其余字段都写入world分段 """
+static_cache_key_set = {"map_data"}
+""" 不写入存档的缓存字段，这些字段在启动时由地图配置生成且游戏中不会改变，读档时沿用当前数据 """
 
 
 def get_save_dir_path(save_id: str) -> str:
@@ -39,6 +46,7 @@ def judge_save_file_exist(save_id: str) -> bool:
     Keyword arguments:
     save_id -- 存档id
     """
+    recover_save_dir(save_id)
     save_head_path = os.path.join(get_save_dir_path(save_id), "0")
     if not os.path.exists(save_head_path):
         return 0
@@ -48,6 +56,7 @@ def judge_save_file_exist(save_id: str) -> bool:
     return 1
 
 
+@trace_handle.trace()
 def establish_save(save_id: str):
     """
     将游戏数据存入指定id的存档内
@@ -65,18 +74,76 @@ def establish_save_linux(save_id: str):
     Keyword argumentsL
     save_id -- 当前存档id
     """
+    rng_handle.save_global_state()
+    player_data: game_type.Character = cache.character_data[0]
+    scene_path_str = os.sep.join(player_data.position)
+    scene_name = cache.scene_data[scene_path_str].scene_name if scene_path_str in cache.scene_data else ""
     save_verson = {
         "game_verson": normal_config.config_normal.verson,
         "game_time": cache.game_time,
-        "character_name": cache.character_data[0].name,
+        "character_name": player_data.name,
         "save_time": datetime.datetime.now(),
+        "npc_count": len(cache.npc_id_got - {0}),
+        "scene_name": scene_name,
+        "facility_level": sum(cache.base_resouce.facility_level.values()),
+        "money": cache.base_resouce.money,
     }
-    data = {
-        "1": cache,
-        "0": save_verson,
+    # 先在临时存档位写好存档数据与存档头，再整体替换存档位，存档头记录存档数据的大小与crc32
+    temp_id = save_id + ".tmp"
+    remove_save(temp_id)
+    write_save_data(temp_id, "1", get_cache_section_data())
+    body_path = os.path.join(get_save_dir_path(temp_id), "1")
+    save_verson["body_size"] = os.path.getsize(body_path)
+    save_verson["body_crc"] = save_container.get_file_crc(body_path)
+    write_save_data(temp_id, "0", {"data": save_verson})
+    replace_save_dir(temp_id, save_id)
+
+
+def replace_save_dir(temp_id: str, save_id: str):
+    """
+    用临时存档位整体替换存档位，原存档位先改名为.old，替换中途中断时由recover_save_dir恢复
+    Keyword arguments:
+    temp_id -- 临时存档id
+    save_id -- 存档id
+    """
+    save_path = get_save_dir_path(save_id)
+    old_path = save_path + ".old"
+    if os.path.isdir(old_path):
+        shutil.rmtree(old_path)
+    if os.path.isdir(save_path):
+        os.replace(save_path, old_path)
+    os.replace(get_save_dir_path(temp_id), save_path)
+    if os.path.isdir(old_path):
+        shutil.rmtree(old_path)
+
+
+def recover_save_dir(save_id: str):
+    """
+    替换存档位中途中断，存档位已被改名而新存档未就位时，恢复原存档位
+    Keyword arguments:
+    save_id -- 存档id
+    """
+    save_path = get_save_dir_path(save_id)
+    old_path = save_path + ".old"
+    if not os.path.isdir(save_path) and os.path.isdir(old_path):
+        os.replace(old_path, save_path)
+
+
+def get_cache_section_data() -> dict:
+    """
+    将当前游戏缓存拆分为存档分段
+    Return arguments:
+    dict -- 分段数据 分段名:数据
+    """
+    world_data = {
+        key: value
+        for key, value in cache.__dict__.items()
+        if key not in static_cache_key_set and key not in save_section_list
     }
-    for data_id in data:
-        write_save_data(save_id, data_id, data[data_id])
+    cache_section_data = {"world": world_data}
+    for key in save_section_list:
+        cache_section_data[key] = cache.__dict__[key]
+    return cache_section_data
 
 
 def load_save_info_head(save_id: str) -> dict:
@@ -85,49 +152,119 @@ def load_save_info_head(save_id: str) -> dict:
     Keyword arguments:
     save_id -- 存档id
     """
-    save_path = get_save_dir_path(save_id)
-    file_path = os.path.join(save_path, "0")
-    with open(file_path, "rb") as f:
-        return pickle.load(f)
+    return read_save_data(save_id, "0")
+
+
+def check_save_body(save_id: str, save_head: dict):
+    """
+    校验存档数据文件，与存档头记录的大小与crc32不一致时抛出SaveContainerError，旧存档头没有记录时只校验文件头
+    Keyword arguments:
+    save_id -- 存档id
+    save_head -- 存档头部信息
+    """
+    body_path = os.path.join(get_save_dir_path(save_id), "1")
+    if "body_crc" in save_head:
+        if (
+            os.path.getsize(body_path) != save_head["body_size"]
+            or save_container.get_file_crc(body_path) != save_head["body_crc"]
+        ):
+            raise save_container.SaveContainerError("存档数据与存档头不一致")
+    elif save_container.is_save_container(body_path):
+        with open(body_path, "rb") as body_file:
+            save_container.read_container_head(body_file)
 
 
-def write_save_data(save_id: str, data_id: str, write_data: dict):
+def write_save_data(save_id: str, data_id: str, section_data: dict):
     """
-    将存档数据写入文件
+    将存档数据按分段写入文件
     Keyword arguments:
     save_id -- 存档id
     data_id -- 要写入的数据在存档下的文件id
-    write_data -- 要写入的数据
+    section_data -- 要写入的分段数据 分段名:数据
     """
     save_path = get_save_dir_path(save_id)
     file_path = os.path.join(save_path, data_id)
     if not os.path.exists(save_path):
         os.makedirs(save_path)
-    with open(file_path, "wb+") as f:
-        pickle.dump(write_data, f)
+    save_container.write_container(
+        file_path,
+        section_data,
+        normal_config.config_normal.save_compress,
+        normal_config.config_normal.save_compress_level,
+    )
 
 
-def load_save(save_id: str) -> dict:
+def iter_save_data(save_id: str, data_id: str):
     """
-    按存档id读取存档数据
+    逐个读取存档文件中的分段，直接pickle的旧版存档视为只有一个data分段
     Keyword arguments:
     save_id -- 存档id
+    data_id -- 要读取的数据在存档下的文件id
     Return arguments:
-    game_type.Cache -- 游戏缓存数据
+    Iterator[Tuple[str, object]] -- (分段名, 数据)
     """
-    save_path = get_save_dir_path(save_id)
-    file_path = os.path.join(save_path, "1")
+    file_path = os.path.join(get_save_dir_path(save_id), data_id)
+    if save_container.is_save_container(file_path):
+        yield from save_container.iter_container(file_path)
+        return
     with open(file_path, "rb") as f:
-        return pickle.load(f)
+        try:
+            data = pickle.load(f)
+        except Exception as error:
+            raise save_container.SaveContainerError("存档数据无法读取") from error
+    yield "data", data
+
+
+def read_save_data(save_id: str, data_id: str):
+    """
+    从文件读取只有一个data分段的存档数据
+    Keyword arguments:
+    save_id -- 存档id
+    data_id -- 要读取的数据在存档下的文件id
+    Return arguments:
+    object -- 存档数据
+    """
+    return dict(iter_save_data(save_id, data_id))["data"]
+
+
+@trace_handle.trace()
+def load_save(save_id: str) -> dict:
+    """
+    按存档id读取存档数据，分段存档先读入world分段，再依次读入单独分段的字段，不写入存档的字段沿用当前数据
+    Keyword arguments:
+    save_id -- 存档id
+    Return arguments:
+    dict -- 游戏缓存数据
+    """
+    cache_data = {}
+    for section_name, data in iter_save_data(save_id, "1"):
+        if section_name == "data":
+            # 整个缓存直接存为一个分段的旧版存档
+            return data.__dict__
+        if section_name == "world":
+            cache_data.update(data)
+            for key in static_cache_key_set:
+                cache_data[key] = cache.__dict__[key]
+        else:
+            cache_data[section_name] = data
+    return cache_data
 
 
 def input_load_save(save_id: str):
     """
-    载入存档存档id对应数据，覆盖当前游戏内存
+    载入存档存档id对应数据，覆盖当前游戏内存，存档损坏时抛出SaveContainerError且不改动当前游戏内存
     Keyword arguments:
     save_id -- 存档id
     """
-    cache.__dict__ = load_save(save_id).__dict__
+    cache.__dict__ = load_save(save_id)
+    # 旧存档的食堂食物为逐份的食物对象，转换为份数
+    for food_id, food_data in list(cache.restaurant_data.items()):
+        if isinstance(food_data, dict):
+            if len(food_data):
+                cache.restaurant_data[food_id] = len(food_data)
+            else:
+                del cache.restaurant_data[food_id]
+    rng_handle.load_global_state()
 
 
 def remove_save(save_id: str):
@@ -137,5 +274,6 @@ def remove_save(save_id: str):
     save_id -- 存档id
     """
     save_path = get_save_dir_path(save_id)
-    if os.path.isdir(save_path):
-        shutil.rmtree(save_path)
+    for now_path in (save_path, save_path + ".old"):
+        if os.path.isdir(now_path):
+            shutil.rmtree(now_path)
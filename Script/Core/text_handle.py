@@ -1,3 +1,4 @@
+from functools import lru_cache
 from wcwidth import wcswidth
 from Script.Config import game_config, normal_config
 
@@ -39,9 +40,10 @@ def align(text: str, just="left", only_fix=False, columns=1, text_width=None) ->
             return " " * int(width_i - count_i) + text + " " * int(width_i - count_i)
 
 
+@lru_cache(maxsize=8192)
 def get_text_index(text: str) -> int:
     """
-    计算文本最终显示的真实长度
+    计算文本最终显示的真实长度，界面文本大量重复，结果按文本缓存
     Keyword arguments:
     text -- 要进行长度计算的文本
     """
@@ -0,0 +1,149 @@
+import os
+import json
+import time
+import logging
+import threading
+from functools import wraps
+from types import FunctionType
+from typing import Dict, List
+
+enable_flag: bool = False
+""" 是否正在记录耗时追踪 """
+trace_path = os.path.join("trace.json")
+""" Chrome trace格式的追踪文件路径，可直接拖入chrome://tracing或Perfetto查看 """
+summary_path = os.path.join("trace_summary.txt")
+""" 各追踪段汇总表的路径 """
+event_max: int = 200000
+""" 追踪文件最多记录的事件数，超出后只计入汇总表 """
+event_list: List[dict] = []
+""" 已记录的追踪事件 """
+span_data: Dict[str, List] = {}
+"""
+各追踪段的汇总数据
+追踪段名:[调用次数, 总耗时(ns), 最大耗时(ns)]
+"""
+drop_count: int = 0
+""" 因超出上限未写入追踪文件的事件数 """
+start_time: int = 0
+""" 开始记录的时间(ns) """
+
+
+def start():
+    """开始记录耗时追踪，清空之前的记录"""
+    global enable_flag, drop_count, start_time
+    event_list.clear()
+    span_data.clear()
+    drop_count = 0
+    start_time = time.perf_counter_ns()
+    enable_flag = True
+
+
+def begin() -> int:
+    """
+    开始一段手动追踪，与end配对使用
+    Return arguments:
+    int -- 开始时间(ns)，未开启追踪时为0
+    """
+    if not enable_flag:
+        return 0
+    return time.perf_counter_ns()
+
+
+def end(name: str, begin_time: int):
+    """
+    结束一段手动追踪
+    Keyword arguments:
+    name -- 追踪段名
+    begin_time -- begin返回的开始时间
+    """
+    if not enable_flag or not begin_time:
+        return
+    add_span(name, begin_time, time.perf_counter_ns())
+
+
+def add_span(name: str, begin_time: int, end_time: int):
+    """
+    记录一段追踪
+    Keyword arguments:
+    name -- 追踪段名
+    begin_time -- 开始时间(ns)
+    end_time -- 结束时间(ns)
+    """
+    global drop_count
+    duration = end_time - begin_time
+    if name not in span_data:
+        span_data[name] = [0, 0, 0]
+    now_data = span_data[name]
+    now_data[0] += 1
+    now_data[1] += duration
+    if duration > now_data[2]:
+        now_data[2] = duration
+    if len(event_list) >= event_max:
+        drop_count += 1
+        return
+    event_list.append(
+        {
+            "name": name,
+            "ph": "X",
+            "ts": (begin_time - start_time) / 1000,
+            "dur": duration / 1000,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+    )
+
+
+def trace(name: str = "") -> FunctionType:
+    """
+    追踪函数耗时的装饰器，未开启追踪时只多一次标记判断
+    Keyword arguments:
+    name -- 追踪段名，默认为函数的限定名
+    Return arguments:
+    FunctionType -- 装饰器
+    """
+
+    def decorator(func: FunctionType):
+        span_name = name or func.__qualname__
+
+        @wraps(func)
+        def return_wrapper(*args, **kwargs):
+            if not enable_flag:
+                return func(*args, **kwargs)
+            begin_time = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                add_span(span_name, begin_time, time.perf_counter_ns())
+
+        return return_wrapper
+
+    return decorator
+
+
+def get_summary_text() -> List[str]:
+    """
+    生成各追踪段的汇总表，按总耗时降序
+    Return arguments:
+    List[str] -- 汇总表文本行列表
+    """
+    text_list = [f"{'追踪段':<48}{'次数':>8}{'总耗时ms':>12}{'平均ms':>10}{'最大ms':>10}"]
+    for name, now_data in sorted(span_data.items(), key=lambda x: x[1][1], reverse=True):
+        text_list.append(
+            f"{name:<48}{now_data[0]:>8}{now_data[1] / 1e6:>12.2f}{now_data[1] / now_data[0] / 1e6:>10.3f}{now_data[2] / 1e6:>10.3f}"
+        )
+    if drop_count:
+        text_list.append(f"追踪文件已满，另有{drop_count}个事件只计入了汇总")
+    return text_list
+
+
+def save():
+    """将追踪记录写入追踪文件与汇总表，未开启追踪时不做任何事"""
+    if not enable_flag:
+        return
+    with open(trace_path, "w", encoding="utf-8") as trace_file:
+        json.dump({"traceEvents": event_list, "displayTimeUnit": "ms"}, trace_file)
+    summary_text_list = get_summary_text()
+    with open(summary_path, "w", encoding="utf-8") as summary_file:
+        summary_file.write("\n".join(summary_text_list) + "\n")
+    for text in summary_text_list:
+        logging.info(text)
@@ -0,0 +1,75 @@
+import math
+import bisect
+import random
+import itertools
+from typing import Dict, Iterable, List
+
+
+class WeightSampler:
+    """
+    按权重随机抽取元素的抽样器，创建时计算累计权重，抽取时二分查找
+    固定的权重分布创建一次后反复抽取，临时的权重分布每次直接创建
+    Keyword arguments:
+    value_list -- 元素列表
+    weight_list -- 各元素的权重，小数向上取整
+    """
+
+    def __init__(self, value_list: Iterable[any], weight_list: Iterable[float]):
+        """初始化抽样器"""
+        self.value_list: List[any] = list(value_list)
+        """ 元素列表 """
+        self.region_list: List[int] = list(itertools.accumulate(math.ceil(weight) for weight in weight_list))
+        """ 各元素的累计权重，即各元素权重区间的上界 """
+        self.weight_max: int = self.region_list[-1] if self.region_list else 0
+        """ 权重总和 """
+
+    def get_value(self, now_weight: int) -> any:
+        """
+        获取权重区间包含指定权重值的元素
+        Keyword arguments:
+        now_weight -- 权重值
+        Return arguments:
+        any -- 第一个累计权重不小于权重值的元素，累计权重相同时取最后一个
+        """
+        now_index = bisect.bisect_left(self.region_list, now_weight)
+        now_index = bisect.bisect_right(self.region_list, self.region_list[now_index]) - 1
+        return self.value_list[now_index]
+
+    def sample(self, now_random: random.Random = random) -> any:
+        """
+        按权重随机抽取一个元素，随机数在[0, 权重总和)内取，与之前各处按权重取值的结果一致
+        Keyword arguments:
+        now_random -- 使用的随机流，默认为全局随机数生成器
+        Return arguments:
+        any -- 抽到的元素
+        """
+        # 与randint(0, weight_max - 1)取到的随机数相同
+        return self.get_value(now_random.randrange(self.weight_max))
+
+
+def get_sampler_for_weight(data: Dict[any, float]) -> WeightSampler:
+    """
+    按dict中每个value的值对key升序排列，生成以value为权重抽取key的抽样器
+    Keyword arguments:
+    data -- 元素:权重
+    Return arguments:
+    WeightSampler -- 抽样器
+    """
+    sort_data = sorted(data.items(), key=lambda x: x[1])
+    return WeightSampler([x[0] for x in sort_data], [x[1] for x in sort_data])
+
+
+def choice_weight(weight_list: Iterable[float], now_random: random.Random = random) -> float:
+    """
+    以列表中每个元素的值作为权重随机获取一个元素
+    Keyword arguments:
+    weight_list -- 权重列表
+    now_random -- 使用的随机流，默认为全局随机数生成器
+    Return arguments:
+    float -- 获得的元素
+    """
+    weight_list = list(weight_list)
+    region_list = list(itertools.accumulate(map(math.ceil, weight_list)))
+    now_index = bisect.bisect_left(region_list, now_random.randrange(region_list[-1]))
+    now_index = bisect.bisect_right(region_list, region_list[now_index]) - 1
+    return weight_list[now_index]
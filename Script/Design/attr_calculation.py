@@ -1,5 +1,7 @@
+import bisect
 import random
 import datetime
+from typing import Dict
 from Script.Core import (
     cache_control,
     value_handle,
@@ -10,17 +12,51 @@ from Script.Config import game_config
 
 cache: game_type.Cache = cache_control.cache
 """ 游戏内缓存数据 """
+zero_prototype_data: Dict[str, Dict] = {}
+"""
+按配置表预先生成的归零原型，只读，使用时浅拷贝
+原型名:原型数据
+"""
+zero_prototype_builder_data = {
+    "ability": lambda: dict.fromkeys(game_config.config_ability, 0),
+    "status": lambda: dict.fromkeys(game_config.config_character_state, 0),
+    "talent": lambda: dict.fromkeys(game_config.config_talent, 0),
+    "experience": lambda: dict.fromkeys(game_config.config_experience, 0),
+    "juel": lambda: dict.fromkeys(game_config.config_juel, 0),
+    "item": lambda: dict.fromkeys(game_config.config_item, 0),
+    "second_behavior": lambda: dict.fromkeys(range(1000, 1200), 0),
+    "body_part": lambda: dict.fromkeys(game_config.config_body_part, 0),
+    "body_semen": lambda: {
+        body_part: (game_config.config_body_part[body_part].name, 0, 0, 0)
+        for body_part in game_config.config_body_part
+    },
+    "cloth_semen": lambda: {
+        clothing_type: (game_config.config_clothing_type[clothing_type].name, 0, 0, 0)
+        for clothing_type in game_config.config_clothing_type
+    },
+    "clothing_type": lambda: dict.fromkeys(game_config.config_clothing_type, 0),
+}
+""" 各归零原型的生成函数 原型名:生成函数 """
+
+
+def get_zero_prototype(prototype_name: str) -> Dict:
+    """
+    获取归零原型，初次调用时按配置表生成，调用方不得修改返回值
+    Keyword arguments:
+    prototype_name -- 原型名
+    Return arguments:
+    Dict -- 原型数据
+    """
+    if prototype_name not in zero_prototype_data:
+        zero_prototype_data[prototype_name] = zero_prototype_builder_data[prototype_name]()
+    return zero_prototype_data[prototype_name]
 
 
 def get_ability_zero(ability_dict) -> dict:
     """
     检查初始能力，将为空的项补为0
     """
-    ability_list = ability_dict
-    for ability in game_config.config_ability:
-        if ability not in ability_dict:
-            ability_list[ability] = 0
-    return ability_list
+    return {**get_zero_prototype("ability"), **ability_dict}
 
 def get_event_zero() -> dict:
     """
@@ -59,41 +95,25 @@ def get_status_zero(status_dict) -> dict:
     """
     检查初始状态，将为空的项补为0
     """
-    status_list = status_dict
-    for status in game_config.config_character_state:
-        if status not in status_dict:
-            status_list[status] = 0
-    return status_list
+    return {**get_zero_prototype("status"), **status_dict}
 
 def get_talent_zero(talent_dict) -> dict:
     """
     检查初始素质，将为空的项补为0
     """
-    talent_list = talent_dict
-    for talent in game_config.config_talent:
-        if talent not in talent_dict:
-            talent_list[talent] = 0
-    return talent_list
+    return {**get_zero_prototype("talent"), **talent_dict}
 
 def get_experience_zero(experience_dict) -> dict:
     """
     检查初始经验，将为空的项补为0
     """
-    experience_list = experience_dict
-    for experience in game_config.config_experience:
-        if experience not in experience_dict:
-            experience_list[experience] = 0
-    return experience_list
+    return {**get_zero_prototype("experience"), **experience_dict}
 
 def get_juel_zero(juel_dict) -> dict:
     """
     检查初始宝珠，将为空的项补为0
     """
-    juel_list = juel_dict
-    for juel in game_config.config_juel:
-        if juel not in juel_dict:
-            juel_list[juel] = 0
-    return juel_list
+    return {**get_zero_prototype("juel"), **juel_dict}
 
 
 def get_second_behavior_zero(second_behavior_dict) -> dict:
@@ -101,8 +121,7 @@ def get_second_behavior_zero(second_behavior_dict) -> dict:
     将二段行为全项归零，暂时为前200项
     """
     second_behavior_list = second_behavior_dict
-    for second_behavior in range(1000,1200):
-        second_behavior_list[second_behavior] = 0
+    second_behavior_list.update(get_zero_prototype("second_behavior"))
     return second_behavior_list
 
 
@@ -127,16 +146,8 @@ def get_dirty_zero() -> dict:
     直接将初始污浊情况归0
     """
     dirty_data = game_type.DIRTY()
-
-    for body_part in game_config.config_body_part:
-        body_text = game_config.config_body_part[body_part].name
-        now_list = [body_text,0,0,0]
-        dirty_data.body_semen.append(now_list)
-
-    for clothing_type in game_config.config_clothing_type:
-        cloth_text = game_config.config_clothing_type[clothing_type].name
-        now_list = [cloth_text,0,0,0]
-        dirty_data.cloth_semen.append(now_list)
+    dirty_data.body_semen = [list(now_list) for now_list in get_zero_prototype("body_semen").values()]
+    dirty_data.cloth_semen = [list(now_list) for now_list in get_zero_prototype("cloth_semen").values()]
 
     dirty_data.a_clean = 0
 
@@ -154,9 +165,9 @@ def get_h_state_zero() -> dict:
         now_list = [body_item,False,None]
         h_state_data.body_item.append(now_list)
 
-    for body_part in game_config.config_body_part:
-        h_state_data.orgasm_level[body_part] = 0
-        h_state_data.orgasm_count[body_part] = [0,0]
+    body_part_zero = get_zero_prototype("body_part")
+    h_state_data.orgasm_level = dict(body_part_zero)
+    h_state_data.orgasm_count = {body_part: [0,0] for body_part in body_part_zero}
 
     return h_state_data
 
@@ -206,10 +217,10 @@ def get_cloth_zero() -> dict:
     """
     coloth_data = game_type.CLOTH()
 
-    for clothing_type in game_config.config_clothing_type:
-        coloth_data.cloth_wear[clothing_type] = []
-        coloth_data.cloth_off[clothing_type] = []
-        coloth_data.cloth_locker[clothing_type] = []
+    clothing_type_zero = get_zero_prototype("clothing_type")
+    coloth_data.cloth_wear = {clothing_type: [] for clothing_type in clothing_type_zero}
+    coloth_data.cloth_off = {clothing_type: [] for clothing_type in clothing_type_zero}
+    coloth_data.cloth_locker = {clothing_type: [] for clothing_type in clothing_type_zero}
 
     coloth_data.cloth_see= {6:False,9:False}
 
@@ -220,10 +231,7 @@ def get_cloth_wear_zero() -> dict:
     """
     遍历当前穿着服装类型，将每个都设为空
     """
-    coloth_wear_data = game_type.CLOTH().cloth_wear
-
-    for clothing_type in game_config.config_clothing_type:
-        coloth_wear_data[clothing_type] = []
+    coloth_wear_data = {clothing_type: [] for clothing_type in get_zero_prototype("clothing_type")}
 
     return coloth_wear_data
 
@@ -232,10 +240,7 @@ def get_cloth_locker_zero() -> dict:
     """
     将衣柜里的每个衣服类型都设为空
     """
-    cloth_locker_data = game_type.CLOTH().cloth_locker
-
-    for clothing_type in game_config.config_clothing_type:
-        cloth_locker_data[clothing_type] = []
+    cloth_locker_data = {clothing_type: [] for clothing_type in get_zero_prototype("clothing_type")}
 
     return cloth_locker_data
 
@@ -262,11 +267,7 @@ def get_item_zero(item_dict) -> dict:
     """
     检查初始道具，将为空的项补为0
     """
-    item_list = item_dict
-    for item in game_config.config_item:
-        if item not in item_dict:
-            item_list[item] = 0
-    return item_list
+    return {**get_zero_prototype("item"), **item_dict}
 
 
 def get_Dr_talent_zero(juel_dict) -> dict:
@@ -294,6 +295,21 @@ def get_rand_npc_birthday(age: int):
     return birthday
 
 
+def get_threshold_value(table_name: str, value: float):
+    """
+    按属性分段表获取数值所在分段的值
+    Keyword arguments:
+    table_name -- 分段表名
+    value -- 数值
+    Return arguments:
+    int|float -- 该段对应的值
+    """
+    upper_list, value_list, include_upper = game_config.config_threshold_table_data[table_name]
+    if include_upper:
+        return value_list[bisect.bisect_left(upper_list, value)]
+    return value_list[bisect.bisect_right(upper_list, value)]
+
+
 def get_experience_level_weight(experience: int) -> int:
     """
     按经验计算技能等级权重
@@ -302,26 +318,7 @@ def get_experience_level_weight(experience: int) -> int:
     Return arguments:
     int -- 权重
     """
-    grade = 0
-    if experience < 100:
-        grade = 0
-    elif experience < 500:
-        grade = 1
-    elif experience < 1000:
-        grade = 2
-    elif experience < 2000:
-        grade = 3
-    elif experience < 3000:
-        grade = 4
-    elif experience < 5000:
-        grade = 5
-    elif experience < 10000:
-        grade = 6
-    elif experience < 20000:
-        grade = 7
-    elif experience >= 20000:
-        grade = 8
-    return grade
+    return get_threshold_value("experience_level", experience)
 
 
 def judge_grade(experience: int) -> str:
@@ -361,29 +358,7 @@ def get_status_level(value: int) -> int:
     Return arguments:
     level -- 数字评级
     """
-    if value < 100:
-        level = 0
-    elif value < 500:
-        level = 1
-    elif value < 3000:
-        level = 2
-    elif value < 10000:
-        level = 3
-    elif value < 30000:
-        level = 4
-    elif value < 60000:
-        level = 5
-    elif value < 100000:
-        level = 6
-    elif value < 150000:
-        level = 7
-    elif value < 250000:
-        level = 8
-    elif value < 400000:
-        level = 9
-    elif value >= 400000:
-        level = 10
-    return level
+    return get_threshold_value("status_level", value)
 
 
 def get_ability_level(value: int) -> int:
@@ -394,29 +369,7 @@ def get_ability_level(value: int) -> int:
     Return arguments:
     level -- 数字评级
     """
-    if value < 100:
-        level = 0
-    elif value < 500:
-        level = 1
-    elif value < 3000:
-        level = 2
-    elif value < 10000:
-        level = 3
-    elif value < 30000:
-        level = 4
-    elif value < 60000:
-        level = 5
-    elif value < 100000:
-        level = 6
-    elif value < 150000:
-        level = 7
-    elif value < 250000:
-        level = 8
-    elif value < 400000:
-        level = 9
-    elif value >= 400000:
-        level = 10
-    return level
+    return get_threshold_value("ability_level", value)
 
 def get_ability_adjust(value: int) -> int:
     """
@@ -426,30 +379,7 @@ def get_ability_adjust(value: int) -> int:
     Return arguments:
     just -- 调整比例
     """
-    level = get_ability_level(value)
-    if level == 0:
-        just = 0.2
-    elif level == 1:
-        just = 0.4
-    elif level == 2:
-        just = 0.7
-    elif level == 3:
-        just = 1.0
-    elif level == 4:
-        just = 1.4
-    elif level == 5:
-        just = 1.8
-    elif level == 6:
-        just = 2.3
-    elif level == 7:
-        just = 2.8
-    elif level == 8:
-        just = 3.4
-    elif level == 9:
-        just = 4.0
-    elif level == 10:
-        just = 5.0
-    return just
+    return get_threshold_value("ability_adjust", get_ability_level(value))
 
 
 def get_mark_debuff_adjust(value: int) -> int:
@@ -460,16 +390,7 @@ def get_mark_debuff_adjust(value: int) -> int:
     Return arguments:
     just -- 调整比例
     """
-    level = get_ability_level(value)
-    if level == 0:
-        just = 1
-    elif level == 1:
-        just = 2
-    elif level == 2:
-        just = 5
-    elif level == 3:
-        just = 10
-    return just
+    return get_threshold_value("mark_debuff_adjust", get_ability_level(value))
 
 
 def get_juel(value: int) -> int:
@@ -480,30 +401,7 @@ def get_juel(value: int) -> int:
     Return arguments:
     juel -- 最终珠值
     """
-    level = get_ability_level(value)
-    if level == 0:
-        juel = round(0.2*value)
-    elif level == 1:
-        juel = round(0.4*value)
-    elif level == 2:
-        juel = round(0.7*value)
-    elif level == 3:
-        juel = round(1.0*value)
-    elif level == 4:
-        juel = round(1.4*value)
-    elif level == 5:
-        juel = round(1.8*value)
-    elif level == 6:
-        juel = round(2.3*value)
-    elif level == 7:
-        juel = round(2.8*value)
-    elif level == 8:
-        juel = round(3.4*value)
-    elif level == 9:
-        juel = round(4.0*value)
-    elif level == 10:
-        juel = round(5.0*value)
-    return juel
+    return round(get_ability_adjust(value) * value)
 
 
 def get_pain_adjust(value: int) -> int:
@@ -514,30 +412,7 @@ def get_pain_adjust(value: int) -> int:
     Return arguments:
     just -- 调整比例
     """
-    level = get_ability_level(value)
-    if level == 0:
-        just = 10.0
-    elif level == 1:
-        just = 6.0
-    elif level == 2:
-        just = 3.4
-    elif level == 3:
-        just = 2.8
-    elif level == 4:
-        just = 2.3
-    elif level == 5:
-        just = 1.8
-    elif level == 6:
-        just = 1.4
-    elif level == 7:
-        just = 1.0
-    elif level == 8:
-        just = 0.7
-    elif level == 9:
-        just = 0.4
-    elif level == 10:
-        just = 0.2
-    return just
+    return get_threshold_value("pain_adjust", get_ability_level(value))
 
 
 def get_angry_level(value: int) -> int:
@@ -548,14 +423,8 @@ def get_angry_level(value: int) -> int:
     Return arguments:
     level -- 生气程度
     """
-    if value <= 5:
-        return 1
-    elif 5 < value and value <= 30:
-        return 0
-    elif 30 < value and value <=50:
-        return -1
-    elif value > 50:
-        return -3
+    return get_threshold_value("angry_level", value)
+
 
 def get_angry_text(value: int) -> str:
     """
@@ -583,18 +452,7 @@ def get_semen_now_level(value: int) -> int:
     Return arguments:
     level -- 精液覆盖等级
     """
-    if value <= 0:
-        return 0
-    elif 0 < value and value <= 10:
-        return 1
-    elif 10 < value and value <= 50:
-        return 2
-    elif 50 < value and value <=200:
-        return 3
-    elif 200 < value and value <=1000:
-        return 4
-    elif value > 1000:
-        return 5
+    return get_threshold_value("semen_now_level", value)
 
 
 def get_sleep_level(value: int) -> int:
@@ -605,12 +463,5 @@ def get_sleep_level(value: int) -> int:
     Return arguments:
     level -- 困倦等级
     """
-    if value / 160 <= 0.74:
-        return 0
-    elif 0.74 < value / 160 and value / 160 <= 0.89:
-        return 1
-    elif 0.89 < value / 160 and value / 160 <= 0.99:
-        return 2
-    elif value / 160 >= 1:
-        return 3
+    return get_threshold_value("sleep_level", value / 160)
 
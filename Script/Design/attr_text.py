@@ -1,5 +1,4 @@
 import random
-import bisect
 from typing import List
 from Script.Core import (
     cache_control,
@@ -20,10 +19,9 @@ def get_random_name_for_sex(sex_grade: str) -> str:
     sex_grade -- 性别
     """
     while 1:
-        family_random = random.randint(1, constant.family_region_int_list[-1])
-        family_region_index = bisect.bisect_left(constant.family_region_int_list, family_random)
-        family_region = constant.family_region_int_list[family_region_index]
-        family_name = constant.family_region_list[family_region]
+        family_name = constant.family_name_sampler.get_value(
+            random.randint(1, constant.family_name_sampler.weight_max)
+        )
         if sex_grade == "Man":
             sex_judge = 1
         elif sex_grade == "Woman":
@@ -31,15 +29,11 @@ def get_random_name_for_sex(sex_grade: str) -> str:
         else:
             sex_judge = random.randint(0, 1)
         if sex_judge == 0:
-            name_random = random.randint(1, constant.girls_region_int_list[-1])
-            name_region_index = bisect.bisect_left(constant.girls_region_int_list, name_random)
-            name_region = constant.girls_region_int_list[name_region_index]
-            name = constant.girls_region_list[name_region]
+            name = constant.girls_name_sampler.get_value(random.randint(1, constant.girls_name_sampler.weight_max))
         else:
-            name_random = random.randint(1, constant.boys_region_int_list[-2])
-            name_region_index = bisect.bisect_left(constant.boys_region_int_list, name_random)
-            name_region = constant.boys_region_int_list[name_region_index]
-            name = constant.boys_region_list[name_region]
+            name = constant.boys_name_sampler.get_value(
+                random.randint(1, constant.boys_name_sampler.region_list[-2])
+            )
         now_name = f"{family_name}{name}"
         if now_name not in cache.npc_name_data:
             cache.npc_name_data.add(now_name)
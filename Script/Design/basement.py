@@ -1,13 +1,23 @@
+import bisect
+import logging
 import random
+from typing import Dict, List, Set, Tuple
 from Script.Core import (
     cache_control,
     game_type,
+    rng_handle,
 )
 from Script.Config import game_config
-from Script.Design import handle_premise
+from Script.Design import handle_premise, map_handle
 
 cache: game_type.Cache = cache_control.cache
 """ 游戏内缓存数据 """
+work_place_tag_data: Dict[int, Set[str]] = {
+    61: {"Clinic"},
+    71: {"HR_office"},
+    101: {"Library_office", "Library"},
+}
+""" 各职位的工作场所 职位id:场景标签集合 """
 
 
 def get_base_zero() -> dict:
@@ -36,6 +46,7 @@ def get_base_zero() -> dict:
     for book_id in game_config.config_book:
         # 全书籍设为未借出
         base_data.book_borrow_dict[book_id] = -1
+    init_book_ledger(base_data)
 
     # 派对设为空
     for i in range(7):
@@ -84,7 +95,7 @@ def get_base_updata():
         # 初始化患者人数上限，并刷新当天患者人数
         elif facility_name == "医疗部":
             cache.base_resouce.patient_max = game_config.config_facility_effect[facility_cid].effect
-            cache.base_resouce.patient_now = random.randint(1,cache.base_resouce.patient_max)
+            cache.base_resouce.patient_now = rng_handle.get_random("base").randint(1,cache.base_resouce.patient_max)
         # 初始化科研区设施数量上限
         elif facility_name == "科研部":
             cache.base_resouce.research_zone_max = game_config.config_facility_effect[facility_cid].effect
@@ -104,55 +115,240 @@ def get_base_updata():
                 cache.base_resouce.recruit_now[0] = 0
 
 
-def update_work_people():
+def get_work_people_state(character_id: int) -> Tuple[int, bool, bool]:
     """
-    刷新各干员的职位和当前正在工作的干员
+    获取角色当前在各部门人员统计中的状态
+    Keyword arguments:
+    character_id -- 角色id
+    Return arguments:
+    int -- 职位id，不计入统计时为0
+    bool -- 是否在工作场所
+    bool -- 是否在图书馆
     """
+    if not character_id or character_id not in cache.npc_id_got:
+        return 0, False, False
+    character_data: game_type.Character = cache.character_data[character_id]
+    now_scene_str = map_handle.get_map_system_path_str_for_list(character_data.position)
+    scene_tag = cache.scene_data[now_scene_str].scene_tag
+    work_type = character_data.work.work_type
+    if work_type not in work_place_tag_data:
+        work_type = 0
+    on_work = bool(work_type) and not work_place_tag_data[work_type].isdisjoint(scene_tag)
+    return work_type, on_work, "Library" in scene_tag
+
+
+def change_work_people_state(character_id: int, work_state: Tuple[int, bool, bool], add_value: int):
+    """
+    将角色的状态计入或移出各部门人员统计
+    Keyword arguments:
+    character_id -- 角色id
+    work_state -- get_work_people_state获取的状态
+    add_value -- 1为计入，-1为移出
+    """
+    base_data = cache.base_resouce
+    work_type, on_work, in_library = work_state
+    if work_type == 61:
+        now_set = base_data.doctor_id_set
+        base_data.doctor_now += add_value * on_work
+    elif work_type == 71:
+        now_set = base_data.HR_id_set
+        base_data.HR_now += add_value * on_work
+    elif work_type == 101:
+        now_set = base_data.library_manager_set
+        base_data.library_manager_now += add_value * on_work
+    else:
+        now_set = None
+    if now_set is not None:
+        if add_value > 0:
+            now_set.add(character_id)
+        else:
+            now_set.discard(character_id)
+    base_data.work_people_now += add_value * on_work
+    base_data.reader_now += add_value * in_library
+
+
+def update_character_work_people(character_id: int):
+    """
+    按角色当前的职位和位置增量刷新各部门人员统计，在角色移动与更换职位后调用
+    Keyword arguments:
+    character_id -- 角色id
+    """
+    work_people_state = cache.base_resouce.work_people_state
+    old_state = work_people_state.get(character_id, (0, False, False))
+    new_state = get_work_people_state(character_id)
+    if new_state == old_state:
+        return
+    change_work_people_state(character_id, old_state, -1)
+    change_work_people_state(character_id, new_state, 1)
+    if new_state == (0, False, False):
+        del work_people_state[character_id]
+    else:
+        work_people_state[character_id] = new_state
+
 
-    cache.base_resouce.doctor_now = 0
-    cache.base_resouce.doctor_id_set = set()
-    cache.base_resouce.HR_now = 0
-    cache.base_resouce.HR_id_set = set()
-    cache.base_resouce.library_manager_now = 0
-    cache.base_resouce.library_manager_set = set()
-    cache.base_resouce.work_people_now = 0
+def init_work_people():
+    """
+    重建各部门人员统计，在开始游戏与读档后调用
+    """
+    base_data = cache.base_resouce
+    base_data.doctor_now = 0
+    base_data.doctor_id_set = set()
+    base_data.HR_now = 0
+    base_data.HR_id_set = set()
+    base_data.library_manager_now = 0
+    base_data.library_manager_set = set()
+    base_data.work_people_now = 0
+    base_data.reader_now = 0
+    base_data.work_people_state = {}
+    for character_id in cache.npc_id_got:
+        update_character_work_people(character_id)
 
-    cache.npc_id_got.discard(0)
-    for id in cache.npc_id_got:
-        character_data = cache.character_data[id]
 
+def check_work_people() -> bool:
+    """
+    遍历全部干员重新统计各部门人员，并与增量维护的统计对比，供调试时校验
+    Return arguments:
+    bool -- 统计是否一致
+    """
+    doctor_id_set, HR_id_set, library_manager_set = set(), set(), set()
+    doctor_now, HR_now, library_manager_now, work_people_now, reader_now = 0, 0, 0, 0, 0
+    for character_id in cache.npc_id_got:
+        if character_id == 0:
+            continue
+        character_data = cache.character_data[character_id]
         # 医生统计
         if character_data.work.work_type == 61:
-            cache.base_resouce.doctor_id_set.add(id)
-            if handle_premise.handle_in_clinic(id):
-                cache.base_resouce.doctor_now += 1
-                cache.base_resouce.work_people_now += 1
+            doctor_id_set.add(character_id)
+            if handle_premise.handle_in_clinic(character_id):
+                doctor_now += 1
+                work_people_now += 1
         # HR统计
         elif character_data.work.work_type == 71:
-            cache.base_resouce.HR_id_set.add(id)
-            if handle_premise.handle_in_hr_office(id):
-                cache.base_resouce.HR_now += 1
-                cache.base_resouce.work_people_now += 1
+            HR_id_set.add(character_id)
+            if handle_premise.handle_in_hr_office(character_id):
+                HR_now += 1
+                work_people_now += 1
         # 图书馆管理员统计
         elif character_data.work.work_type == 101:
-            cache.base_resouce.library_manager_set.add(id)
-            if handle_premise.handle_in_library_office(id) or handle_premise.handle_in_library(id):
-                cache.base_resouce.library_manager_now += 1
-                cache.base_resouce.work_people_now += 1
+            library_manager_set.add(character_id)
+            if handle_premise.handle_in_library_office(character_id) or handle_premise.handle_in_library(character_id):
+                library_manager_now += 1
+                work_people_now += 1
+        # 图书馆读者统计
+        if handle_premise.handle_in_library(character_id):
+            reader_now += 1
+    base_data = cache.base_resouce
+    check_data = {
+        "doctor_id_set": (doctor_id_set, base_data.doctor_id_set),
+        "doctor_now": (doctor_now, base_data.doctor_now),
+        "HR_id_set": (HR_id_set, base_data.HR_id_set),
+        "HR_now": (HR_now, base_data.HR_now),
+        "library_manager_set": (library_manager_set, base_data.library_manager_set),
+        "library_manager_now": (library_manager_now, base_data.library_manager_now),
+        "work_people_now": (work_people_now, base_data.work_people_now),
+        "reader_now": (reader_now, base_data.reader_now),
+    }
+    check_judge = True
+    for key, (scan_value, now_value) in check_data.items():
+        if scan_value != now_value:
+            logging.warning(f"部门人员统计不一致 {key}：遍历结果{scan_value}，当前{now_value}")
+            check_judge = False
+    return check_judge
 
 
-def update_facility_people():
+def init_book_ledger(base_data: game_type.Base_resouce = None):
     """
-    更新当前基地各设施使用人数
+    按书籍借出情况重建未借出书籍池，在开始游戏与读档后调用
+    Keyword arguments:
+    base_data -- 基地资源，为空时使用当前基地资源
     """
+    if base_data is None:
+        base_data = cache.base_resouce
+    old_time_data = getattr(base_data, "book_borrow_time", {})
+    base_data.book_free_data = {}
+    base_data.book_borrow_time = {}
+    for book_id in sorted(game_config.config_book):
+        # 版本更新后新增的书籍设为未借出
+        base_data.book_borrow_dict.setdefault(book_id, -1)
+        if base_data.book_borrow_dict[book_id] == -1:
+            base_data.book_free_data.setdefault(game_config.config_book[book_id].type, []).append(book_id)
+        else:
+            base_data.book_borrow_time[book_id] = old_time_data.get(book_id, cache.game_time)
 
-    cache.base_resouce.reader_now = 0
 
-    cache.npc_id_got.discard(0)
-    for id in cache.npc_id_got:
-        # 图书馆读者统计
-        if handle_premise.handle_in_library(id):
-            cache.base_resouce.reader_now += 1
+def borrow_book(book_id: int, character_id: int):
+    """
+    借出书籍
+    Keyword arguments:
+    book_id -- 书籍id
+    character_id -- 借书的角色id
+    """
+    base_data = cache.base_resouce
+    free_list = base_data.book_free_data[game_config.config_book[book_id].type]
+    del free_list[bisect.bisect_left(free_list, book_id)]
+    base_data.book_borrow_dict[book_id] = character_id
+    base_data.book_borrow_time[book_id] = cache.game_time
+    cache.character_data[character_id].entertainment.borrow_book_id_set.add(book_id)
+
+
+def return_book(book_id: int):
+    """
+    归还书籍
+    Keyword arguments:
+    book_id -- 书籍id
+    """
+    base_data = cache.base_resouce
+    character_id = base_data.book_borrow_dict[book_id]
+    bisect.insort(base_data.book_free_data.setdefault(game_config.config_book[book_id].type, []), book_id)
+    base_data.book_borrow_dict[book_id] = -1
+    base_data.book_borrow_time.pop(book_id, None)
+    cache.character_data[character_id].entertainment.borrow_book_id_set.discard(book_id)
+
+
+def choice_free_book(now_random: random.Random, type_list: List[int]) -> int:
+    """
+    在指定类型的未借出书籍中等概率随机选择一本
+    Keyword arguments:
+    now_random -- 随机数生成器
+    type_list -- 书籍类型列表
+    Return arguments:
+    int -- 书籍id，没有可借的书时为-1
+    """
+    free_data = cache.base_resouce.book_free_data
+    book_count = sum(len(free_data.get(book_type, [])) for book_type in type_list)
+    if not book_count:
+        return -1
+    now_index = now_random.randrange(book_count)
+    for book_type in type_list:
+        free_list = free_data.get(book_type, [])
+        if now_index < len(free_list):
+            return free_list[now_index]
+        now_index -= len(free_list)
+
+
+def get_borrowed_book_list() -> List[int]:
+    """
+    获取全部已借出的书籍
+    Return arguments:
+    List[int] -- 按id排序的书籍id列表
+    """
+    return sorted(cache.base_resouce.book_borrow_time)
+
+
+def get_overdue_book_list(day: int) -> List[int]:
+    """
+    获取借出超过指定天数的书籍
+    Keyword arguments:
+    day -- 天数
+    Return arguments:
+    List[int] -- 按id排序的书籍id列表
+    """
+    return [
+        book_id
+        for book_id in get_borrowed_book_list()
+        if (cache.game_time - cache.base_resouce.book_borrow_time[book_id]).days >= day
+    ]
+
 
 def check_random_borrow_book(character_id):
     """
@@ -165,22 +361,19 @@ def check_random_borrow_book(character_id):
         return 1
     # 未借书则随机借书
     else:
-        # 遍历获得所有没借的书id
-        recommend_book_id_set,book_id_set = [],[]
-        for book_id in cache.base_resouce.book_borrow_dict:
-            # 未被借出则加入book_id_set
-            if cache.base_resouce.book_borrow_dict[book_id] == -1:
-                book_id_set.append(book_id)
-                # 如果类型在推荐列表里，则加入recommend_book_id_set
-                if game_config.config_book[book_id].type in cache.base_resouce.recommend_book_type_set:
-                    recommend_book_id_set.append(book_id)
-        # 如果推荐列表有书，则有一半的概率在推荐列表里借书，否则在全列表里借书
-        if len(recommend_book_id_set) and random.randint(0,1) == 1:
-            borrow_book_id = random.choice(recommend_book_id_set)
+        now_random = rng_handle.get_random("behavior", character_id)
+        free_data = cache.base_resouce.book_free_data
+        recommend_type_list = sorted(
+            book_type for book_type in cache.base_resouce.recommend_book_type_set if free_data.get(book_type)
+        )
+        # 如果推荐类型有书，则有一半的概率在推荐类型里借书，否则在全部类型里借书
+        if len(recommend_type_list) and now_random.randint(0,1) == 1:
+            borrow_book_id = choice_free_book(now_random, recommend_type_list)
         else:
-            borrow_book_id = random.choice(book_id_set)
-        cache.base_resouce.book_borrow_dict[borrow_book_id] = character_id
-        character_data.entertainment.borrow_book_id_set.add(borrow_book_id)
+            borrow_book_id = choice_free_book(now_random, sorted(free_data))
+        if borrow_book_id == -1:
+            return 0
+        borrow_book(borrow_book_id, character_id)
         # print(f"debug {character_data.name}借了书{borrow_book_id}")
         return 0
 
@@ -195,12 +388,11 @@ def check_return_book(character_id):
         return 0
     # 已借书则d100和还书概率比大小
     else:
-        return_d100 = random.randint(1,100)
+        return_d100 = rng_handle.get_random("behavior", character_id).randint(1,100)
         # 小于还书概率则还书
         # print(f"debug return_d100 = {return_d100},book_return_possibility = {character_data.entertainment.book_return_possibility}")
         if return_d100 < character_data.entertainment.book_return_possibility:
             for book_id in character_data.entertainment.borrow_book_id_set:
-                cache.base_resouce.book_borrow_dict[book_id] = -1
-                character_data.entertainment.borrow_book_id_set.discard(book_id)
+                return_book(book_id)
                 # print(f"debug {character_data.name}还了书{book_id}")
                 return 1
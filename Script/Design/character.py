@@ -1,6 +1,6 @@
 import random
 import datetime
-from typing import List
+from typing import Dict, List, Tuple
 from Script.Core import (
     cache_control,
     value_handle,
@@ -20,6 +20,41 @@ from Script.UI.Moudle import draw
 
 cache: game_type.Cache = cache_control.cache
 """ 游戏缓存数据 """
+character_version_data: Dict[int, int] = {}
+""" 角色属性的版本号 角色id:版本号，角色属性被改变后递增，用于判断界面缓存是否失效 """
+
+
+ability_judge_table: List[Tuple[int, int]] = [(32, 10), (33, 5)]
+""" 实行值的能力修正 [(能力id, 每级修正值)] """
+mark_judge_table: List[Tuple[int, int]] = [(13, 20), (14, 20), (18, -30)]
+""" 实行值的刻印修正 [(能力id, 每级修正值)]，时停与恐怖的抵消另行计算 """
+fall_judge_table: List[Tuple[int, int]] = [
+    (10, 30), (11, 50), (12, 80), (13, 100), (15, 30), (16, 50), (17, 80), (18, 100)
+]
+""" 实行值的陷落素质修正 [(素质id, 修正值)] """
+information_judge_table: List[Tuple[int, int]] = [(304, 10), (305, 25), (306, 50)]
+""" 实行值的博士信息素修正 [(素质id, 修正值)] """
+
+
+def get_judge_weight_value(judge_table: List[Tuple[int, int]], value_data: Dict[int, int]) -> int:
+    """
+    按权重表获取属性的加权和
+    Keyword arguments:
+    judge_table -- 权重表
+    value_data -- 属性数据 属性id:数值
+    Return arguments:
+    int -- 加权和
+    """
+    return sum(value_data[key] * weight for key, weight in judge_table)
+
+
+def refresh_character_version(character_id: int):
+    """
+    使角色的界面缓存失效，角色属性被改变后调用
+    Keyword arguments:
+    character_id -- 角色id
+    """
+    character_version_data[character_id] = character_version_data.get(character_id, 0) + 1
 
 
 def init_attr(character_id: int):
@@ -187,152 +222,118 @@ def calculation_favorability(character_id: int, target_character_id: int, favora
     return favorability
 
 
-def calculation_instuct_judege(character_id: int, target_character_id: int, instruct_name: str) -> int:
+def get_instruct_judge(character_id: int, target_character_id: int, instruct_name: str) -> Tuple[int, int, List[Tuple[str, int, bool]]]:
     """
-    按角色当前状态、素质和能力计算最终该指令是否成功
+    按角色当前状态、素质和能力计算指令的实行值
     Keyword arguments:
     character_id -- 角色id
     target_character_id -- 目标角色id
     instruct_name -- 指令名字
     Return arguments:
-    int -- 最终的好感值
+    int -- 当前实行值
+    int -- 需要的实行值
+    List[Tuple[str, int, bool]] -- 各项修正 [(修正名, 修正值, 是否总是显示)]，仅用于生成说明文本
     """
     character_data: game_type.Character = cache.character_data[character_id]
     target_data: game_type.Character = cache.character_data[target_character_id]
-    for judge_id in game_config.config_instruct_judge_data:
-        # 匹配到能力的id与能力等级对应的前提#
-        if game_config.config_instruct_judge_data[judge_id].instruct_name == instruct_name:
-            judge_data = game_config.config_instruct_judge_data[judge_id]
-            judge_data_type = judge_data.need_type
-            judge_data_value = judge_data.value
-            break
-
-    if judge_data_type == "D":
-        calculation_text = "需要基础实行值至少为" + str(judge_data_value) + "\n"
-    elif judge_data_type == "S":
-        calculation_text = "需要性爱实行值至少为" + str(judge_data_value) + "\n"
-    calculation_text += "当前值为："
-
-    judge = 0
-
-    # 好感判定#
-    favorability = target_data.favorability[0]
-    judge_favorability = 0
-    if favorability < 100:
-        judge_favorability -= 20
-    if favorability < 1000:
-        judge_favorability += 0
-    elif favorability < 3000:
-        judge_favorability += 50
-    elif favorability < 5000:
-        judge_favorability += 75
-    elif favorability < 10000:
-        judge_favorability += 100
-    elif favorability < 30000:
-        judge_favorability += 150
-    else:
-        judge_favorability += 200
-    calculation_text += "好感修正(" + str(judge_favorability) + ")"
-    judge += judge_favorability
-
-    # 信赖判定#
-    trust = target_data.trust
-    judge_trust = 0
-    if trust < 50:
-        judge_trust -= 50
-    elif trust < 100:
-        judge_trust -= 20
-    elif trust < 150:
-        judge_trust += 0
-    elif trust < 200:
-        judge_trust += 30
-    elif trust < 250:
-        judge_trust += 50
-    else:
-        judge_trust += 100
-    judge += judge_trust
-    calculation_text += "+信赖修正(" + str(judge_trust) + ")"
+    judge_data = game_config.config_instruct_judge_name_data[instruct_name]
+    modifier_list = []
+
+    # 好感与信赖判定#
+    modifier_list.append(("好感修正", attr_calculation.get_threshold_value("favorability_judge", target_data.favorability[0]), True))
+    modifier_list.append(("信赖修正", attr_calculation.get_threshold_value("trust_judge", target_data.trust), True))
 
     # 状态修正，好意(11)和欲情(12)修正#
-    judge_status = int((target_data.status_data[11] + target_data.status_data[12]) / 10)
-    judge += judge_status
-    if judge_status:
-        calculation_text += "+状态修正(" + str(judge_status) + ")"
+    modifier_list.append(("状态修正", int((target_data.status_data[11] + target_data.status_data[12]) / 10), False))
 
     # 能力修正，亲密(32)和欲望(33)修正#
-    judge_ability = target_data.ability[32] * 10 + target_data.ability[33] * 5
-    judge += judge_ability
-    if judge_ability:
-        calculation_text += "+能力修正(" + str(judge_ability) + ")"
+    modifier_list.append(("能力修正", get_judge_weight_value(ability_judge_table, target_data.ability), False))
 
     # 刻印修正，快乐(13)、屈服(14)、时停(16)、恐怖(17)、反发(18)修正#
-    judge_mark = target_data.ability[13] * 20 + target_data.ability[14] * 20
-    judge_mark -= min(target_data.ability[17] - target_data.ability[16], 0) * 20 + target_data.ability[18] * 30
-    judge += judge_mark
-    if judge_mark:
-        calculation_text += "+刻印修正(" + str(judge_mark) + ")"
+    judge_mark = get_judge_weight_value(mark_judge_table, target_data.ability)
+    judge_mark -= min(target_data.ability[17] - target_data.ability[16], 0) * 20
+    modifier_list.append(("刻印修正", judge_mark, False))
 
     # 心情修正，好心情+10，坏心情-10，愤怒-30
-    judge_angry = attr_calculation.get_angry_level(target_data.angry_point) * 10
-    judge += judge_angry
-    if judge_angry:
-        calculation_text += "+心情修正(" + str(judge_angry) + ")"
+    modifier_list.append(("心情修正", attr_calculation.get_angry_level(target_data.angry_point) * 10, False))
 
     # 陷落素质判定，第一阶段~第四阶段分别为30,50,80,100#
-    judge_fall = target_data.talent[10] * 30 + target_data.talent[11] * 50 + target_data.talent[12] * 80 + \
-                 target_data.talent[13] * 100 + target_data.talent[15] * 30 + target_data.talent[16] * 50 + \
-                 target_data.talent[17] * 80 + target_data.talent[18] * 100
-    judge += judge_fall
-    if judge_fall:
-        calculation_text += "+陷落修正(" + str(judge_fall) + ")"
-    # 讨厌男性修正#
-    judge_hate = target_data.talent[227] * 30
-    judge -= judge_hate
-    if judge_hate:
-        calculation_text += "+讨厌男性(-" + str(judge_hate) + ")"
-    # 难以越过的底线修正#
-    judge_hardlove = target_data.talent[224] * 30
-    judge -= judge_hardlove
-    if judge_hardlove:
-        calculation_text += "+难以越过的底线(-" + str(judge_hardlove) + ")"
+    modifier_list.append(("陷落修正", get_judge_weight_value(fall_judge_table, target_data.talent), False))
+    # 讨厌男性与难以越过的底线修正#
+    modifier_list.append(("讨厌男性", -target_data.talent[227] * 30, False))
+    modifier_list.append(("难以越过的底线", -target_data.talent[224] * 30, False))
     # 博士信息素修正#
-    judge_information = character_data.talent[304] * 10 + character_data.talent[305] * 25 + character_data.talent[
-        306] * 50
-    judge += judge_information
-    if judge_information:
-        calculation_text += "+博士信息素(" + str(judge_information) + ")"
+    modifier_list.append(("博士信息素", get_judge_weight_value(information_judge_table, character_data.talent), False))
 
     # 当前场景有人修正
     scene_path_str = map_handle.get_map_system_path_str_for_list(character_data.position)
     scene_data = cache.scene_data[scene_path_str]
     if len(scene_data.character_list) > 2:
-        if judge_data_type == "S":
+        if judge_data.need_type == "S":
             judge_other_people = 100
         else:
             judge_other_people = 30
         # 露出修正
         adjust = attr_calculation.get_ability_adjust(target_data.ability[34])
-        judge_other_people = int(judge_other_people * (adjust - 1.5))
-        judge += judge_other_people
-        calculation_text += "+当前场景有其他人在(" + text_handle.number_to_symbol_string(judge_other_people) + ")"
+        modifier_list.append(("当前场景有其他人在", int(judge_other_people * (adjust - 1.5)), True))
 
     # 今天H被打断了修正
-    judge_h_interrupt = character_data.action_info.h_interrupt * 10
-    judge -= judge_h_interrupt
-    if judge_h_interrupt:
-        calculation_text += "+今天H被打断过(-" + str(judge_h_interrupt) + ")"
+    modifier_list.append(("今天H被打断过", -character_data.action_info.h_interrupt * 10, False))
 
     # debug模式修正
     if cache.debug_mode == True:
-        judge += 99999
-        calculation_text += "+debug模式(+99999)"
-
-    calculation_text += " = " + str(judge) + "\n"
-    now_draw = draw.WaitDraw()
-    now_draw.width = 1
-    now_draw.text = calculation_text
-    now_draw.draw()
-    if judge >= judge_data_value:
+        modifier_list.append(("debug模式", 99999, True))
+
+    judge = sum(modifier[1] for modifier in modifier_list)
+    return judge, judge_data.value, modifier_list
+
+
+def get_instruct_judge_text(instruct_name: str, judge: int, modifier_list: List[Tuple[str, int, bool]]) -> str:
+    """
+    生成实行值的计算说明文本
+    Keyword arguments:
+    instruct_name -- 指令名字
+    judge -- 当前实行值
+    modifier_list -- 各项修正
+    Return arguments:
+    str -- 说明文本
+    """
+    judge_data = game_config.config_instruct_judge_name_data[instruct_name]
+    text_list = []
+    if judge_data.need_type == "D":
+        text_list.append(f"需要基础实行值至少为{judge_data.value}\n")
+    elif judge_data.need_type == "S":
+        text_list.append(f"需要性爱实行值至少为{judge_data.value}\n")
+    modifier_text_list = []
+    for modifier_name, modifier_value, show_flag in modifier_list:
+        if not show_flag and not modifier_value:
+            continue
+        if modifier_name in {"当前场景有其他人在", "debug模式"}:
+            modifier_text_list.append(f"{modifier_name}({text_handle.number_to_symbol_string(modifier_value)})")
+        else:
+            modifier_text_list.append(f"{modifier_name}({modifier_value})")
+    text_list.append("当前值为：" + "+".join(modifier_text_list) + f" = {judge}\n")
+    return "".join(text_list)
+
+
+def calculation_instuct_judege(character_id: int, target_character_id: int, instruct_name: str, draw_flag: bool = True) -> int:
+    """
+    按角色当前状态、素质和能力计算最终该指令是否成功
+    Keyword arguments:
+    character_id -- 角色id
+    target_character_id -- 目标角色id
+    instruct_name -- 指令名字
+    draw_flag -- 是否绘制实行值的计算说明
+    Return arguments:
+    int -- 是否成功
+    """
+    judge, judge_value, modifier_list = get_instruct_judge(character_id, target_character_id, instruct_name)
+    if draw_flag:
+        now_draw = draw.WaitDraw()
+        now_draw.width = 1
+        now_draw.text = get_instruct_judge_text(instruct_name, judge, modifier_list)
+        now_draw.draw()
+    if judge >= judge_value:
         return 1
     else:
         return 0
@@ -395,41 +396,3 @@ def judge_character_time_over_24(character_id: int) -> bool:
     if end_time.day != start_time.day:
         return 1
     return 0
-
-
-def update_work_people():
-    """
-    刷新各干员的职位和当前正在工作的干员
-    """
-    from Script.Design import handle_premise
-
-    cache.base_resouce.doctor_now = 0
-    cache.base_resouce.doctor_id_set = set()
-    cache.base_resouce.HR_now = 0
-    cache.base_resouce.HR_id_set = set()
-    cache.base_resouce.library_manager_now = 0
-    cache.base_resouce.library_manager_set = set()
-    cache.base_resouce.work_people_now = 0
-
-    cache.npc_id_got.discard(0)
-    for id in cache.npc_id_got:
-        character_data = cache.character_data[id]
-
-        # 医生统计
-        if character_data.work.work_type == 61:
-            cache.base_resouce.doctor_id_set.add(id)
-            if handle_premise.handle_in_clinic(id):
-                cache.base_resouce.doctor_now += 1
-                cache.base_resouce.work_people_now += 1
-        # HR统计
-        elif character_data.work.work_type == 71:
-            cache.base_resouce.HR_id_set.add(id)
-            if handle_premise.handle_in_hr_office(id):
-                cache.base_resouce.HR_now += 1
-                cache.base_resouce.work_people_now += 1
-        # 图书馆管理员统计
-        elif character_data.work.work_type == 101:
-            cache.base_resouce.library_manager_set.add(id)
-            if handle_premise.handle_in_library_office(id) or handle_premise.handle_in_library(id):
-                cache.base_resouce.library_manager_now += 1
-                cache.base_resouce.work_people_now += 1
@@ -0,0 +1,196 @@
+import numpy
+import datetime
+from typing import Dict, List, Tuple
+from Script.Core import cache_control, game_type, rng_handle
+from Script.Config import game_config
+
+cache: game_type.Cache = cache_control.cache
+""" 游戏缓存数据 """
+
+threshold_array_data: Dict[str, Tuple[numpy.ndarray, numpy.ndarray, str]] = {}
+"""
+转换为数组的属性分段表，首次使用时生成
+分段表名:(分段上界数组, 各分段的值数组, searchsorted的side参数)
+"""
+time_value_field_tuple: Tuple[str] = ("sleep_point", "urinate_point", "hunger_point")
+""" 随时间增加的角色数值字段 """
+sleep_point_minute: int = 6
+""" 每增加1点困倦值所需的分钟数 """
+sex_skip_status_data: Dict[int, set] = {0: {2, 4, 7, 8}, 1: {3}}
+""" 各性别不存在的状态id 性别:状态id集合 """
+
+
+class CharacterArray:
+    """角色数值的结构体数组，以角色为行、字段为列，一次性批量计算全部角色"""
+
+    def __init__(self, character_id_list: List[int]):
+        """
+        按角色id列表建立结构体数组
+        Keyword arguments:
+        character_id_list -- 角色id列表
+        """
+        self.character_id_list: List[int] = list(character_id_list)
+        """ 数组行对应的角色id """
+        self.value_data: Dict[str, numpy.ndarray] = {}
+        """ 普通数值字段 字段名:数值数组 """
+        self.status_id_list: List[int] = []
+        """ 状态矩阵列对应的状态id """
+        self.status_array: numpy.ndarray = None
+        """ 状态矩阵 角色行:状态列 """
+
+    def gather_value(self, field: str) -> numpy.ndarray:
+        """
+        从角色对象读取指定数值字段
+        Keyword arguments:
+        field -- 字段名
+        Return arguments:
+        numpy.ndarray -- 数值数组
+        """
+        self.value_data[field] = numpy.array(
+            [getattr(cache.character_data[character_id], field) for character_id in self.character_id_list],
+            dtype=numpy.int64,
+        )
+        return self.value_data[field]
+
+    def scatter_value(self, field: str):
+        """
+        将指定数值字段写回角色对象
+        Keyword arguments:
+        field -- 字段名
+        """
+        for character_id, value in zip(self.character_id_list, self.value_data[field].tolist()):
+            setattr(cache.character_data[character_id], field, value)
+
+    def gather_status(self, status_id_list: List[int]) -> numpy.ndarray:
+        """
+        从角色对象读取状态矩阵
+        Keyword arguments:
+        status_id_list -- 状态id列表
+        Return arguments:
+        numpy.ndarray -- 状态矩阵
+        """
+        self.status_id_list = list(status_id_list)
+        self.status_array = numpy.array(
+            [
+                [cache.character_data[character_id].status_data.get(status_id, 0) for status_id in self.status_id_list]
+                for character_id in self.character_id_list
+            ],
+            dtype=numpy.float64,
+        ).reshape(len(self.character_id_list), len(self.status_id_list))
+        return self.status_array
+
+    def get_sex_mask(self) -> numpy.ndarray:
+        """
+        获取状态矩阵中各角色性别下存在的状态
+        Return arguments:
+        numpy.ndarray -- 布尔矩阵，存在的状态为True
+        """
+        mask = numpy.ones(self.status_array.shape, dtype=bool)
+        sex_array = self.gather_value("sex")
+        for sex, skip_set in sex_skip_status_data.items():
+            skip_col = numpy.isin(self.status_id_list, sorted(skip_set))
+            mask[numpy.ix_(sex_array == sex, skip_col)] = False
+        return mask
+
+
+def get_threshold_value_array(table_name: str, value_array: numpy.ndarray) -> numpy.ndarray:
+    """
+    批量按属性分段表获取数值所在分段的值，同attr_calculation.get_threshold_value
+    Keyword arguments:
+    table_name -- 分段表名
+    value_array -- 数值数组
+    Return arguments:
+    numpy.ndarray -- 各数值所在分段的值
+    """
+    if table_name not in threshold_array_data:
+        upper_list, value_list, include_upper = game_config.config_threshold_table_data[table_name]
+        threshold_array_data[table_name] = (
+            numpy.array(upper_list, dtype=numpy.float64),
+            numpy.array(value_list),
+            "left" if include_upper else "right",
+        )
+    upper_array, table_value_array, side = threshold_array_data[table_name]
+    return table_value_array[numpy.searchsorted(upper_array, value_array, side=side)]
+
+
+def get_ability_level_array(value_array: numpy.ndarray) -> numpy.ndarray:
+    """
+    批量按数值评定数字等级
+    Keyword arguments:
+    value_array -- 数值数组
+    Return arguments:
+    numpy.ndarray -- 等级数组
+    """
+    return get_threshold_value_array("ability_level", value_array)
+
+
+def get_juel_array(value_array: numpy.ndarray) -> numpy.ndarray:
+    """
+    批量按状态等级计算宝珠的最后值
+    Keyword arguments:
+    value_array -- 状态数值数组
+    Return arguments:
+    numpy.ndarray -- 宝珠值数组
+    """
+    adjust = get_threshold_value_array("ability_adjust", get_ability_level_array(value_array))
+    return numpy.rint(adjust * value_array).astype(numpy.int64)
+
+
+def get_minute_count(now_time: datetime.datetime) -> int:
+    """
+    获取时间对应的总分钟数，用于计算两个时间之间跨过的整段时间
+    Keyword arguments:
+    now_time -- 时间
+    Return arguments:
+    int -- 总分钟数
+    """
+    return now_time.toordinal() * 1440 + now_time.hour * 60 + now_time.minute
+
+
+def change_value_add_as_time(character_id_list: List[int], start_time: datetime.datetime, end_time: datetime.datetime):
+    """
+    批量结算角色随时间增加的数值（困倦值/尿意值/饥饿值），游戏时间每步进一次对全部角色结算一次
+    Keyword arguments:
+    character_id_list -- 角色id列表
+    start_time -- 步进前的时间
+    end_time -- 步进后的时间
+    """
+    start_minute = get_minute_count(start_time)
+    end_minute = get_minute_count(end_time)
+    add_time = end_minute - start_minute
+    if not len(character_id_list) or add_time <= 0:
+        return
+    now_array = CharacterArray(character_id_list)
+    # 困倦值按跨过的整段时间增加，步进较短时不会因取整而一直不增加
+    sleep_point = now_array.gather_value("sleep_point")
+    sleep_point += end_minute // sleep_point_minute - start_minute // sleep_point_minute
+    # 尿意值与饥饿值增加步进时间的0.8~1.2倍，随机数取自存档的随机流
+    value_random = numpy.random.default_rng(rng_handle.get_random("value_add_as_time").getrandbits(64))
+    for field in ("urinate_point", "hunger_point"):
+        now_value = now_array.gather_value(field)
+        now_value += numpy.rint(add_time * value_random.uniform(0.8, 1.2, len(now_value))).astype(numpy.int64)
+    for field in time_value_field_tuple:
+        now_array.scatter_value(field)
+
+
+def settle_juel(character_id_list: List[int]):
+    """
+    批量将角色的状态值结算为珠，并清零状态值
+    Keyword arguments:
+    character_id_list -- 角色id列表
+    """
+    if not len(character_id_list):
+        return
+    status_id_list = sorted(game_config.config_character_state_type_data[0])
+    now_array = CharacterArray(character_id_list)
+    status_array = now_array.gather_status(status_id_list)
+    mask = now_array.get_sex_mask()
+    juel_array = get_juel_array(status_array)
+    # 只写回状态值不为0的格子，为0的状态清零前后不变
+    row_array, col_array = numpy.nonzero(mask & (status_array != 0))
+    for row, col, juel in zip(row_array.tolist(), col_array.tolist(), juel_array[row_array, col_array].tolist()):
+        character_data: game_type.Character = cache.character_data[now_array.character_id_list[row]]
+        status_id = status_id_list[col]
+        character_data.status_data[status_id] = 0
+        if juel:
+            character_data.juel[status_id] += juel
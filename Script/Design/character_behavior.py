@@ -1,17 +1,19 @@
 import logging
 import random
 import datetime
-from uuid import UUID
+import multiprocessing
 from types import FunctionType
-from typing import Dict
+from typing import Dict, List, Set, Tuple
 from Script.Core import (
     cache_control,
     game_path_config,
     game_type,
     constant,
-    value_handle,
+    weight_sampler,
     get_text,
     save_handle,
+    trace_handle,
+    rng_handle,
 )
 from Script.Design import (
     settle_behavior,
@@ -24,7 +26,8 @@ from Script.Design import (
     cooking,
     attr_calculation,
     character_move,
-    pregnancy
+    pregnancy,
+    character_array,
 )
 from Script.UI.Moudle import draw
 from Script.UI.Panel import draw_event_text_panel
@@ -40,8 +43,15 @@ window_width: int = normal_config.config_normal.text_width
 """ 窗体宽度 """
 width = normal_config.config_normal.text_width
 """ 屏幕宽度 """
+fast_forward_flag: bool = False
+""" 当前是否处于快进模式 """
+decision_target_data: Dict[int, Tuple[str, bool]] = {}
+""" 决策阶段预先算出的本轮空闲npc的目标 角色id:(目标id, 是否找到目标) """
+parallel_character_min: int = 256
+""" 本轮空闲npc数达到该值时才使用进程池并行决策，人数较少时建池的开销大于并行的收益 """
 
 
+@trace_handle.trace()
 def init_character_behavior():
     """
     角色行为树总控制
@@ -51,7 +61,8 @@ def init_character_behavior():
         id_list.add(0)
         if len(cache.over_behavior_character) >= len(id_list):
             break
-        for character_id in id_list:
+        init_decision_target_data(id_list)
+        for character_id in sorted(id_list):
             if character_id in cache.over_behavior_character:
                 continue
             character_behavior(character_id, cache.game_time)
@@ -73,10 +84,7 @@ def update_cafeteria():
     """刷新食堂内食物"""
     max_people = len(cache.npc_id_got)
     # food_judge = 1
-    food_count = 0
-    for food_type in cache.restaurant_data:
-        food_list: Dict[UUID, game_type.Food] = cache.restaurant_data[food_type]
-        food_count += len(food_list)
+    food_count = cooking.get_restaurant_food_count()
     #     for food_id in food_list:
     #         food: game_type.Food = food_list[food_id]
     #         # if food.eat:
@@ -107,7 +115,7 @@ def update_recruit():
                 if id not in cache.npc_id_got:
                     wait_id_set.append(id)
             if len(wait_id_set):
-                choice_id = random.choice(wait_id_set)
+                choice_id = rng_handle.get_random("recruit").choice(wait_id_set)
                 cache.base_resouce.recruited_id.add(choice_id)
 
                 now_draw = draw.WaitDraw()
@@ -181,6 +189,85 @@ def character_behavior(character_id: int, now_time: datetime.datetime):
         # print(f"debug 后：{character_data.name}，behavior_id = {game_config.config_status[character_data.state].name}，start_time = {character_data.behavior.start_time}")
 
 
+def search_target_for_seed(character_seed: Tuple[int, str]) -> Tuple[int, str, bool]:
+    """
+    以角色独立的随机种子查找npc的可用目标，供决策阶段在进程池中调用
+    Keyword arguments:
+    character_seed -- (角色id, 随机种子)
+    Return arguments:
+    int -- 角色id
+    str -- 目标id
+    bool -- 是否找到目标
+    """
+    character_id, seed = character_seed
+    target, _, judge = search_target(
+        character_id, list(game_config.config_target.keys()), set(), {}, {}, random.Random(seed)
+    )
+    return character_id, target, judge
+
+
+def get_decision_target_list(character_seed_list: List[Tuple[int, str]], process_count: int) -> List[Tuple[int, str, bool]]:
+    """
+    为npc批量查找可用目标，进程数大于1且支持fork时在进程池中对当前数据的只读快照并行查找
+    结果与进程数无关，只由各角色的随机种子与当前数据决定
+    Keyword arguments:
+    character_seed_list -- (角色id, 随机种子)列表
+    process_count -- 进程数
+    Return arguments:
+    list -- (角色id, 目标id, 是否找到目标)列表，与输入顺序相同
+    """
+    if process_count > 1 and "fork" in multiprocessing.get_all_start_methods():
+        chunk_size = max(1, len(character_seed_list) // (process_count * 4))
+        with multiprocessing.get_context("fork").Pool(process_count) as pool:
+            return pool.map(search_target_for_seed, character_seed_list, chunk_size)
+    return [search_target_for_seed(character_seed) for character_seed in character_seed_list]
+
+
+def init_decision_target_data(id_list: Set[int]):
+    """
+    决策阶段，为本轮所有空闲的npc预先查找目标，之后按角色id顺序执行对应状态机，未开启并行决策时不做任何事
+    Keyword arguments:
+    id_list -- 本轮结算的角色id集合
+    """
+    decision_target_data.clear()
+    process_count = normal_config.config_normal.decision_process
+    if not process_count:
+        return
+    pass_seed = rng_handle.get_random("decision").getrandbits(64)
+    character_seed_list = []
+    for character_id in sorted(id_list):
+        if not character_id or character_id in cache.over_behavior_character:
+            continue
+        character_data: game_type.Character = cache.character_data[character_id]
+        if character_data.dead or character_data.state != constant.CharacterStatus.STATUS_ARDER:
+            continue
+        if character_data.behavior.start_time is None:
+            character.init_character_behavior_start_time(character_id, cache.game_time)
+        character_seed_list.append((character_id, f"{pass_seed}-{character_id}"))
+    if len(character_seed_list) < parallel_character_min:
+        process_count = 1
+    for character_id, target, judge in get_decision_target_list(character_seed_list, process_count):
+        decision_target_data[character_id] = (target, judge)
+
+
+def judge_fast_forward(character_id: int) -> bool:
+    """
+    校验角色本次是否按快进模式粗略结算
+    快进模式下玩家所在场景以外、且不是玩家交互对象、不在跟随或H中的角色按粗略模型结算
+    Keyword arguments:
+    character_id -- 角色id
+    Return arguments:
+    bool -- 是否粗略结算
+    """
+    if not fast_forward_flag or not character_id:
+        return False
+    character_data: game_type.Character = cache.character_data[character_id]
+    pl_character_data: game_type.Character = cache.character_data[0]
+    if character_data.is_follow or character_data.is_h or pl_character_data.target_character_id == character_id:
+        return False
+    return character_data.position != pl_character_data.position
+
+
 def character_target_judge(character_id: int, now_time: datetime.datetime):
     """
     查询角色可用目标活动并执行
@@ -200,13 +287,17 @@ def character_target_judge(character_id: int, now_time: datetime.datetime):
         if character_data.state not in safe_instruct:
             character_data.wait_flag = 1
 
-    target, _, judge = search_target(
-        character_id,
-        list(game_config.config_target.keys()),
-        set(),
-        premise_data,
-        target_weight_data,
-    )
+    if character_id in decision_target_data:
+        target, judge = decision_target_data.pop(character_id)
+    else:
+        target, _, judge = search_target(
+            character_id,
+            list(game_config.config_target.keys()),
+            set(),
+            premise_data,
+            target_weight_data,
+            rng_handle.get_random("behavior", character_id),
+        )
     if judge:
         target_config = game_config.config_target[target]
         state_machine_id = target_config.state_machine_id
@@ -215,6 +306,11 @@ def character_target_judge(character_id: int, now_time: datetime.datetime):
             character_data.wait_flag = 1
             # print(f"debug 前一个状态机id = ",state_machine_id,",flag变为1,character_name =",character_data.name)
         constant.handle_state_machine_data[state_machine_id](character_id)
+        # 快进模式下将行动拉长为行动块，减少决策次数，随时间增加的数值按行动时长一次结算
+        if judge_fast_forward(character_id):
+            fast_forward_block = normal_config.config_normal.fast_forward_block
+            if character_data.behavior.duration < fast_forward_block:
+                character_data.behavior.duration = fast_forward_block
         # event_draw = event.handle_event(character_id, 1)
         # if (not character_id) or (PC_character_data.target_character_id == character_id):
         #     if event_draw is not None:
@@ -231,7 +327,10 @@ def character_target_judge(character_id: int, now_time: datetime.datetime):
         if now_judge:
             cache.over_behavior_character.add(character_id)
         else:
-            next_time = game_time.get_sub_date(minute=1, old_date=start_time)
+            wait_time = 1
+            if judge_fast_forward(character_id):
+                wait_time = normal_config.config_normal.fast_forward_block
+            next_time = game_time.get_sub_date(minute=wait_time, old_date=start_time)
             cache.character_data[character_id].behavior.start_time = next_time
 
 
@@ -337,6 +436,8 @@ def judge_character_status(character_id: int, now_time: datetime.datetime) -> in
     # character_data.status[28] += hunger_time * 0.02
     # character_data.last_hunger_time = now_time
     if time_judge:
+        # 快进模式下不输出文本
+        quiet_judge = judge_fast_forward(character_id)
         # 查询当前玩家是否触发了事件
         start_event_draw = None if character_id else event.handle_event(character_id)
         event_type_now = 1
@@ -360,7 +461,7 @@ def judge_character_status(character_id: int, now_time: datetime.datetime) -> in
             if end_event_type == 2:
 
                 # 如果是父事件的话，则先输出文本
-                if "10001" in event_config.effect:
+                if "10001" in event_config.effect and not quiet_judge:
                     end_event_draw.draw()
 
                 character_data.event.event_id = end_event_id
@@ -376,13 +477,15 @@ def judge_character_status(character_id: int, now_time: datetime.datetime) -> in
             start_event_draw = draw_event_text_panel.DrawEventTextPanel(son_event_id,character_id, event_config.type)
 
         # 如果有事件则显示事件，否则显示口上
-        if start_event_draw != None:
+        if quiet_judge:
+            pass
+        elif start_event_draw != None:
             start_event_draw.draw()
         elif end_event_draw != None:
             end_event_draw.draw()
         else:
             talk.handle_talk(character_id)
-        if now_panel != None:
+        if now_panel != None and not quiet_judge:
             now_panel.draw()
             #进行一次暂停以便玩家看输出信息
             if character_id == 0:
@@ -403,12 +506,14 @@ def judge_character_status(character_id: int, now_time: datetime.datetime) -> in
     return 1
 
 
+@trace_handle.trace()
 def search_target(
     character_id: int,
     target_list: list,
     null_target: set,
     premise_data: Dict[int, int],
     target_weight_data: Dict[int, int],
+    now_random: random.Random,
 ) -> (int, int, bool):
     """
     查找可用目标
@@ -418,13 +523,14 @@ def search_target(
     null_target -- 被排除的目标
     premise_data -- 已算出的前提权重
     target_weight_data -- 已算出权重的目标列表
+    now_random -- 角色的随机流
     Return arguments:
     int -- 目标id
     int -- 目标权重
     bool -- 前提是否能够被满足
     """
     target_data = {}
-    for target in target_list:
+    for target in sorted(target_list):
         if target in null_target:
             continue
         if target in target_weight_data:
@@ -460,6 +566,7 @@ def search_target(
                         null_target,
                         premise_data,
                         target_weight_data,
+                        now_random,
                     )
                     if now_judge:
                         now_target_data.setdefault(now_target_weight, set())
@@ -480,50 +587,14 @@ def search_target(
             target_data[now_weight].add(target)
             target_weight_data[target] = now_weight
         else:
-            now_value_weight = value_handle.get_rand_value_for_value_region(now_target_data.keys())
+            now_value_weight = weight_sampler.choice_weight(sorted(now_target_data), now_random)
             target_data.setdefault(now_weight, set())
-            target_data[now_weight].add(random.choice(list(now_target_data[now_value_weight])))
+            target_data[now_weight].add(now_random.choice(sorted(now_target_data[now_value_weight])))
     if len(target_data):
-        value_weight = value_handle.get_rand_value_for_value_region(target_data.keys())
-        return random.choice(list(target_data[value_weight])), value_weight, 1
+        value_weight = weight_sampler.choice_weight(sorted(target_data), now_random)
+        return now_random.choice(sorted(target_data[value_weight])), value_weight, 1
     return "", 0, 0
 
-def settle_character_juel(character_id: int) -> int:
-    """
-    校验角色状态并结算为珠
-    Keyword arguments:
-    character_id -- 角色id
-    Return arguments:
-    bool -- 本次update时间切片内活动是否已完成
-    """
-    character_data: game_type.Character = cache.character_data[character_id]
-    type_set = game_config.config_character_state_type_data[0]
-    for status_id in type_set:
-        # print("status_type :",status_type)
-        # print("status_id :",status_id)
-        # print("game_config.config_character_state[status_id] :",game_config.config_character_state[status_id])
-        # print("game_config.config_character_state[status_id].name :",game_config.config_character_state[status_id].name)
-        #去掉性别里不存在的状态
-        if character_data.sex == 0:
-            if status_id in {2, 4, 7, 8}:
-                continue
-        elif character_data.sex == 1:
-            if status_id == 3:
-                continue
-        status_value = 0
-        #获得状态值并清零
-        if status_id in character_data.status_data:
-            status_value = character_data.status_data[status_id]
-            cache.character_data[character_id].status_data[status_id] = 0
-            # print("status_value :",status_value)
-        #只要状态值不为0就结算为对应珠
-        if status_value != 0:
-            add_juel = attr_calculation.get_juel(status_value)
-            character_data.juel[status_id] += add_juel
-            # juel_text = game_config.config_juel[status_id].name
-            # print("宝珠名：",juel_text,"。增加了 :",add_juel)
-    return 1
-
 def judge_character_follow(character_id: int) -> int:
     """
     维持跟随状态
@@ -588,11 +659,21 @@ def judge_character_pregnancy(character_id: int) -> int:
         now_scene_str = map_handle.get_map_system_path_str_for_list(now_position)
         now_scene_data = cache.scene_data[now_scene_str]
         if "Inpatient_Department" not in now_scene_data.scene_tag:
-            to_Inpatient_Department = map_handle.get_map_system_path_for_str(random.choice(constant.place_data["to_Inpatient_Department"]))
+            to_Inpatient_Department = map_handle.get_map_system_path_for_str(rng_handle.get_random("behavior", character_id).choice(constant.place_data["to_Inpatient_Department"]))
             map_handle.character_move_scene(character_data.position, to_Inpatient_Department, character_id)
 
     return 1
 
+def update_value_add_as_time(add_time: int):
+    """
+    游戏时间步进后，全员批量结算随时间增加的数值（困倦值/尿意值/饥饿值）
+    Keyword arguments:
+    add_time -- 游戏步进的时间
+    """
+    start_time = cache.game_time - datetime.timedelta(minutes=add_time)
+    character_array.change_value_add_as_time(sorted(cache.npc_id_got | {0}), start_time, cache.game_time)
+
+
 def update_sleep():
     """
     玩家睡觉时的刷新\n
@@ -607,11 +688,12 @@ def update_sleep():
     now_draw.text = "\n博士入睡，开始结算各种数据\n"
     now_draw.draw()
 
+    # 结算数值为珠，全员批量进行
+    character_array.settle_juel(sorted(cache.npc_id_got))
+
     # 角色刷新
     for character_id in cache.npc_id_got:
         character_data: game_type.Character = cache.character_data[character_id]
-        # 结算数值为珠
-        settle_character_juel(character_id)
         # 清零射精槽
         if character_id == 0:
             character_data.eja_point = 0
@@ -619,7 +701,7 @@ def update_sleep():
             # 清零H状态
             character_data.h_state = attr_calculation.get_h_state_zero()
             # 清零并随机重置生气程度
-            character_data.angry_point = random.randrange(1,35)
+            character_data.angry_point = rng_handle.get_random("behavior", character_id).randrange(1,35)
             # 清零H被撞破的flag
             character_data.action_info.h_interrupt = 0
             # 新：改为洗澡时清零（清零污浊状态）
@@ -656,7 +738,7 @@ def update_new_day():
             # 否则随机当天的娱乐活动
             else:
                 entertainment_list = [i for i in game_config.config_entertainment]
-                character_data.entertainment.entertainment_type = random.choice(entertainment_list)
+                character_data.entertainment.entertainment_type = rng_handle.get_random("behavior", character_id).choice(entertainment_list)
             # 刷新生理周期
             pregnancy.update_reproduction_period(character_id)
 
@@ -674,7 +756,7 @@ def update_base_resouce():
     无
     """
     # 刷新新病人数量，已治愈病人数量和治疗收入归零
-    cache.base_resouce.patient_now = random.randint(1,cache.base_resouce.patient_max)
+    cache.base_resouce.patient_now = rng_handle.get_random("base").randint(1,cache.base_resouce.patient_max)
     cache.base_resouce.patient_cured = 0
     cache.base_resouce.cure_income = 0
     cache.base_resouce.all_income = 0
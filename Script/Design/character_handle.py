@@ -1,10 +1,9 @@
-import random
 import math
 import numpy
 import datetime
 from Script.Core import (
     cache_control,
-    value_handle,
+    weight_sampler,
     constant,
     game_type,
 )
@@ -129,10 +128,8 @@ def create_random_npc(id) -> dict:
     cache.random_npc_list.append(random_npc_new_data)
 
 
-sex_weight_data = game_config.config_random_npc_sex_region
-sex_weight_max = sum([sex_weight_data[weight] for weight in sex_weight_data])
-sex_weight_regin_data = value_handle.get_region_list(sex_weight_data)
-sex_weight_regin_list = list(map(int, sex_weight_regin_data.keys()))
+sex_weight_sampler = weight_sampler.get_sampler_for_weight(game_config.config_random_npc_sex_region)
+""" 随机npc性别抽样器 """
 
 
 def get_rand_npc_sex() -> int:
@@ -141,9 +138,7 @@ def get_rand_npc_sex() -> int:
     Return arguments:
     int -- 性别id
     """
-    now_weight = random.randint(0, sex_weight_max - 1)
-    weight_regin = value_handle.get_next_value_for_list(now_weight, sex_weight_regin_list)
-    return sex_weight_regin_data[weight_regin]
+    return sex_weight_sampler.sample()
 
 
 def init_character_dormitory():
@@ -1,13 +1,18 @@
 import random
 import math
 import uuid
-from typing import Dict
+from typing import Dict, List
 from Script.Core import game_type,cache_control
 from Script.Config import game_config
 from Script.Design import attr_calculation
 
 cache: game_type.Cache = cache_control.cache
 """ 游戏缓存数据 """
+underwear_data: Dict[int, Dict[int, List[int]]] = {}
+"""
+按标签分类的内衣列表，初次随机内衣时遍历服装表生成，只读
+服装类型(6胸衣/9内裤):标签(0正常/1童装/2情趣):服装id列表
+"""
 
 
 def get_npc_cloth(character_id: int):
@@ -29,6 +34,23 @@ def get_npc_cloth(character_id: int):
             character_data.cloth.cloth_wear[type].append(cloth_id)
         get_underwear(character_id)
 
+
+def get_underwear_data() -> Dict[int, Dict[int, List[int]]]:
+    """
+    获取按标签分类的内衣列表
+    Return arguments:
+    Dict[int, Dict[int, List[int]]] -- 服装类型:标签:服装id列表
+    """
+    if not len(underwear_data):
+        for clothing_type in {6, 9}:
+            underwear_data[clothing_type] = {0: [], 1: [], 2: []}
+        for cloth_id in game_config.config_clothing_tem:
+            cloth = game_config.config_clothing_tem[cloth_id]
+            if cloth.clothing_type in underwear_data and cloth.tag in underwear_data[cloth.clothing_type]:
+                underwear_data[cloth.clothing_type][cloth.tag].append(cloth_id)
+    return underwear_data
+
+
 def get_underwear(character_id: int):
     """
     随机穿内衣，包括胸罩和内裤
@@ -40,39 +62,24 @@ def get_underwear(character_id: int):
     character_data = cache.character_data[character_id]
     # 60,幼女,61,萝莉,62,少女,63,成年,64,长生者
 
-    # 遍历全衣服，以下分别是正常/童装/情趣的胸罩和内裤
-    bra_nor_list = []
-    bra_loli_list = []
-    bra_H_list = []
-    pan_nor_list = []
-    pan_loli_list = []
-    pan_H_list = []
-    for cloth_id in game_config.config_clothing_tem:
-        cloth = game_config.config_clothing_tem[cloth_id]
-        if cloth.clothing_type == 6:
-            if cloth.tag == 0:
-                bra_nor_list.append(cloth_id)
-            elif cloth.tag == 1:
-                bra_loli_list.append(cloth_id)
-            elif cloth.tag == 2:
-                bra_H_list.append(cloth_id)
-        elif cloth.clothing_type == 9:
-            if cloth.tag == 0:
-                pan_nor_list.append(cloth_id)
-            elif cloth.tag == 1:
-                pan_loli_list.append(cloth_id)
-            elif cloth.tag == 2:
-                pan_H_list.append(cloth_id)
+    # 以下分别是正常/童装/情趣的胸罩和内裤
+    now_underwear_data = get_underwear_data()
+    bra_nor_list = now_underwear_data[6][0]
+    bra_loli_list = now_underwear_data[6][1]
+    bra_H_list = now_underwear_data[6][2]
+    pan_nor_list = now_underwear_data[9][0]
+    pan_loli_list = now_underwear_data[9][1]
+    pan_H_list = now_underwear_data[9][2]
 
     # 解锁了情趣内衣的情况下，对2级攻略以上的角色增加情趣内衣
-        for i in {11,12,13,16,17,18}:
-            if character_data.talent[i]:
-                if cache.character_data[0].pl_collection.collection_bonus[102]:
-                    bra_nor_list += bra_H_list
-                    bra_loli_list += bra_H_list
-                    pan_nor_list += pan_H_list
-                    pan_loli_list += pan_H_list
-                    break
+    for i in {11,12,13,16,17,18}:
+        if character_data.talent[i]:
+            if cache.character_data[0].pl_collection.collection_bonus[102]:
+                bra_nor_list = bra_nor_list + bra_H_list
+                bra_loli_list = bra_loli_list + bra_H_list
+                pan_nor_list = pan_nor_list + pan_H_list
+                pan_loli_list = pan_loli_list + pan_H_list
+                break
 
     # 判断是否当前已经穿了胸衣和内裤
     if not len(character_data.cloth.cloth_wear[6]):
@@ -1,9 +1,8 @@
-import random
 import uuid
 from types import FunctionType
 from typing import Dict, Set
 from Script.Core.game_type import Recipes, Food
-from Script.Core import cache_control, value_handle, game_type, get_text
+from Script.Core import cache_control, value_handle, game_type, get_text, rng_handle
 from Script.Config import game_config
 
 cache: game_type.Cache = cache_control.cache
@@ -130,9 +129,9 @@ def create_rand_food(food_id: str, food_weight=-1, food_quality=-1) -> Food:
     Food -- 食物对象
     """
     if food_weight == -1:
-        food_weight = random.randint(1, 1000000)
+        food_weight = rng_handle.get_random("cooking").randint(1, 1000000)
     if food_quality == -1:
-        food_quality = random.randint(0, 4)
+        food_quality = rng_handle.get_random("cooking").randint(0, 4)
     return create_food(food_id, food_quality, food_weight)
 
 
@@ -207,13 +206,12 @@ def cook(food_data: Dict[str, Food], recipe_id: int, cook_level: int, maker: str
 
 
 def init_restaurant_data():
-    """初始化餐馆内的食物数据"""
+    """初始化餐馆内的食物数据，只记录各菜谱的份数，食物对象在被取走时才创建"""
     cache.restaurant_data = {}
     max_people = len(cache.npc_id_got)
     cook_index = 0
     while 1:
-        recipes_id = random.randint(0, len(cache.recipe_data) - 1)
-        food_list = {}
+        recipes_id = rng_handle.get_random("cooking").randint(0, len(cache.recipe_data) - 1)
         # recipes = cache.recipe_data[recipes_id]
         # food_judge = True
         # for food_id in recipes.base:
@@ -246,9 +244,8 @@ def init_restaurant_data():
         #     food_list[now_food.id] = now_food
         # if not food_judge:
         #     continue
-        new_food = cook(food_list, recipes_id, 5, "")
-        cache.restaurant_data.setdefault(str(recipes_id), {})
-        cache.restaurant_data[str(recipes_id)][new_food.uid] = new_food
+        cache.restaurant_data.setdefault(str(recipes_id), 0)
+        cache.restaurant_data[str(recipes_id)] += 1
         # for food_id in food_list:
         #     now_food = food_list[food_id]
         #     if now_food.weight <= 0:
@@ -260,6 +257,31 @@ def init_restaurant_data():
             break
 
 
+def take_restaurant_food(food_id: str) -> Food:
+    """
+    从食堂取走一份指定菜谱的食物，并为其创建食物对象
+    Keyword arguments:
+    food_id -- 食堂内的菜谱id
+    Return arguments:
+    Food -- 食物对象，已售罄时为None
+    """
+    if food_id not in cache.restaurant_data:
+        return None
+    cache.restaurant_data[food_id] -= 1
+    if cache.restaurant_data[food_id] <= 0:
+        del cache.restaurant_data[food_id]
+    return cook({}, int(food_id), 5, "")
+
+
+def get_restaurant_food_count() -> int:
+    """
+    获取食堂内食物的总份数
+    Return arguments:
+    int -- 份数
+    """
+    return sum(cache.restaurant_data.values())
+
+
 def init_makefood_data():
     """初始化做饭区内的食物数据"""
     recipe_data = cache.recipe_data
@@ -351,13 +373,8 @@ def get_restaurant_food_type_list_buy_food_type(food_type: str) -> Dict[uuid.UUI
     """
     food_list = {}
     for food_id in cache.restaurant_data:
-        if not len(cache.restaurant_data[food_id]):
-            continue
         if food_type == _("主食"):
-            now_food_uid = list(cache.restaurant_data[food_id].keys())[0]
-            now_food: game_type.Food = cache.restaurant_data[food_id][now_food_uid]
-            if now_food.recipe != -1:
-                food_list[food_id] = cache.recipe_data[int(food_id)].name
+            food_list[food_id] = cache.recipe_data[int(food_id)].name
         # elif food_type == _("零食"):
         #     now_food_uid = list(cache.restaurant_data[food_id].keys())[0]
         #     now_food: game_type.Food = cache.restaurant_data[food_id][now_food_uid]
@@ -1,5 +1,4 @@
-import random
-from Script.Core import cache_control, game_type, value_handle, constant
+from Script.Core import cache_control, game_type, weight_sampler, constant, trace_handle, rng_handle
 from Script.Design import map_handle
 from Script.UI.Panel import draw_event_text_panel
 from Script.Config import normal_config, game_config
@@ -8,6 +7,7 @@ cache: game_type.Cache = cache_control.cache
 """ 游戏缓存数据 """
 
 
+@trace_handle.trace()
 def handle_event(character_id: int) -> (draw_event_text_panel.DrawEventTextPanel, str):
     """
     处理状态触发事件
@@ -24,7 +24,7 @@ def handle_event(character_id: int) -> (draw_event_text_panel.DrawEventTextPanel
     if (
         behavior_id in game_config.config_event_status_data
     ):
-        for event_id in game_config.config_event_status_data[behavior_id]:
+        for event_id in sorted(game_config.config_event_status_data[behavior_id]):
             now_weight = 1
             event_config = game_config.config_event[event_id]
             if len(event_config.premise):
@@ -48,7 +48,9 @@ def handle_event(character_id: int) -> (draw_event_text_panel.DrawEventTextPanel
                 now_event_data[now_weight].add(event_id)
     now_event_id = ""
     if now_event_data:
-        event_weight = value_handle.get_rand_value_for_value_region(list(now_event_data.keys()))
-        now_event_id = random.choice(list(now_event_data[event_weight]))
+        event_random = rng_handle.get_random("event")
+        event_weight = weight_sampler.choice_weight(sorted(now_event_data), event_random)
+        now_event_id = event_random.choice(sorted(now_event_data[event_weight]))
     if now_event_id != "":
+        event_config = game_config.config_event[now_event_id]
         return draw_event_text_panel.DrawEventTextPanel(now_event_id,character_id, event_config.type)
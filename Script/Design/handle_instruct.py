@@ -2,11 +2,11 @@ import random
 import time
 import queue
 from functools import wraps
-from typing import Set, List
+from typing import Dict, Set, List
 from types import FunctionType
 from threading import Thread
 from Script.Core import constant, constant_promise, cache_control, game_type, get_text, save_handle, flow_handle
-from Script.Design import update, character, attr_calculation, character_handle
+from Script.Design import update, character, attr_calculation, character_handle, handle_premise
 from Script.UI.Panel import normal_panel, see_character_info_panel, see_save_info_panel
 from Script.Config import normal_config, game_config
 from Script.UI.Moudle import draw
@@ -19,6 +19,10 @@ width: int = normal_config.config_normal.text_width
 """ 屏幕宽度 """
 instruct_queue = queue.Queue()
 """ 待处理的指令队列 """
+instruct_judge_key: tuple = ()
+""" 指令可用性缓存对应的玩家前提缓存状态 """
+instruct_judge_data: Dict[int, bool] = {}
+""" 指令可用性缓存 指令id:是否可用 """
 
 
 def init_instruct_handle_thread():
@@ -45,6 +49,34 @@ def handle_instruct(instruct: int):
     instruct_queue.put(instruct)
     if instruct in constant.instruct_premise_data:
         constant.handle_instruct_data[instruct]()
+    handle_premise.refresh_player_premise()
+
+
+def get_available_instruct_list(instruct_list: List[int]) -> List[int]:
+    """
+    筛选出当前可用的指令，玩家前提缓存未失效时直接使用上次的判断结果
+    Keyword arguments:
+    instruct_list -- 指令id列表
+    Return arguments:
+    List[int] -- 可用的指令id列表
+    """
+    global instruct_judge_key
+    now_key = handle_premise.get_player_premise_key()
+    if now_key != instruct_judge_key:
+        instruct_judge_key = now_key
+        instruct_judge_data.clear()
+    available_list = []
+    for instruct in instruct_list:
+        if instruct not in instruct_judge_data:
+            now_judge = True
+            for premise in constant.instruct_premise_data.get(instruct, ()):
+                if not handle_premise.handle_player_premise(premise):
+                    now_judge = False
+                    break
+            instruct_judge_data[instruct] = now_judge
+        if instruct_judge_data[instruct]:
+            available_list.append(instruct)
+    return available_list
 
 
 def add_instruct(instruct_id: int, instruct_type: int, name: str, premise_set: Set):
@@ -353,7 +385,7 @@ def handle_sleep():
     character_data.behavior.behavior_id = constant.Behavior.SLEEP
     character_data.state = constant.CharacterStatus.STATUS_SLEEP
     cache.wframe_mouse.w_frame_skip_wait_mouse = 1
-    update.game_update_flow(480)
+    update.game_fast_forward_flow(480)
 
 
 @add_instruct(
@@ -696,7 +728,7 @@ def handle_wait_6_hour():
     character_data.state = constant.CharacterStatus.STATUS_WAIT
     character_data.behavior.duration = 360
     cache.wframe_mouse.w_frame_skip_wait_mouse = 1
-    update.game_update_flow(360)
+    update.game_fast_forward_flow(360)
 
 
 @add_instruct(
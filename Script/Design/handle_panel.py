@@ -1,6 +1,6 @@
 from functools import wraps
 from types import FunctionType
-from Script.Core import constant
+from Script.Core import constant, trace_handle
 
 
 def add_panel(panel: int) -> FunctionType:
@@ -13,6 +13,7 @@ def add_panel(panel: int) -> FunctionType:
     """
 
     def decoraror(func):
+        @trace_handle.trace(func.__qualname__)
         @wraps(func)
         def return_wrapper(*args, **kwargs):
             return func(*args, **kwargs)
@@ -1,15 +1,21 @@
 import math
 import datetime
-from typing import List
+from typing import Dict, List
 from uuid import UUID
 from functools import wraps
 from types import FunctionType
-from Script.Core import cache_control, constant, constant_promise, game_type
+from Script.Core import cache_control, constant, constant_promise, game_type, dispatch_profile
 from Script.Design import map_handle, game_time, attr_calculation, character
 from Script.Config import game_config
 
 cache: game_type.Cache = cache_control.cache
 """ 游戏缓存数据 """
+player_premise_version: int = 0
+""" 玩家前提缓存的版本号，结算、移动、时间推进与执行指令后递增 """
+player_premise_key: tuple = ()
+""" 玩家前提缓存对应的状态 """
+player_premise_data: Dict[str, int] = {}
+""" 玩家前提缓存 前提id:前提权重加成 """
 
 
 def add_premise(premise: str) -> FunctionType:
@@ -26,7 +32,7 @@ def add_premise(premise: str) -> FunctionType:
         def return_wrapper(*args, **kwargs):
             return func(*args, **kwargs)
 
-        constant.handle_premise_data[premise] = return_wrapper
+        constant.handle_premise_data[premise] = dispatch_profile.wrap("premise", premise, return_wrapper)
         return return_wrapper
 
     return decoraror
@@ -47,6 +53,46 @@ def handle_premise(premise: str, character_id: int) -> int:
         return 0
 
 
+def refresh_player_premise():
+    """使玩家前提缓存失效，玩家或交互对象的状态被改变后调用"""
+    global player_premise_version
+    player_premise_version += 1
+
+
+def get_player_premise_key() -> tuple:
+    """
+    获取玩家前提缓存依赖的状态，除版本号外还包括时间、位置、交互对象与玩家对象本身(读档后会替换)
+    Return arguments:
+    tuple -- 缓存状态
+    """
+    character_data: game_type.Character = cache.character_data[0]
+    return (
+        player_premise_version,
+        cache.game_time,
+        tuple(character_data.position),
+        character_data.target_character_id,
+        id(character_data),
+    )
+
+
+def handle_player_premise(premise: str) -> int:
+    """
+    调用前提id对应的前提处理函数判断玩家，状态未改变时直接返回上次的结果
+    Keyword arguments:
+    premise -- 前提id
+    Return arguments:
+    int -- 前提权重加成
+    """
+    global player_premise_key
+    now_key = get_player_premise_key()
+    if now_key != player_premise_key:
+        player_premise_key = now_key
+        player_premise_data.clear()
+    if premise not in player_premise_data:
+        player_premise_data[premise] = handle_premise(premise, 0)
+    return player_premise_data[premise]
+
+
 @add_premise(constant_promise.Premise.EAT_TIME)
 def handle_eat_time(character_id: int) -> int:
     """
@@ -1382,7 +1428,7 @@ def handle_instruct_judge_low_obscenity(character_id: int) -> int:
     """
     character_data: game_type.Character = cache.character_data[character_id]
     if character_data.target_character_id:
-        if character.calculation_instuct_judege(0, character_data.target_character_id, "初级骚扰"):
+        if character.calculation_instuct_judege(0, character_data.target_character_id, "初级骚扰", False):
             return 1
     return 0
 
@@ -1398,7 +1444,7 @@ def handle_instruct_judge_high_obscenity(character_id: int) -> int:
     """
     character_data: game_type.Character = cache.character_data[character_id]
     if character_data.target_character_id:
-        if character.calculation_instuct_judege(0, character_data.target_character_id, "严重骚扰"):
+        if character.calculation_instuct_judege(0, character_data.target_character_id, "严重骚扰", False):
             return 1
     return 0
 
@@ -1414,7 +1460,7 @@ def handle_instruct_judge_h(character_id: int) -> int:
     """
     character_data: game_type.Character = cache.character_data[character_id]
     if character_data.target_character_id:
-        if character.calculation_instuct_judege(0, character_data.target_character_id, "H模式"):
+        if character.calculation_instuct_judege(0, character_data.target_character_id, "H模式", False):
             return 1
     return 0
 
@@ -1,6 +1,6 @@
 from functools import wraps
 from types import FunctionType
-from Script.Core import constant
+from Script.Core import constant, dispatch_profile
 
 
 def handle_state_machine(state_machine_id: int, character_id: int):
@@ -26,7 +26,9 @@ def add_state_machine(state_machine_id: int):
         def return_wrapper(*args, **kwargs):
             return func(*args, **kwargs)
 
-        constant.handle_state_machine_data[state_machine_id] = return_wrapper
+        constant.handle_state_machine_data[state_machine_id] = dispatch_profile.wrap(
+            "state_machine", state_machine_id, return_wrapper
+        )
         return return_wrapper
 
     return decorator
@@ -97,6 +97,10 @@ def character_move_scene(old_scene_path: list, new_scene_path: list, character_i
         cache.scene_data[new_scene_path_str].character_list.add(character_id)
     cache.character_data[character_id].behavior.move_src = old_scene_path
     cache.character_data[character_id].behavior.move_target = new_scene_path
+    if character_id:
+        from Script.Design import basement
+
+        basement.update_character_work_people(character_id)
 
 
 def get_map_system_path_str_for_list(now_list: list) -> str:
@@ -1,5 +1,4 @@
 import math
-import random
 import datetime
 from uuid import UUID
 from types import FunctionType
@@ -12,6 +11,7 @@ from Script.Core import (
     value_handle,
     get_text,
     save_handle,
+    rng_handle,
 )
 from Script.Design import (
     settle_behavior,
@@ -72,7 +72,7 @@ def check_fertilization(character_id: int):
             return 0
     # 随机数判断是否受精
     if character_data.pregnancy.fertilization_rate:
-        if random.randint(1,100) <= character_data.pregnancy.fertilization_rate:
+        if rng_handle.get_random("pregnancy").randint(1,100) <= character_data.pregnancy.fertilization_rate:
             draw_text = f"\n精子与{character_data.name}的卵子结合，成功在子宫里着床了\n"
             draw_text += f"\n{character_data.name}获得了[受精]\n"
             character_data.talent[20] = 1
@@ -1,9 +1,9 @@
 import datetime
-import time, random
+import time
 from functools import wraps
 from types import FunctionType
-from Script.Core import cache_control, constant, game_type, get_text, text_handle
-from Script.Design import attr_text, attr_calculation, handle_premise
+from Script.Core import cache_control, constant, game_type, get_text, text_handle, trace_handle, dispatch_profile
+from Script.Design import attr_text, attr_calculation, handle_premise, settle_table, character
 from Script.UI.Moudle import panel, draw
 from Script.Config import game_config, normal_config
 from Script.UI.Panel import ejaculation_panel
@@ -16,6 +16,7 @@ _: FunctionType = get_text._
 """ 翻译api """
 
 
+@trace_handle.trace()
 def handle_settle_behavior(character_id: int, now_time: datetime.datetime, event_flag=int):
     """
     处理结算角色行为
@@ -24,14 +25,15 @@ def handle_settle_behavior(character_id: int, now_time: datetime.datetime, event
     now_time -- 结算时间
     event_flag -- 事件结算变量，0不指令，1先指令后事件，2不事件
     """
+    handle_premise.refresh_player_premise()
     now_character_data: game_type.Character = cache.character_data[character_id]
+    character.refresh_character_version(character_id)
+    character.refresh_character_version(now_character_data.target_character_id)
     player_character_data: game_type.Character = cache.character_data[0]
     status_data = game_type.CharacterStatusChange()
     start_time = now_character_data.behavior.start_time
     add_time = int((now_time - start_time).seconds / 60)
 
-    # 结算角色随时间增加的一些数值（困倦值/尿意值）
-    change_character_value_add_as_time(character_id, add_time)
     # 结算角色的持续状态
     change_character_persistent_state(character_id, now_time, add_time)
 
@@ -39,8 +41,7 @@ def handle_settle_behavior(character_id: int, now_time: datetime.datetime, event
     if event_flag:  # 在事件的开始结算中不结算以下内容
         # 进行一段结算
         if behavior_id in game_config.config_behavior_effect_data:
-            for effect_id in game_config.config_behavior_effect_data[behavior_id]:
-                constant.settle_behavior_effect_data[effect_id](character_id, add_time, status_data, now_time)
+            settle_table.handle_behavior_effect(behavior_id, character_id, add_time, status_data, now_time)
         # 进行二段结算
         check_second_effect(character_id, status_data)
         # 结算上次进行聊天的时间，以重置聊天计数器#
@@ -274,7 +275,9 @@ def add_settle_behavior_effect(behavior_effect_id: int):
         def return_wrapper(*args, **kwargs):
             return func(*args, **kwargs)
 
-        constant.settle_behavior_effect_data[behavior_effect_id] = return_wrapper
+        constant.settle_behavior_effect_data[behavior_effect_id] = dispatch_profile.wrap(
+            "settle", behavior_effect_id, return_wrapper
+        )
         return return_wrapper
 
     return decorator
@@ -292,7 +295,9 @@ def add_settle_second_behavior_effect(second_behavior_effect_id: int):
         def return_wrapper(*args, **kwargs):
             return func(*args, **kwargs)
 
-        constant.settle_second_behavior_effect_data[second_behavior_effect_id] = return_wrapper
+        constant.settle_second_behavior_effect_data[second_behavior_effect_id] = dispatch_profile.wrap(
+            "second_settle", second_behavior_effect_id, return_wrapper
+        )
         return return_wrapper
 
     return decorator
@@ -368,40 +373,6 @@ def change_character_talkcount_for_time(character_id: int, now_time: datetime.da
     # print("target_data.action_info.talk_count :",target_data.action_info.talk_count)
 
 
-def change_character_value_add_as_time(character_id: int, add_time: int):
-    """
-    结算角色随时间增加的一些数值（困倦值/尿意值）
-    Keyword arguments:
-    character_id -- 角色id
-    add_time -- 距离上次结算过去的时间
-    """
-    now_character_data: game_type.Character = cache.character_data[character_id]
-    player_character_data: game_type.Character = cache.character_data[0]
-    target_data: game_type.Character = cache.character_data[now_character_data.target_character_id]
-
-    # 结算困倦值
-    add_sleep = int(add_time / 6)
-    now_character_data.sleep_point += add_sleep
-
-    # 结算尿意值
-    add_urinate = random.randint(int(add_time * 0.8), int(add_time * 1.2))
-    now_character_data.urinate_point += add_urinate
-
-    # 结算饥饿值
-    add_hunger = random.randint(int(add_time * 0.8), int(add_time * 1.2))
-    now_character_data.hunger_point += add_hunger
-
-    # 给无法自由行动的交互对象结算
-    if character_id == 0 and player_character_data.target_character_id:
-        target_character_data: game_type.Character = cache.character_data[player_character_data.target_character_id]
-        if target_character_data.is_follow or target_character_data.is_h:
-            target_character_data.sleep_point += add_sleep
-            target_character_data.urinate_point += add_urinate
-            target_character_data.hunger_point += add_hunger
-
-    # print(f"debug character_id = {character_id}，target_character_id = {player_character_data.target_character_id}，now_character_data.hunger_point = {now_character_data.hunger_point}")
-
-
 def change_character_persistent_state(character_id: int, now_time: datetime.datetime, add_time: int):
     """
     结算角色的持续状态
@@ -522,8 +493,7 @@ def check_second_effect(
         for behavior_id, behavior_data in character_data.second_behavior.items():
             if behavior_data != 0:
                 # 遍历该二段行为的所有结算效果，挨个触发
-                for effect_id in game_config.config_second_behavior_effect_data[behavior_id]:
-                    constant.settle_second_behavior_effect_data[effect_id](character_id, change_data)
+                settle_table.handle_second_behavior_effect(behavior_id, character_id, change_data)
 
     # 检测交互对象
     # 如果是玩家的交互，则target_character_id != 0
@@ -545,9 +515,7 @@ def check_second_effect(
         for behavior_id, behavior_data in target_character_data.second_behavior.items():
             if behavior_data != 0:
                 # 遍历该二段行为的所有结算效果，挨个触发
-                for effect_id in game_config.config_second_behavior_effect_data[behavior_id]:
-                    # print("effect_id :",effect_id)
-                    constant.settle_second_behavior_effect_data[effect_id](target_character_id, target_change)
+                settle_table.handle_second_behavior_effect(behavior_id, target_character_id, target_change)
 
         # 刻印结算
         mark_effect(target_character_id, target_change)
@@ -556,9 +524,7 @@ def check_second_effect(
         for behavior_id, behavior_data in target_character_data.second_behavior.items():
             if behavior_data != 0 and behavior_id in mark_list:
                 # 遍历该二段行为的所有结算效果，挨个触发
-                for effect_id in game_config.config_second_behavior_effect_data[behavior_id]:
-                    # print("effect_id :",effect_id)
-                    constant.settle_second_behavior_effect_data[effect_id](target_character_id, target_change)
+                settle_table.handle_second_behavior_effect(behavior_id, target_character_id, target_change)
 
 
 def insert_position_effect(character_id: int):
@@ -0,0 +1,243 @@
+import datetime
+from typing import Dict, List, Tuple
+from Script.Core import cache_control, constant, game_type, dispatch_profile
+from Script.Design import attr_calculation
+from Script.Config import game_config
+
+cache: game_type.Cache = cache_control.cache
+""" 游戏缓存数据 """
+
+experience_effect_table: Dict[int, Tuple[bool, Tuple[Tuple[int, int], ...]]] = {}
+"""
+表驱动的经验结算器
+结算器id:(是否作用于交互对象, ((经验id, 增加值), ...))
+"""
+status_second_effect_table: Dict[int, Tuple[int, int, int, str, int]] = {}
+"""
+表驱动的二段状态结算器
+结算器id:(状态id, 基础增加值, 当前值的除数(0为不计算当前值), 修正函数名(空为不修正), 修正所用能力id)
+"""
+adjust_func_data = {
+    "get_ability_adjust": attr_calculation.get_ability_adjust,
+    "get_mark_debuff_adjust": attr_calculation.get_mark_debuff_adjust,
+}
+""" 二段状态结算器可用的修正函数 函数名:函数 """
+behavior_effect_plan: Dict[int, Tuple[List[Tuple[bool, Tuple[Tuple[int, int], ...]]], List[int]]] = {}
+"""
+各行为编译后的结算计划
+行为id:(表驱动经验结算行列表, 需逐个调用的结算器id列表)
+"""
+second_behavior_effect_plan: Dict[int, Tuple[List[Tuple[int, int, int, str, int]], List[int]]] = {}
+"""
+各二段行为编译后的结算计划
+二段行为id:(表驱动状态结算行列表, 需逐个调用的结算器id列表)
+"""
+
+
+def add_experience_effect_table(table: Dict[int, Tuple[bool, Tuple[Tuple[int, int], ...]]]):
+    """
+    登记表驱动的经验结算器，并为事件等单独调用的场合生成对应的结算函数
+    Keyword arguments:
+    table -- 结算器id:(是否作用于交互对象, ((经验id, 增加值), ...))
+    """
+    for effect_id, row in table.items():
+        experience_effect_table[effect_id] = row
+        constant.settle_behavior_effect_data[effect_id] = dispatch_profile.wrap(
+            "settle", effect_id, get_experience_effect_handle(row)
+        )
+    behavior_effect_plan.clear()
+
+
+def add_status_second_effect_table(table: Dict[int, Tuple[int, int, int, str, int]]):
+    """
+    登记表驱动的二段状态结算器，并为单独调用的场合生成对应的结算函数
+    Keyword arguments:
+    table -- 结算器id:(状态id, 基础增加值, 当前值的除数, 修正函数名, 修正所用能力id)
+    """
+    for effect_id, row in table.items():
+        status_second_effect_table[effect_id] = row
+        constant.settle_second_behavior_effect_data[effect_id] = dispatch_profile.wrap(
+            "second_settle", effect_id, get_status_second_effect_handle(row)
+        )
+    second_behavior_effect_plan.clear()
+
+
+def get_experience_effect_handle(row: Tuple[bool, Tuple[Tuple[int, int], ...]]):
+    """
+    生成单个表驱动经验结算器的结算函数
+    Keyword arguments:
+    row -- 结算行
+    """
+
+    def handle(
+        character_id: int,
+        add_time: int,
+        change_data: game_type.CharacterStatusChange,
+        now_time: datetime.datetime,
+    ):
+        if not add_time:
+            return
+        settle_experience_row_list(character_id, (row,), change_data)
+
+    return handle
+
+
+def get_status_second_effect_handle(row: Tuple[int, int, int, str, int]):
+    """
+    生成单个表驱动二段状态结算器的结算函数
+    Keyword arguments:
+    row -- 结算行
+    """
+
+    def handle(character_id: int, change_data: game_type.CharacterStatusChange):
+        settle_status_row_list(character_id, (row,), change_data)
+
+    return handle
+
+
+def get_behavior_effect_plan(behavior_id: int) -> Tuple[list, list]:
+    """
+    获取行为的结算计划，初次调用时将表驱动结算器合并为一张结算行列表
+    Keyword arguments:
+    behavior_id -- 行为id
+    Return arguments:
+    list -- 表驱动经验结算行列表
+    list -- 需逐个调用的结算器id列表
+    """
+    if behavior_id not in behavior_effect_plan:
+        # 结算表随Script.Settle一同按需导入，编译计划前需确保已登记
+        constant.settle_behavior_effect_data.load()
+        row_list = []
+        effect_list = []
+        for effect_id in game_config.config_behavior_effect_data.get(behavior_id, ()):
+            # 统计处理器调用时逐个调用，以便计入各结算器
+            if effect_id in experience_effect_table and not dispatch_profile.enable_flag:
+                row_list.append(experience_effect_table[effect_id])
+            else:
+                effect_list.append(effect_id)
+        behavior_effect_plan[behavior_id] = (row_list, effect_list)
+    return behavior_effect_plan[behavior_id]
+
+
+def get_second_behavior_effect_plan(behavior_id: int) -> Tuple[list, list]:
+    """
+    获取二段行为的结算计划，初次调用时将表驱动结算器合并为一张结算行列表
+    Keyword arguments:
+    behavior_id -- 二段行为id
+    Return arguments:
+    list -- 表驱动状态结算行列表
+    list -- 需逐个调用的结算器id列表
+    """
+    if behavior_id not in second_behavior_effect_plan:
+        constant.settle_second_behavior_effect_data.load()
+        row_list = []
+        effect_list = []
+        for effect_id in game_config.config_second_behavior_effect_data.get(behavior_id, ()):
+            if effect_id in status_second_effect_table and not dispatch_profile.enable_flag:
+                row_list.append(status_second_effect_table[effect_id])
+            else:
+                effect_list.append(effect_id)
+        second_behavior_effect_plan[behavior_id] = (row_list, effect_list)
+    return second_behavior_effect_plan[behavior_id]
+
+
+def handle_behavior_effect(
+    behavior_id: int,
+    character_id: int,
+    add_time: int,
+    change_data: game_type.CharacterStatusChange,
+    now_time: datetime.datetime,
+):
+    """
+    按结算计划进行行为的一段结算
+    Keyword arguments:
+    behavior_id -- 行为id
+    character_id -- 角色id
+    add_time -- 结算时间
+    change_data -- 状态变更信息记录对象
+    now_time -- 结算的时间
+    """
+    row_list, effect_list = get_behavior_effect_plan(behavior_id)
+    if add_time and len(row_list):
+        settle_experience_row_list(character_id, row_list, change_data)
+    for effect_id in effect_list:
+        constant.settle_behavior_effect_data[effect_id](character_id, add_time, change_data, now_time)
+
+
+def handle_second_behavior_effect(
+    behavior_id: int,
+    character_id: int,
+    change_data: game_type.CharacterStatusChange,
+):
+    """
+    按结算计划进行二段行为的结算
+    Keyword arguments:
+    behavior_id -- 二段行为id
+    character_id -- 角色id
+    change_data -- 状态变更信息记录对象
+    """
+    row_list, effect_list = get_second_behavior_effect_plan(behavior_id)
+    if len(row_list):
+        settle_status_row_list(character_id, row_list, change_data)
+    for effect_id in effect_list:
+        constant.settle_second_behavior_effect_data[effect_id](character_id, change_data)
+
+
+def settle_experience_row_list(
+    character_id: int,
+    row_list: List[Tuple[bool, Tuple[Tuple[int, int], ...]]],
+    change_data: game_type.CharacterStatusChange,
+):
+    """
+    批量结算经验结算行
+    Keyword arguments:
+    character_id -- 角色id
+    row_list -- 经验结算行列表
+    change_data -- 状态变更信息记录对象
+    """
+    character_data: game_type.Character = cache.character_data[character_id]
+    target_character_id = character_data.target_character_id
+    target_data: game_type.Character = cache.character_data[target_character_id]
+    target_change: game_type.TargetChange = None
+    for is_target, experience_list in row_list:
+        if is_target:
+            if character_id == target_character_id or target_data.dead:
+                continue
+            if target_change is None:
+                change_data.target_change.setdefault(target_character_id, game_type.TargetChange())
+                target_change = change_data.target_change[target_character_id]
+            now_experience = target_data.experience
+            now_change_experience = target_change.experience
+        else:
+            if character_data.dead:
+                continue
+            now_experience = character_data.experience
+            now_change_experience = change_data.experience
+        for experience_id, add_experience in experience_list:
+            now_experience[experience_id] = now_experience.get(experience_id, 0) + add_experience
+            now_change_experience[experience_id] = now_change_experience.get(experience_id, 0) + add_experience
+
+
+def settle_status_row_list(
+    character_id: int,
+    row_list: List[Tuple[int, int, int, str, int]],
+    change_data: game_type.CharacterStatusChange,
+):
+    """
+    批量结算二段状态结算行
+    Keyword arguments:
+    character_id -- 角色id
+    row_list -- 状态结算行列表
+    change_data -- 状态变更信息记录对象
+    """
+    character_data: game_type.Character = cache.character_data[character_id]
+    status_data = character_data.status_data
+    change_status_data = change_data.status_data
+    for status_id, base_value, divisor, adjust_func, ability_id in row_list:
+        now_add_lust = base_value
+        if divisor:
+            now_add_lust += status_data[status_id] / divisor
+        if adjust_func:
+            now_add_lust *= adjust_func_data[adjust_func](character_data.ability[ability_id])
+        status_data[status_id] += now_add_lust
+        change_status_data[status_id] = change_status_data.get(status_id, 0) + now_add_lust
@@ -1,5 +1,4 @@
-import random
-from Script.Core import cache_control, game_type, value_handle, constant
+from Script.Core import cache_control, game_type, weight_sampler, constant, trace_handle, rng_handle
 from Script.Design import map_handle
 from Script.UI.Moudle import draw
 from Script.Config import normal_config, game_config
@@ -8,6 +7,7 @@ cache: game_type.Cache = cache_control.cache
 """ 游戏缓存数据 """
 
 
+@trace_handle.trace()
 def handle_talk(character_id: int):
     """
     处理行为结算对话
@@ -31,7 +31,7 @@ def handle_talk(character_id: int):
         return
     # 第一段行为结算的口上
     if behavior_id in game_config.config_talk_data:
-        for talk_id in game_config.config_talk_data[behavior_id]:
+        for talk_id in sorted(game_config.config_talk_data[behavior_id]):
             talk_config = game_config.config_talk[talk_id]
             if talk_config.adv_id != 0:
                 target_data: game_type.Character = cache.character_data[character_data.target_character_id]
@@ -62,8 +62,9 @@ def handle_talk(character_id: int):
                 now_talk_data[now_weight].add(talk_id)
     now_talk = ""
     if len(now_talk_data):
-        talk_weight = value_handle.get_rand_value_for_value_region(list(now_talk_data.keys()))
-        now_talk_id = random.choice(list(now_talk_data[talk_weight]))
+        talk_random = rng_handle.get_random("talk")
+        talk_weight = weight_sampler.choice_weight(sorted(now_talk_data), talk_random)
+        now_talk_id = talk_random.choice(sorted(now_talk_data[talk_weight]))
         now_talk = game_config.config_talk[now_talk_id].context
     if now_talk != "":
         now_talk_text: str = now_talk
@@ -157,7 +158,7 @@ def handle_talk_sub(character_id: int, behavior_id: int):
     now_talk_data = {}
     now_premise_data = {}
     if behavior_id in game_config.config_talk_data:
-        for talk_id in game_config.config_talk_data[behavior_id]:
+        for talk_id in sorted(game_config.config_talk_data[behavior_id]):
             talk_config = game_config.config_talk[talk_id]
             if talk_config.adv_id != 0:
                 target_data: game_type.Character = cache.character_data[character_data.target_character_id]
@@ -199,8 +200,9 @@ def handle_talk_draw(character_id: int, now_talk_data: dict):
     character_data: game_type.Character = cache.character_data[character_id]
     now_talk = ""
     if len(now_talk_data):
-        talk_weight = value_handle.get_rand_value_for_value_region(list(now_talk_data.keys()))
-        now_talk_id = random.choice(list(now_talk_data[talk_weight]))
+        talk_random = rng_handle.get_random("talk")
+        talk_weight = weight_sampler.choice_weight(sorted(now_talk_data), talk_random)
+        now_talk_id = talk_random.choice(sorted(now_talk_data[talk_weight]))
         now_talk = game_config.config_talk[now_talk_id].context
     if now_talk != "":
         now_talk_text: str = now_talk
@@ -1,8 +1,9 @@
-import logging, time
-from Script.Design import character_behavior, game_time, event
-from Script.Core import py_cmd
+from Script.Design import character_behavior, game_time, event, handle_premise
+from Script.Core import py_cmd, trace_handle
+from Script.Config import normal_config
 
 
+@trace_handle.trace()
 def game_update_flow(add_time: int):
     """
     游戏流程刷新
@@ -11,8 +12,29 @@ def game_update_flow(add_time: int):
     """
     character_behavior.init_character_behavior()
     game_time.sub_time_now(add_time)
-    logging.debug(f'————————')
-    logging.debug(f'进入第二次结算')
+    # 全员结算随时间增加的数值
+    character_behavior.update_value_add_as_time(add_time)
+    # 进入第二次结算
     character_behavior.init_character_behavior()
+    handle_premise.refresh_player_premise()
     py_cmd.focus_cmd()
     # logging.debug(f'————————')
+
+
+@trace_handle.trace()
+def game_fast_forward_flow(add_time: int):
+    """
+    快进游戏流程，用于玩家睡觉与长时间等待
+    玩家所在场景以外的角色按不短于fast_forward_block的行动块决策与结算，且不输出文本，玩家所在场景内照常结算
+    Keyword arguments:
+    add_time -- 游戏步进的时间
+    """
+    fast_forward_time = normal_config.config_normal.fast_forward_time
+    if not fast_forward_time or add_time < fast_forward_time:
+        game_update_flow(add_time)
+        return
+    character_behavior.fast_forward_flag = True
+    try:
+        game_update_flow(add_time)
+    finally:
+        character_behavior.fast_forward_flag = False
@@ -1 +1 @@
-from Script.Settle import default,default_experience,default_cloth,Second_effect
+from Script.Settle import default,default_experience,default_cloth,Second_effect,effect_table
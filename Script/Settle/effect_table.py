@@ -0,0 +1,329 @@
+from Script.Core import constant, constant_effect
+from Script.Design import settle_table
+
+
+settle_table.add_experience_effect_table(
+    {
+        # 交互对象增加1N经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_N_EXPERIENCE: (1, ((0, 1),)),
+        # 交互对象增加1B经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_B_EXPERIENCE: (1, ((1, 1),)),
+        # 交互对象增加1C经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_C_EXPERIENCE: (1, ((2, 1),)),
+        # 交互对象增加1P经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_P_EXPERIENCE: (1, ((3, 1),)),
+        # 交互对象增加1V经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_V_EXPERIENCE: (1, ((4, 1),)),
+        # 交互对象增加1A经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_A_EXPERIENCE: (1, ((5, 1),)),
+        # 交互对象增加1U经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_U_EXPERIENCE: (1, ((6, 1),)),
+        # 交互对象增加1W经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_W_EXPERIENCE: (1, ((7, 1),)),
+        # 8-9留空
+        # 交互对象增加1N绝顶经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_NClimax_EXPERIENCE: (1, ((10, 1), (20, 1))),
+        # 交互对象增加1B绝顶经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_BClimax_EXPERIENCE: (1, ((11, 1), (20, 1))),
+        # 交互对象增加1C绝顶经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_CClimax_EXPERIENCE: (1, ((12, 1), (20, 1))),
+        # 交互对象增加1V绝顶经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_VClimax_EXPERIENCE: (1, ((14, 1), (20, 1))),
+        # 交互对象增加1A绝顶经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_AClimax_EXPERIENCE: (1, ((15, 1), (20, 1))),
+        # 交互对象增加1U绝顶经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_UClimax_EXPERIENCE: (1, ((16, 1), (20, 1))),
+        # 交互对象增加1W绝顶经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_WClimax_EXPERIENCE: (1, ((17, 1), (20, 1))),
+        # 8-9留空
+        # 交互对象增加1射精经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_Cumming_EXPERIENCE: (1, ((21, 1), (20, 1))),
+        # 交互对象增加1喷乳经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_Milking_EXPERIENCE: (1, ((22, 1),)),
+        # 交互对象增加1放尿经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_Peeing_EXPERIENCE: (1, ((23, 1),)),
+        # 交互对象增加1精液经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_Cums_EXPERIENCE: (1, ((24, 1),)),
+        # 交互对象增加1饮精经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_CumsDrink_EXPERIENCE: (1, ((25, 1),)),
+        # 交互对象增加1膣射经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_Creampie_EXPERIENCE: (1, ((26, 1),)),
+        # 交互对象增加1肛射经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_AnalCums_EXPERIENCE: (1, ((27, 1),)),
+        # 28-29留空
+        # 交互对象增加1奉仕快乐经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_plServe_EXPERIENCE: (1, ((30, 1),)),
+        # 交互对象增加1爱情经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_Love_EXPERIENCE: (1, ((31, 1),)),
+        # 交互对象增加1苦痛快乐经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_plPain_EXPERIENCE: (1, ((32, 1),)),
+        # 交互对象增加1嗜虐快乐经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_plSadism_EXPERIENCE: (1, ((33, 1),)),
+        # 交互对象增加1露出快乐经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_plExhibit_EXPERIENCE: (1, ((34, 1),)),
+        # 35-39留空
+        # 交互对象增加1接吻经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_Kiss_EXPERIENCE: (1, ((40, 1),)),
+        # 交互对象增加1手淫经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_Handjob_EXPERIENCE: (1, ((41, 1),)),
+        # 交互对象增加1口淫经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_Blowjob_EXPERIENCE: (1, ((42, 1),)),
+        # 交互对象增加1乳交经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_Paizuri_EXPERIENCE: (1, ((43, 1),)),
+        # 交互对象增加1足交经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_Footjob_EXPERIENCE: (1, ((44, 1),)),
+        # 交互对象增加1发交经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_Hairjob_EXPERIENCE: (1, ((45, 1),)),
+        # 交互对象增加1自慰经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_Masterbate_EXPERIENCE: (1, ((46, 1),)),
+        # 交互对象增加1调教自慰经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_bdsmMasterbate_EXPERIENCE: (1, ((47, 1),)),
+        # 交互对象增加1道具使用经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_Toys_EXPERIENCE: (1, ((48, 1),)),
+        # 交互对象增加1紧缚经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_Tiedup_EXPERIENCE: (1, ((49, 1),)),
+        # 交互对象增加1插入经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_Insert_EXPERIENCE: (1, ((50, 1),)),
+        # 交互对象增加1V性交经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_sexV_EXPERIENCE: (1, ((51, 1),)),
+        # 交互对象增加1A性交经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_sexA_EXPERIENCE: (1, ((52, 1),)),
+        # 交互对象增加1U性交经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_sexU_EXPERIENCE: (1, ((53, 1),)),
+        # 交互对象增加1W性交经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_sexW_EXPERIENCE: (1, ((54, 1),)),
+        # 交互对象增加1V扩张经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_expandV_EXPERIENCE: (1, ((55, 1),)),
+        # 交互对象增加1A扩张经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_expandA_EXPERIENCE: (1, ((56, 1),)),
+        # 交互对象增加1U扩张经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_expandU_EXPERIENCE: (1, ((57, 1),)),
+        # 交互对象增加1W扩张经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_expandW_EXPERIENCE: (1, ((58, 1),)),
+        # 交互对象增加1时奸经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_TWRape_EXPERIENCE: (1, ((59, 1),)),
+        # 交互对象增加1睡奸经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_SlumberRape_EXPERIENCE: (1, ((60, 1),)),
+        # 交互对象增加1异常经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_Abnormal_EXPERIENCE: (1, ((61, 1),)),
+        # 交互对象增加1腋交经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_Axillajob_EXPERIENCE: (1, ((62, 1),)),
+        # 交互对象增加1灌肠经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_Enema_EXPERIENCE: (1, ((63, 1),)),
+        # 64-69留空
+        # 交互对象增加1无意识N经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_UnconsciouslyN_EXPERIENCE: (1, ((70, 1),)),
+        # 交互对象增加1无意识B经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_UnconsciouslyB_EXPERIENCE: (1, ((71, 1),)),
+        # 交互对象增加1无意识C经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_UnconsciouslyC_EXPERIENCE: (1, ((72, 1),)),
+        # 交互对象增加1无意识P经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_UnconsciouslyP_EXPERIENCE: (1, ((73, 1),)),
+        # 交互对象增加1无意识V经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_UnconsciouslyV_EXPERIENCE: (1, ((74, 1),)),
+        # 交互对象增加1无意识A经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_UnconsciouslyA_EXPERIENCE: (1, ((75, 1),)),
+        # 交互对象增加1无意识U经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_UnconsciouslyU_EXPERIENCE: (1, ((76, 1),)),
+        # 交互对象增加1无意识W经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_UnconsciouslyW_EXPERIENCE: (1, ((77, 1),)),
+        # 交互对象增加1无意识绝顶经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_UnconsciouslyClimax_EXPERIENCE: (1, ((78, 1),)),
+        # 79留空
+        # 交互对象增加1对话经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_Chat_EXPERIENCE: (1, ((80, 1),)),
+        # 交互对象增加1战斗经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_Combat_EXPERIENCE: (1, ((81, 1),)),
+        # 交互对象增加1学习经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_Learn_EXPERIENCE: (1, ((82, 1),)),
+        # 交互对象增加1料理经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_Cooking_EXPERIENCE: (1, ((83, 1),)),
+        # 交互对象增加1约会经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_Date_EXPERIENCE: (1, ((84, 1),)),
+        # 交互对象增加1音乐经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_Music_EXPERIENCE: (1, ((85, 1),)),
+        # 交互对象增加1出产经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_GiveBirth_EXPERIENCE: (1, ((86, 1),)),
+        # 交互对象增加1指挥经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_Command_EXPERIENCE: (1, ((87, 1),)),
+        # 交互对象增加1医疗经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_Cure_EXPERIENCE: (1, ((88, 1),)),
+        # 89-99留空
+        # 交互对象增加1正面位绝顶经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_ForwardClimax_EXPERIENCE: (1, ((100, 1),)),
+        # 交互对象增加1后入位绝顶经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_BackClimax_EXPERIENCE: (1, ((101, 1),)),
+        # 交互对象增加1骑乘位绝顶经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_RideClimax_EXPERIENCE: (1, ((102, 1),)),
+        # 交互对象增加1对面座位绝顶经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_FSeatClimax_EXPERIENCE: (1, ((103, 1),)),
+        # 交互对象增加1背面座位绝顶经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_BSeatClimax_EXPERIENCE: (1, ((104, 1),)),
+        # 交互对象增加1对面立位绝顶经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_FStandClimax_EXPERIENCE: (1, ((105, 1),)),
+        # 交互对象增加1背面立位绝顶经验
+        constant_effect.BehaviorEffect.TARGET_ADD_1_BStandClimax_EXPERIENCE: (1, ((106, 1),)),
+        # 增加1接吻经验
+        constant_effect.BehaviorEffect.ADD_1_Kiss_EXPERIENCE: (0, ((40, 1),)),
+        # 增加1手淫经验
+        constant_effect.BehaviorEffect.ADD_1_Handjob_EXPERIENCE: (0, ((41, 1),)),
+        # 增加1口淫经验
+        constant_effect.BehaviorEffect.ADD_1_Blowjob_EXPERIENCE: (0, ((42, 1),)),
+        # 增加1乳交经验
+        constant_effect.BehaviorEffect.ADD_1_Paizuri_EXPERIENCE: (0, ((43, 1),)),
+        # 增加1足交经验
+        constant_effect.BehaviorEffect.ADD_1_Footjob_EXPERIENCE: (0, ((44, 1),)),
+        # 增加1发交经验
+        constant_effect.BehaviorEffect.ADD_1_Hairjob_EXPERIENCE: (0, ((45, 1),)),
+        # 增加1对话经验
+        constant_effect.BehaviorEffect.ADD_1_Chat_EXPERIENCE: (0, ((80, 1),)),
+        # 增加1战斗经验
+        constant_effect.BehaviorEffect.ADD_1_Combat_EXPERIENCE: (0, ((81, 1),)),
+        # 增加1学习经验
+        constant_effect.BehaviorEffect.ADD_1_Learn_EXPERIENCE: (0, ((82, 1),)),
+        # 增加1料理经验
+        constant_effect.BehaviorEffect.ADD_1_Cooking_EXPERIENCE: (0, ((83, 1),)),
+        # 增加1约会经验
+        constant_effect.BehaviorEffect.ADD_1_Date_EXPERIENCE: (0, ((84, 1),)),
+        # 增加1音乐经验
+        constant_effect.BehaviorEffect.ADD_1_Music_EXPERIENCE: (0, ((85, 1),)),
+        # 增加1妊娠经验
+        constant_effect.BehaviorEffect.ADD_1_GiveBirth_EXPERIENCE: (0, ((86, 1),)),
+        # 增加1插入经验
+        constant_effect.BehaviorEffect.ADD_1_Insert_EXPERIENCE: (0, ((50, 1),)),
+        # 增加1指挥经验
+        constant_effect.BehaviorEffect.ADD_1_Command_EXPERIENCE: (0, ((87, 1),)),
+        # 增加1医疗经验
+        constant_effect.BehaviorEffect.ADD_1_Cure_EXPERIENCE: (0, ((88, 1),)),
+    }
+)
+
+
+settle_table.add_status_second_effect_table(
+    {
+        # 增加少量Ｎ快（N感补正）
+        constant.SecondEffect.ADD_SMALL_N_FEEL: (0, 100, 10, "get_ability_adjust", 0),
+        # 增加少量Ｂ快（B感补正）
+        constant.SecondEffect.ADD_SMALL_B_FEEL: (1, 100, 10, "get_ability_adjust", 1),
+        # 增加少量Ｃ快（C感补正）
+        constant.SecondEffect.ADD_SMALL_C_FEEL: (2, 100, 10, "get_ability_adjust", 2),
+        # 增加少量Ｖ快（V感补正）
+        constant.SecondEffect.ADD_SMALL_V_FEEL: (4, 100, 10, "get_ability_adjust", 4),
+        # 增加少量Ａ快（A感补正）
+        constant.SecondEffect.ADD_SMALL_A_FEEL: (5, 100, 10, "get_ability_adjust", 5),
+        # 增加少量Ｕ快（U感补正）
+        constant.SecondEffect.ADD_SMALL_U_FEEL: (6, 100, 10, "get_ability_adjust", 6),
+        # 增加少量Ｗ快（W感补正）
+        constant.SecondEffect.ADD_SMALL_W_FEEL: (7, 100, 10, "get_ability_adjust", 7),
+        # 增加少量润滑（欲望补正）
+        constant.SecondEffect.ADD_SMALL_LUBRICATION_PLUS: (8, 100, 0, "get_ability_adjust", 33),
+        # 增加少量习得（技巧补正）
+        constant.SecondEffect.ADD_SMALL_LEARN: (9, 100, 0, "get_ability_adjust", 30),
+        # 增加少量恭顺（顺从补正）
+        constant.SecondEffect.ADD_SMALL_RESPECT: (10, 100, 0, "get_ability_adjust", 31),
+        # 增加少量好意（亲密补正）
+        constant.SecondEffect.ADD_SMALL_FRIENDLY: (11, 100, 0, "get_ability_adjust", 32),
+        # 增加少量欲情（欲望补正）
+        constant.SecondEffect.ADD_SMALL_DESIRE: (12, 100, 0, "get_ability_adjust", 33),
+        # 增加少量快乐（快乐刻印补正）
+        constant.SecondEffect.ADD_SMALL_HAPPY: (13, 100, 0, "get_mark_debuff_adjust", 13),
+        # 增加少量先导（施虐补正）
+        constant.SecondEffect.ADD_SMALL_LEAD: (14, 100, 0, "get_mark_debuff_adjust", 35),
+        # 增加少量屈服（屈服刻印补正）
+        constant.SecondEffect.ADD_SMALL_SUBMIT: (15, 100, 0, "get_mark_debuff_adjust", 14),
+        # 增加少量羞耻（露出补正）
+        constant.SecondEffect.ADD_SMALL_SHY: (16, 100, 0, "get_mark_debuff_adjust", 34),
+        # 增加少量苦痛（苦痛刻印补正）
+        constant.SecondEffect.ADD_SMALL_PAIN: (17, 100, 0, "get_mark_debuff_adjust", 15),
+        # 增加少量恐怖（恐怖刻印补正）
+        constant.SecondEffect.ADD_SMALL_TERROR: (18, 100, 0, "get_mark_debuff_adjust", 17),
+        # 增加少量抑郁
+        constant.SecondEffect.ADD_SMALL_DEPRESSION: (19, 100, 0, "", 0),
+        # 增加少量反感（反发刻印补正）
+        constant.SecondEffect.ADD_SMALL_DISGUST: (20, 100, 0, "get_mark_debuff_adjust", 18),
+        # 增加中量Ｎ快（N感补正）
+        constant.SecondEffect.ADD_MIDDLE_N_FEEL: (0, 500, 10, "get_ability_adjust", 0),
+        # 增加中量Ｂ快（B感补正）
+        constant.SecondEffect.ADD_MIDDLE_B_FEEL: (1, 500, 10, "get_ability_adjust", 1),
+        # 增加中量Ｃ快（C感补正）
+        constant.SecondEffect.ADD_MIDDLE_C_FEEL: (2, 500, 10, "get_ability_adjust", 2),
+        # 增加中量P快（P感补正）
+        constant.SecondEffect.ADD_MIDDLE_P_FEEL: (3, 500, 10, "get_ability_adjust", 3),
+        # 增加中量Ｖ快（V感补正）
+        constant.SecondEffect.ADD_MIDDLE_V_FEEL: (4, 500, 10, "get_ability_adjust", 4),
+        # 增加中量Ａ快（A感补正）
+        constant.SecondEffect.ADD_MIDDLE_A_FEEL: (5, 500, 10, "get_ability_adjust", 5),
+        # 增加中量Ｕ快（U感补正）
+        constant.SecondEffect.ADD_MIDDLE_U_FEEL: (6, 500, 10, "get_ability_adjust", 6),
+        # 增加中量Ｗ快（W感补正）
+        constant.SecondEffect.ADD_MIDDLE_W_FEEL: (7, 500, 10, "get_ability_adjust", 7),
+        # 增加中量润滑（欲望补正）
+        constant.SecondEffect.ADD_MIDDLE_LUBRICATION_PLUS: (8, 500, 0, "get_ability_adjust", 33),
+        # 增加中量习得（技巧补正）
+        constant.SecondEffect.ADD_MIDDLE_LEARN: (9, 500, 0, "get_ability_adjust", 30),
+        # 增加中量恭顺（顺从补正）
+        constant.SecondEffect.ADD_MIDDLE_RESPECT: (10, 500, 0, "get_ability_adjust", 31),
+        # 增加中量好意（亲密补正）
+        constant.SecondEffect.ADD_MIDDLE_FRIENDLY: (11, 500, 0, "get_ability_adjust", 32),
+        # 增加中量欲情（欲望补正）
+        constant.SecondEffect.ADD_MIDDLE_DESIRE: (12, 500, 0, "get_ability_adjust", 33),
+        # 增加中量快乐（快乐刻印补正）
+        constant.SecondEffect.ADD_MIDDLE_HAPPY: (13, 500, 0, "get_mark_debuff_adjust", 13),
+        # 增加中量先导（施虐补正）
+        constant.SecondEffect.ADD_MIDDLE_LEAD: (14, 500, 0, "get_mark_debuff_adjust", 35),
+        # 增加中量屈服（屈服刻印补正）
+        constant.SecondEffect.ADD_MIDDLE_SUBMIT: (15, 500, 0, "get_mark_debuff_adjust", 14),
+        # 增加中量羞耻（露出补正）
+        constant.SecondEffect.ADD_MIDDLE_SHY: (16, 500, 0, "get_mark_debuff_adjust", 34),
+        # 增加中量苦痛（苦痛刻印补正）
+        constant.SecondEffect.ADD_MIDDLE_PAIN: (17, 500, 0, "get_mark_debuff_adjust", 15),
+        # 增加中量恐怖（恐怖刻印补正）
+        constant.SecondEffect.ADD_MIDDLE_TERROR: (18, 500, 0, "get_mark_debuff_adjust", 17),
+        # 增加中量抑郁
+        constant.SecondEffect.ADD_MIDDLE_DEPRESSION: (19, 500, 0, "", 0),
+        # 增加中量反感（反发刻印补正）
+        constant.SecondEffect.ADD_MIDDLE_DISGUST: (20, 500, 0, "get_mark_debuff_adjust", 18),
+        # 增加大量Ｎ快（N感补正）
+        constant.SecondEffect.ADD_LARGE_N_FEEL: (0, 1000, 10, "get_ability_adjust", 0),
+        # 增加大量Ｂ快（B感补正）
+        constant.SecondEffect.ADD_LARGE_B_FEEL: (1, 1000, 10, "get_ability_adjust", 1),
+        # 增加大量Ｃ快（C感补正）
+        constant.SecondEffect.ADD_LARGE_C_FEEL: (2, 1000, 10, "get_ability_adjust", 2),
+        # 增加大量P快（P感补正）
+        constant.SecondEffect.ADD_LARGE_P_FEEL: (3, 1000, 10, "get_ability_adjust", 3),
+        # 增加大量Ｖ快（V感补正）
+        constant.SecondEffect.ADD_LARGE_V_FEEL: (4, 1000, 10, "get_ability_adjust", 4),
+        # 增加大量Ａ快（A感补正）
+        constant.SecondEffect.ADD_LARGE_A_FEEL: (5, 1000, 10, "get_ability_adjust", 5),
+        # 增加大量Ｕ快（U感补正）
+        constant.SecondEffect.ADD_LARGE_U_FEEL: (6, 1000, 10, "get_ability_adjust", 6),
+        # 增加大量Ｗ快（W感补正）
+        constant.SecondEffect.ADD_LARGE_W_FEEL: (7, 1000, 10, "get_ability_adjust", 7),
+        # 增加大量润滑（欲望补正）
+        constant.SecondEffect.ADD_LARGE_LUBRICATION_PLUS: (8, 1000, 0, "get_ability_adjust", 33),
+        # 增加大量习得（技巧补正）
+        constant.SecondEffect.ADD_LARGE_LEARN: (9, 1000, 0, "get_ability_adjust", 30),
+        # 增加大量恭顺（顺从补正）
+        constant.SecondEffect.ADD_LARGE_RESPECT: (10, 1000, 0, "get_ability_adjust", 31),
+        # 增加大量好意（亲密补正）
+        constant.SecondEffect.ADD_LARGE_FRIENDLY: (11, 1000, 0, "get_ability_adjust", 32),
+        # 增加大量欲情（欲望补正）
+        constant.SecondEffect.ADD_LARGE_DESIRE: (12, 1000, 0, "get_ability_adjust", 33),
+        # 增加大量快乐（快乐刻印补正）
+        constant.SecondEffect.ADD_LARGE_HAPPY: (13, 1000, 0, "get_mark_debuff_adjust", 13),
+        # 增加大量先导（受虐补正）
+        constant.SecondEffect.ADD_LARGE_LEAD: (14, 1000, 0, "get_mark_debuff_adjust", 25),
+        # 增加大量屈服（屈服刻印补正）
+        constant.SecondEffect.ADD_LARGE_SUBMIT: (15, 1000, 0, "get_mark_debuff_adjust", 14),
+        # 增加大量羞耻（露出补正）
+        constant.SecondEffect.ADD_LARGE_SHY: (16, 1000, 0, "get_mark_debuff_adjust", 34),
+        # 增加大量苦痛（苦痛刻印补正）
+        constant.SecondEffect.ADD_LARGE_PAIN: (17, 1000, 0, "get_mark_debuff_adjust", 15),
+        # 增加大量恐怖（恐怖刻印补正）
+        constant.SecondEffect.ADD_LARGE_TERROR: (18, 1000, 0, "get_mark_debuff_adjust", 17),
+        # 增加大量抑郁
+        constant.SecondEffect.ADD_LARGE_DEPRESSION: (19, 1000, 0, "", 0),
+        # 增加大量反感（反发刻印补正）
+        constant.SecondEffect.ADD_LARGE_DISGUST: (20, 1000, 0, "get_mark_debuff_adjust", 18),
+    }
+)
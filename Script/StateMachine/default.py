@@ -1,9 +1,8 @@
 import datetime
-import random
 from typing import List
 from Script.Config import game_config
-from Script.Design import handle_state_machine, character_move, map_handle, clothing, handle_instruct, basement
-from Script.Core import cache_control, game_type, constant
+from Script.Design import handle_state_machine, character_move, map_handle, clothing, handle_instruct, basement, cooking
+from Script.Core import cache_control, game_type, constant, rng_handle
 from Script.UI.Moudle import draw
 
 cache: game_type.Cache = cache_control.cache
@@ -128,7 +127,7 @@ def character_move_to_rand_scene(character_id: int):
     scene_list = list(cache.scene_data.keys())
     now_scene_str = map_handle.get_map_system_path_str_for_list(character_data.position)
     scene_list.remove(now_scene_str)
-    target_scene = random.choice(scene_list)
+    target_scene = rng_handle.get_random("behavior", character_id).choice(scene_list)
     _, _, move_path, move_time = character_move.character_move(
         character_id,
         map_handle.get_map_system_path_for_str(target_scene),
@@ -149,7 +148,7 @@ def character_move_to_modern_music_room(character_id: int):
     character_data: game_type.Character = cache.character_data[character_id]
     character_data.target_character_id = character_id
     to_cafeteria = map_handle.get_map_system_path_for_str(
-        random.choice(constant.place_data["Modern_Musicroom"])
+        rng_handle.get_random("behavior", character_id).choice(constant.place_data["Modern_Musicroom"])
     )
     _, _, move_path, move_time = character_move.character_move(character_id, to_cafeteria)
     character_data.behavior.behavior_id = constant.Behavior.MOVE
@@ -168,7 +167,7 @@ def character_move_to_dr_office(character_id: int):
     character_data: game_type.Character = cache.character_data[character_id]
     character_data.target_character_id = character_id
     to_dr_office = map_handle.get_map_system_path_for_str(
-        random.choice(constant.place_data["Dr_office"])
+        rng_handle.get_random("behavior", character_id).choice(constant.place_data["Dr_office"])
     )
     _, _, move_path, move_time = character_move.character_move(character_id, to_dr_office)
     character_data.behavior.behavior_id = constant.Behavior.MOVE
@@ -192,7 +191,7 @@ def character_move_to_toilet(character_id: int):
     find_flag = False
     if character_data.sex == 0:
         to_toilet = map_handle.get_map_system_path_for_str(
-        random.choice(constant.place_data["Toilet_Male"])
+        rng_handle.get_random("behavior", character_id).choice(constant.place_data["Toilet_Male"])
     )
     elif character_data.sex == 1:
         for place in constant.place_data["Toilet_Female"]:
@@ -202,7 +201,7 @@ def character_move_to_toilet(character_id: int):
                 break
         if not find_flag:
             to_toilet = map_handle.get_map_system_path_for_str(
-        random.choice(constant.place_data["Toilet_Female"])
+        rng_handle.get_random("behavior", character_id).choice(constant.place_data["Toilet_Female"])
     )
     # print(f"debug constant.place_data[\"Toilet_Female\"] = ",constant.place_data["Toilet_Female"])
     _, _, move_path, move_time = character_move.character_move(character_id, to_toilet)
@@ -229,7 +228,7 @@ def character_move_to_foodshop(character_id: int):
     character_data: game_type.Character = cache.character_data[character_id]
     character_data.target_character_id = character_id
     to_foodshop = map_handle.get_map_system_path_for_str(
-        random.choice(constant.place_data["Food_Shop"])
+        rng_handle.get_random("behavior", character_id).choice(constant.place_data["Food_Shop"])
     )
     _, _, move_path, move_time = character_move.character_move(character_id, to_foodshop)
     character_data.behavior.behavior_id = constant.Behavior.MOVE
@@ -255,7 +254,7 @@ def character_move_to_dining_hall(character_id: int):
     character_data: game_type.Character = cache.character_data[character_id]
     character_data.target_character_id = character_id
     to_dining_hall = map_handle.get_map_system_path_for_str(
-        random.choice(constant.place_data["Dining_hall"])
+        rng_handle.get_random("behavior", character_id).choice(constant.place_data["Dining_hall"])
     )
     _, _, move_path, move_time = character_move.character_move(character_id, to_dining_hall)
     character_data.behavior.behavior_id = constant.Behavior.MOVE
@@ -283,7 +282,7 @@ def character_move_to_clinic(character_id: int):
             break
     if not empty_flag:
         to_clinic = map_handle.get_map_system_path_for_str(
-        random.choice(constant.place_data["Clinic"])
+        rng_handle.get_random("behavior", character_id).choice(constant.place_data["Clinic"])
     )
     _, _, move_path, move_time = character_move.character_move(character_id, to_clinic)
     character_data.behavior.behavior_id = constant.Behavior.MOVE
@@ -303,7 +302,7 @@ def character_move_to_hr_office(character_id: int):
     character_data.target_character_id = character_id
 
     to_hr_office = map_handle.get_map_system_path_for_str(
-        random.choice(constant.place_data["HR_office"])
+        rng_handle.get_random("behavior", character_id).choice(constant.place_data["HR_office"])
     )
     _, _, move_path, move_time = character_move.character_move(character_id, to_hr_office)
     character_data.behavior.behavior_id = constant.Behavior.MOVE
@@ -323,7 +322,7 @@ def character_move_to_library_office(character_id: int):
     character_data.target_character_id = character_id
 
     to_library_office = map_handle.get_map_system_path_for_str(
-        random.choice(constant.place_data["Library_office"])
+        rng_handle.get_random("behavior", character_id).choice(constant.place_data["Library_office"])
     )
     _, _, move_path, move_time = character_move.character_move(character_id, to_library_office)
     character_data.behavior.behavior_id = constant.Behavior.MOVE
@@ -343,7 +342,7 @@ def character_move_to_library(character_id: int):
     character_data.target_character_id = character_id
 
     to_library = map_handle.get_map_system_path_for_str(
-        random.choice(constant.place_data["Library"])
+        rng_handle.get_random("behavior", character_id).choice(constant.place_data["Library"])
     )
     _, _, move_path, move_time = character_move.character_move(character_id, to_library)
     character_data.behavior.behavior_id = constant.Behavior.MOVE
@@ -372,7 +371,7 @@ def character_move_to_rest_room(character_id: int):
             break
     if not find_flag:
         to_rest_room = map_handle.get_map_system_path_for_str(
-    random.choice(constant.place_data["Rest_Room"])
+    rng_handle.get_random("behavior", character_id).choice(constant.place_data["Rest_Room"])
     )
 
     _, _, move_path, move_time = character_move.character_move(character_id, to_rest_room)
@@ -439,7 +438,7 @@ def character_move_to_bath_room(character_id: int):
             break
     if not find_flag:
         to_bath_room = map_handle.get_map_system_path_for_str(
-    random.choice(constant.place_data["Bathroom"])
+    rng_handle.get_random("behavior", character_id).choice(constant.place_data["Bathroom"])
     )
 
     _, _, move_path, move_time = character_move.character_move(character_id, to_bath_room)
@@ -471,7 +470,7 @@ def character_move_to_training_room(character_id: int):
         room_name = "Shoot_Room"
 
     to_training_room = map_handle.get_map_system_path_for_str(
-    random.choice(constant.place_data[room_name])
+    rng_handle.get_random("behavior", character_id).choice(constant.place_data[room_name])
     )
 
     _, _, move_path, move_time = character_move.character_move(character_id, to_training_room)
@@ -520,7 +519,7 @@ def character_chat_rand_character(character_id: int):
     character_set.remove(character_id)
     character_list = list(character_set)
     if len(character_list):
-        target_id = random.choice(character_list)
+        target_id = rng_handle.get_random("behavior", character_id).choice(character_list)
         character_data.behavior.behavior_id = constant.Behavior.CHAT
         character_data.behavior.duration = 10
         character_data.target_character_id = target_id
@@ -541,7 +540,7 @@ def character_stroke_rand_character(character_id: int):
     character_set.remove(character_id)
     character_list = list(character_set)
     if len(character_list):
-        target_id = random.choice(character_list)
+        target_id = rng_handle.get_random("behavior", character_id).choice(character_list)
         character_data.behavior.behavior_id = constant.Behavior.STROKE
         character_data.behavior.duration = 10
         character_data.target_character_id = target_id
@@ -708,7 +707,7 @@ def character_singing_to_rand_character(character_id: int):
     )
     character_list.remove(character_id)
     if len(character_list):
-        target_id = random.choice(character_list)
+        target_id = rng_handle.get_random("behavior", character_id).choice(character_list)
         character_data.behavior.behavior_id = constant.Behavior.SINGING
         character_data.behavior.duration = 10
         character_data.target_character_id = target_id
@@ -730,7 +729,7 @@ def character_play_instrument_to_rand_character(character_id: int):
     )
     character_list.remove(character_id)
     if len(character_list):
-        target_id = random.choice(character_list)
+        target_id = rng_handle.get_random("behavior", character_id).choice(character_list)
         character_data.behavior.behavior_id = constant.Behavior.PLAY_INSTRUMENT
         character_data.behavior.duration = 30
         character_data.target_character_id = target_id
@@ -812,23 +811,11 @@ def character_buy_rand_food_at_foodshop(character_id: int):
     """
     character_data: game_type.Character = cache.character_data[character_id]
     character_data.target_character_id = character_id
-    new_food_list = []
-    for food_id in cache.restaurant_data:
-        if not len(cache.restaurant_data[food_id]):
-            continue
-        for food_uid in cache.restaurant_data[food_id]:
-            now_food: game_type.Food = cache.restaurant_data[food_id][food_uid]
-            # if now_food.eat:
-            new_food_list.append(food_id)
-            break
-    if not len(new_food_list):
+    if not len(cache.restaurant_data):
         return
-    now_food_id = random.choice(new_food_list)
-    now_food = cache.restaurant_data[now_food_id][
-        random.choice(list(cache.restaurant_data[now_food_id].keys()))
-    ]
+    now_food_id = rng_handle.get_random("behavior", character_id).choice(list(cache.restaurant_data))
+    now_food = cooking.take_restaurant_food(now_food_id)
     character_data.food_bag[now_food.uid] = now_food
-    del cache.restaurant_data[now_food_id][now_food.uid]
 
     # 记录食物名字
     food_recipe: game_type.Recipes = cache.recipe_data[now_food.recipe]
@@ -854,7 +841,7 @@ def character_eat_rand_food(character_id: int):
         # now_food: game_type.Food = character_data.food_bag[food_id]
         # if 27 in now_food.feel and now_food.eat:
         now_food_list.append(food_id)
-    choice_food_id = random.choice(now_food_list)
+    choice_food_id = rng_handle.get_random("behavior", character_id).choice(now_food_list)
     character_data.behavior.eat_food = character_data.food_bag[choice_food_id]
     character_data.state = constant.CharacterStatus.STATUS_EAT
 
@@ -2,10 +2,11 @@ import random
 from functools import wraps
 from typing import List
 from types import FunctionType
-from Script.Core import get_text, constant, game_type, cache_control, flow_handle, py_cmd
+from Script.Core import get_text, constant, game_type, cache_control, flow_handle, py_cmd, rng_handle
 
 from Script.Design import (
     handle_panel,
+    handle_premise,
     character,
     character_handle,
     cooking,
@@ -33,6 +34,7 @@ line = draw.LineDraw("=", width)
 @handle_panel.add_panel(constant.Panel.CREATOR_CHARACTER)
 def creator_character_panel():
     """创建角色面板"""
+    rng_handle.init_rng()
     cache.character_data[0] = game_type.Character()
     character_handle.init_character_list()
     while 1:
@@ -66,6 +68,8 @@ def game_start():
     cache.school_longitude = random.uniform(120.9, 122.12)
     cache.school_latitude = random.uniform(30.7, 31.53)
     basement.get_base_updata()
+    basement.init_work_people()
+    basement.init_book_ledger()
     # print(f"debug 2facility_open = {cache.base_resouce.facility_open}")
 
 def confirm_game_info_panel():
@@ -115,6 +119,8 @@ def confirm_character_attr_panel():
         ask_list.extend(askfor_panel_return_list.keys())
         yrn = flow_handle.askfor_all(ask_list)
         py_cmd.clr_cmd()
+        # 设定按钮会直接修改玩家与助理的属性
+        handle_premise.refresh_player_premise()
         if yrn in askfor_panel_return_list:
             return askfor_panel_return_list[yrn] == askfor_list[0]
 
@@ -142,7 +148,7 @@ def input_name_panel() -> bool:
         if now_name.isdigit():
             not_num_error.draw()
             continue
-        if now_name in get_text.translation_values or now_name in get_text.translation._catalog:
+        if get_text.is_translation_text(now_name):
             not_system_error.draw()
             continue
         if now_name in cache.npc_name_data:
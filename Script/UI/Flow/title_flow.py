@@ -4,7 +4,7 @@ from Script.Config import normal_config
 from Script.UI.Moudle import panel, draw
 from Script.UI.Panel import see_save_info_panel
 from Script.Design import handle_panel
-from Script.Core import constant, get_text, flow_handle, cache_control, game_type, py_cmd
+from Script.Core import constant, get_text, flow_handle, cache_control, game_type, py_cmd, trace_handle, dispatch_profile, record_handle
 
 config_normal = normal_config.config_normal
 _: FunctionType = get_text._
@@ -50,4 +50,7 @@ def title_panel():
         now_panel = see_save_info_panel.SeeSaveListPanel(width, 0)
         now_panel.draw()
     elif now_key == now_list[2]:
+        trace_handle.save()
+        dispatch_profile.save()
+        record_handle.save()
         os._exit(0)
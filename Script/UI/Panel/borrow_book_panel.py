@@ -3,7 +3,7 @@ from typing import Tuple, List
 from types import FunctionType
 from uuid import UUID
 from Script.Core import cache_control, game_type, get_text, flow_handle, text_handle, constant, py_cmd
-from Script.Design import map_handle,attr_text,attr_calculation
+from Script.Design import map_handle,attr_text,attr_calculation,basement
 from Script.UI.Moudle import draw, panel
 from Script.Config import game_config, normal_config
 
@@ -68,10 +68,7 @@ class Borrow_Book_Panel:
             line.draw()
 
             # 当前借书数量限制信息
-            borrow_count = 0
-            for book_id in cache.base_resouce.book_borrow_dict:
-                if cache.base_resouce.book_borrow_dict[book_id] == 0:
-                    borrow_count += 1
+            borrow_count = len(cache.character_data[0].entertainment.borrow_book_id_set)
             borrow_limit_draw = draw.NormalDraw()
             borrow_limit_text = f"\n已借书量/最大借书量：{borrow_count}/3\n"
             borrow_limit_draw.text = borrow_limit_text
@@ -184,12 +181,10 @@ class Borrow_Book_Panel:
 
         # 如果已借该书，则还书
         if cache.base_resouce.book_borrow_dict[book_cid] == 0:
-            cache.base_resouce.book_borrow_dict[book_cid] = -1
-            character_data.entertainment.borrow_book_id_set.discard(book_cid)
+            basement.return_book(book_cid)
         # 未借该书，且借书数量不到上限，则借书
         elif borrow_count < 3:
-            cache.base_resouce.book_borrow_dict[book_cid] = 0
-            character_data.entertainment.borrow_book_id_set.add(book_cid)
+            basement.borrow_book(book_cid, 0)
         # 未借该书，且借书数量已达上限，则输出错误信息
         else:
             borrow_limit_draw = draw.WaitDraw()
@@ -2,7 +2,7 @@ from turtle import position
 from typing import Dict, List
 from types import FunctionType
 from uuid import UUID
-from Script.Core import cache_control, game_type, get_text, flow_handle, text_handle, constant, py_cmd
+from Script.Core import cache_control, game_type, get_text, flow_handle, text_handle, constant, py_cmd, dispatch_profile
 from Script.Design import basement
 from Script.UI.Moudle import draw, panel
 from Script.Config import game_config, normal_config
@@ -42,9 +42,8 @@ class Debug_Panel:
 
         title_draw = draw.TitleLineDraw(title_text, self.width)
 
-        # 进行一轮刷新
-        basement.update_work_people()
-        basement.update_facility_people()
+        # 校验增量维护的部门人员统计
+        basement.check_work_people()
 
         while 1:
             return_list = []
@@ -238,6 +237,17 @@ class Debug_Panel:
                 else:
                     label.draw()
 
+            # 开启了处理器调用统计时可随时导出
+            if dispatch_profile.enable_flag:
+                profile_draw = draw.CenterButton(
+                    _("[导出处理器调用统计]"),
+                    _("导出处理器调用统计"),
+                    window_width,
+                    cmd_func=dispatch_profile.save,
+                )
+                profile_draw.draw()
+                return_list.append(profile_draw.return_text)
+                line_feed.draw()
             back_draw = draw.CenterButton(_("[返回]"), _("返回"), window_width)
             back_draw.draw()
             return_list.append(back_draw.return_text)
@@ -395,4 +405,4 @@ class ChangeWorkButtonList:
         """赋予新的工作id"""
         target_data: game_type.Character = cache.character_data[self.NPC_id]
         target_data.work.work_type = work_id
-        basement.update_work_people()
+        basement.update_character_work_people(self.NPC_id)
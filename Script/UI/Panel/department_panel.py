@@ -42,10 +42,6 @@ class Department_Panel:
 
         title_draw = draw.TitleLineDraw(title_text, self.width)
 
-        # 进行一轮刷新
-        basement.update_work_people()
-        basement.update_facility_people()
-
         while 1:
             return_list = []
             title_draw.draw()
@@ -441,4 +437,4 @@ class ChangeWorkButtonList:
         """赋予新的工作id"""
         target_data: game_type.Character = cache.character_data[self.NPC_id]
         target_data.work.work_type = work_id
-        basement.update_work_people()
+        basement.update_character_work_people(self.NPC_id)
@@ -1,6 +1,5 @@
 from typing import Tuple
 from types import FunctionType
-from uuid import UUID
 from Script.Core import cache_control, game_type, get_text, flow_handle, text_handle, constant, py_cmd
 from Script.Design import map_handle, cooking, update
 from Script.UI.Moudle import draw, panel
@@ -155,7 +154,9 @@ class SeeFoodListByFoodNameDraw:
     def see_food_shop_food_list(self):
         """按食物名字显示食物商店的食物列表"""
         title_draw = draw.TitleLineDraw(self.text, window_width)
-        now_food_list = [(self.cid, x) for x in cache.restaurant_data[self.cid]]
+        now_food_list = []
+        if self.cid in cache.restaurant_data:
+            now_food_list.append((self.cid, cache.restaurant_data[self.cid]))
         page_handle = panel.PageHandlePanel(
             now_food_list, BuyFoodByFoodNameDraw, 10, 1, window_width, 1, 1, 0
         )
@@ -172,7 +173,6 @@ class SeeFoodListByFoodNameDraw:
         yrn = flow_handle.askfor_all(return_list)
         # if yrn == back_draw.return_text:
         #     break
-        page_handle.text_list = [(self.cid, x) for x in cache.restaurant_data[self.cid]]
 
 
 class BuyFoodByFoodNameDraw:
@@ -187,11 +187,11 @@ class BuyFoodByFoodNameDraw:
     """
 
     def __init__(
-        self, text: Tuple[str, UUID], width: int, is_button: bool, num_button: bool, button_id: int
+        self, text: Tuple[str, int], width: int, is_button: bool, num_button: bool, button_id: int
     ):
         """初始化绘制对象"""
-        self.text: UUID = text[1]
-        """ 食物uid """
+        self.text: int = text[1]
+        """ 食物剩余份数 """
         self.cid: str = text[0]
         """ 食物商店索引id """
         self.draw_text: str = ""
@@ -206,7 +206,6 @@ class BuyFoodByFoodNameDraw:
         """ 按钮返回值 """
         # print(f"debug text = {text}")
         name_draw = draw.NormalDraw()
-        food_data: game_type.Food = cache.restaurant_data[self.cid][self.text]
         self.food_name = ""
         if isinstance(self.cid, str):
             food_recipe: game_type.Recipes = cache.recipe_data[int(self.cid)]
@@ -214,7 +213,7 @@ class BuyFoodByFoodNameDraw:
             food_money = food_recipe.money
             food_introduce = food_recipe.introduce
         index_text = text_handle.id_index(button_id)
-        button_text = f"{index_text}{self.food_name}(食堂自助免费拿取)：{food_introduce}"
+        button_text = f"{index_text}{self.food_name}(食堂自助免费拿取，剩余{self.text}份)：{food_introduce}"
         name_draw = draw.LeftButton(button_text, self.button_return, self.width, cmd_func=self.buy_food)
         self.now_draw = name_draw
         """ 绘制的对象 """
@@ -226,8 +225,10 @@ class BuyFoodByFoodNameDraw:
     def buy_food(self):
         """玩家购买食物"""
         update.game_update_flow(0)
-        cache.character_data[0].food_bag[self.text] = cache.restaurant_data[self.cid][self.text]
-        del cache.restaurant_data[self.cid][self.text]
+        now_food = cooking.take_restaurant_food(self.cid)
+        if now_food is None:
+            return
+        cache.character_data[0].food_bag[now_food.uid] = now_food
         character_data: game_type.Character = cache.character_data[0]
         character_data.behavior.behavior_id = constant.Behavior.BUY_FOOD
         character_data.state = constant.CharacterStatus.STATUS_BUY_FOOD
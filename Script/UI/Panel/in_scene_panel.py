@@ -1,4 +1,5 @@
 from os import name
+import copy
 from typing import List
 from types import FunctionType
 from Script.UI.Moudle import draw, panel
@@ -12,10 +13,10 @@ from Script.Core import (
     value_handle,
     constant,
     py_cmd,
+    trace_handle,
 )
-from Script.Design import attr_text, map_handle, handle_instruct, handle_premise
+from Script.Design import attr_text, map_handle, handle_instruct
 from Script.Config import game_config
-import logging, time
 
 cache: game_type.Cache = cache_control.cache
 """ 游戏缓存数据 """
@@ -59,7 +60,7 @@ class InScenePanel:
         )
         while 1:
             # 绘制的开始时间
-            start_draw = time.time()
+            start_draw = trace_handle.begin()
 
             if character_data.dead:
                 cache.wframe_mouse.w_frame_skip_wait_mouse = 0
@@ -127,10 +128,13 @@ class InScenePanel:
             target_head_draw = see_character_info_panel.CharacterInfoHead(
                 character_data.target_character_id, self.width
             )
+            # 头部的绘制对象会被缓存复用，合并文本时复制一份而不改动原对象
             character_head_draw_list = [y for x in character_head_draw.draw_list for y in x]
+            character_head_draw_list[0] = copy.copy(character_head_draw_list[0])
             character_head_draw_list[0].text += " " + character_head_draw_list[2].text
             del character_head_draw_list[2]
             target_head_draw_list = [y for x in target_head_draw.draw_list for y in x]
+            target_head_draw_list[0] = copy.copy(target_head_draw_list[0])
             target_head_draw_list[0].text += " " + target_head_draw_list[2].text
             del target_head_draw_list[2]
             for value_tuple in character_head_draw_list:
@@ -327,20 +331,13 @@ class InScenePanel:
             """
             line_feed.draw()
             # 以下为指令面板#
-            mid_draw = time.time()
-            logging.debug(f'————————')
-            logging.debug(f'截止到指令面板绘制前总时间为{mid_draw - start_draw}')
+            trace_handle.end("InScenePanel.draw.scene", start_draw)
             see_instruct_panel.draw()
             ask_list.extend(see_instruct_panel.return_list)
-            logging.debug(f'————————')
-            logging.debug(f'指令外，ask_list = {ask_list}')
+            wait_input = trace_handle.begin()
             flow_handle.askfor_all(ask_list)
-            mid_3_draw = time.time()
-            logging.debug(f'————————')
-            logging.debug(f'指令外，中间时间3号，截至flow_handle总时间为 {mid_3_draw - mid_draw}')
+            trace_handle.end("InScenePanel.draw.wait_input", wait_input)
             py_cmd.clr_cmd()
-            end_draw = time.time()
-            logging.debug(f'指令部分绘制总时间为{end_draw - mid_draw}')
 
 
 class SeeInstructPanel:
@@ -370,9 +367,9 @@ class SeeInstructPanel:
                 for instruct in constant.instruct_type_data[now_type]:
                     cache.instruct_index_filter[instruct] = 1
 
+    @trace_handle.trace()
     def draw(self):
         """绘制操作菜单面板"""
-        start_instruct = time.time()
         self.return_list = []
         line = draw.LineDraw("-.-", self.width)
         line.draw()
@@ -413,7 +410,6 @@ class SeeInstructPanel:
         line = draw.LineDraw("~..", self.width)
         line.draw()
         now_instruct_list = []
-        now_premise_data = {}
         for now_type in cache.instruct_type_filter:
             if cache.instruct_type_filter[
                 now_type] and now_type in constant.instruct_type_data or now_type == constant.InstructType.SYSTEM:
@@ -421,23 +417,9 @@ class SeeInstructPanel:
                     # 如果在过滤列表里，则过滤
                     if not cache.instruct_index_filter[instruct]:
                         continue
-                    premise_judge = 0
-                    if instruct in constant.instruct_premise_data:
-                        for premise in constant.instruct_premise_data[instruct]:
-                            if premise in now_premise_data:
-                                if now_premise_data[premise]:
-                                    continue
-                                premise_judge = 1
-                                break
-                            else:
-                                now_premise_value = handle_premise.handle_premise(premise, 0)
-                                now_premise_data[premise] = now_premise_value
-                                if not now_premise_value:
-                                    premise_judge = 1
-                                    break
-                    if premise_judge:
-                        continue
                     now_instruct_list.append(instruct)
+        # 玩家状态未改变时(切换过滤、翻页等)直接使用缓存的判断结果
+        now_instruct_list = handle_instruct.get_available_instruct_list(now_instruct_list)
         now_instruct_list.sort()
         instruct_group = value_handle.list_of_groups(now_instruct_list, 5)
         now_draw_list = []
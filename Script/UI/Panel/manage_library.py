@@ -1,7 +1,7 @@
 from typing import Tuple, Dict, List
 from types import FunctionType
 from Script.Core import cache_control, game_type, get_text, flow_handle, text_handle, constant, py_cmd
-from Script.Design import map_handle, attr_calculation, update, attr_text
+from Script.Design import map_handle, attr_calculation, update, attr_text, basement
 from Script.UI.Moudle import draw, panel
 from Script.Config import game_config, normal_config
 import random
@@ -125,29 +125,34 @@ class Manage_Library_Panel:
             line.draw()
             book_count = 0
 
-            # 按类型遍历全图书，寻找已经被借出的书籍
-            for book_type_cid in game_config.config_book_type:
-                book_type_data = game_config.config_book_type[book_type_cid]
-                for book_cid in game_config.config_book_type_data[book_type_cid]:
-                    book_data = game_config.config_book[book_cid]
-                    if cache.base_resouce.book_borrow_dict[book_cid] > 0 :
-                        book_count += 1
-                        book_text = f"  [{str(book_count).rjust(3,'0')}]({book_type_data.son_type_name}){book_data.name}"
-                        borrow_npc_id = cache.base_resouce.book_borrow_dict[book_cid]
-                        borrow_npc_name = cache.character_data[borrow_npc_id].name
-                        book_text += f"  (被{borrow_npc_name}借走)"
-
-                        button_draw = draw.LeftButton(
-                            _(book_text),
-                            _(str(book_count)),
-                            self.width,
-                            cmd_func=self.return_book,
-                            args=(borrow_npc_id,),
-                            )
-                        # print(f"debug button_draw.text = {button_draw.text},button_draw.normal_style = {button_draw.normal_style}")
-                        line_feed.draw()
-                        button_draw.draw()
-                        return_list.append(button_draw.return_text)
+            # 按类型遍历已经被干员借出的书籍
+            borrow_book_list = [
+                book_cid
+                for book_cid in basement.get_borrowed_book_list()
+                if cache.base_resouce.book_borrow_dict[book_cid] > 0
+            ]
+            borrow_book_list.sort(key=lambda book_cid: game_config.config_book[book_cid].type)
+            for book_cid in borrow_book_list:
+                book_data = game_config.config_book[book_cid]
+                book_type_data = game_config.config_book_type[book_data.type]
+                book_count += 1
+                book_text = f"  [{str(book_count).rjust(3,'0')}]({book_type_data.son_type_name}){book_data.name}"
+                borrow_npc_id = cache.base_resouce.book_borrow_dict[book_cid]
+                borrow_npc_name = cache.character_data[borrow_npc_id].name
+                borrow_day = (cache.game_time - cache.base_resouce.book_borrow_time[book_cid]).days
+                book_text += f"  (被{borrow_npc_name}借走{borrow_day}天)"
+
+                button_draw = draw.LeftButton(
+                    _(book_text),
+                    _(str(book_count)),
+                    self.width,
+                    cmd_func=self.return_book,
+                    args=(borrow_npc_id,),
+                    )
+                # print(f"debug button_draw.text = {button_draw.text},button_draw.normal_style = {button_draw.normal_style}")
+                line_feed.draw()
+                button_draw.draw()
+                return_list.append(button_draw.return_text)
 
             # 没有人借书时输出提示信息
             if book_count == 0:
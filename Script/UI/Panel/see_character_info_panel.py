@@ -2,7 +2,8 @@ from distutils.command.config import config
 from itertools import count
 from Script.UI.Flow import creator_character_flow
 from uuid import UUID
-from typing import Tuple, List
+from functools import wraps
+from typing import Dict, Tuple, List
 from types import FunctionType
 from Script.UI.Moudle import draw, panel
 from Script.UI.Panel import see_clothing_info_panel, see_item_info_panel
@@ -18,7 +19,7 @@ from Script.Core import (
     rich_text,
 )
 from Script.Config import game_config, normal_config
-from Script.Design import attr_text, map_handle, attr_calculation, handle_premise
+from Script.Design import attr_text, map_handle, attr_calculation, handle_premise, character
 
 panel_info_data = {}
 
@@ -33,6 +34,52 @@ line_feed.text = "\n"
 line_feed.width = 1
 window_width = normal_config.config_normal.text_width
 """ 屏幕宽度 """
+render_cache_data: Dict[tuple, Tuple[tuple, dict]] = {}
+"""
+属性面板各区块的绘制缓存
+(区块类名, 角色id, 绘制参数):(缓存状态, 区块属性)
+"""
+
+
+def get_render_key(character_id: int) -> tuple:
+    """
+    获取角色属性区块缓存依赖的状态，包括角色属性版本号、玩家前提版本号、时间与角色对象本身(读档后会替换)
+    Keyword arguments:
+    character_id -- 角色id
+    Return arguments:
+    tuple -- 缓存状态
+    """
+    return (
+        character.character_version_data.get(character_id, 0),
+        handle_premise.player_premise_version,
+        cache.game_time,
+        id(cache.character_data[character_id]),
+    )
+
+
+def render_cache(cls: type) -> type:
+    """
+    为属性区块加上绘制缓存，角色属性未改变时直接复用上次生成的绘制列表
+    区块的初始化参数需以角色id开头，且绘制时不能修改绘制列表
+    Keyword arguments:
+    cls -- 区块类
+    Return arguments:
+    type -- 区块类
+    """
+    init_func = cls.__init__
+
+    @wraps(init_func)
+    def return_wrapper(self, character_id: int, *args):
+        cache_key = (cls.__name__, character_id, args)
+        now_key = get_render_key(character_id)
+        if cache_key in render_cache_data and render_cache_data[cache_key][0] == now_key:
+            self.__dict__.update(render_cache_data[cache_key][1])
+            return
+        init_func(self, character_id, *args)
+        render_cache_data[cache_key] = (now_key, dict(self.__dict__))
+
+    cls.__init__ = return_wrapper
+    return cls
 
 
 class SeeCharacterInfoPanel:
@@ -53,9 +100,6 @@ class SeeCharacterInfoPanel:
         """ 要绘制的角色id """
         self.return_list: List[str] = []
         """ 当前面板监听的按钮列表 """
-        main_first_draw = SeeCharacterFirstPanel(character_id, width)
-        main_second_draw = SeeCharacterSecondPanel(character_id, width)
-        main_third_draw = SeeCharacterThirdPanel(character_id, width)
         # see_daily_draw = SeeCharacterDailyPanel(character_id, width)
         # main_attr_draw = SeeCharacterMainAttrPanel(character_id, width)
         # see_status_draw = SeeCharacterStatusPanel(character_id, width, 5, 0)
@@ -67,9 +111,9 @@ class SeeCharacterInfoPanel:
         # see_social_draw = SeeCharacterSocialContact(character_id, width)
         if character_id == 0:
             self.draw_data = {
-                _("基础属性"): main_first_draw,
-                _("能力、经验与宝珠"): main_second_draw,
-                _("玩家能力"): main_third_draw,
+                _("基础属性"): SeeCharacterFirstPanel,
+                _("能力、经验与宝珠"): SeeCharacterSecondPanel,
+                _("玩家能力"): SeeCharacterThirdPanel,
                 # _("属性（原）"): main_attr_draw,
                 # _("状态"): see_status_draw,
                 # _("服装"): see_clothing_draw,
@@ -81,10 +125,10 @@ class SeeCharacterInfoPanel:
             }
         else:
             self.draw_data = {
-                _("基础属性"): main_first_draw,
-                _("能力、经验与宝珠"): main_second_draw,
+                _("基础属性"): SeeCharacterFirstPanel,
+                _("能力、经验与宝珠"): SeeCharacterSecondPanel,
                 # _("日程与喜好"): see_daily_draw,
-                _("肉体情况"): main_third_draw,
+                _("肉体情况"): SeeCharacterThirdPanel,
                 # _("属性（原）"): main_attr_draw,
                 # _("状态"): see_status_draw,
                 # _("服装"): see_clothing_draw,
@@ -94,7 +138,9 @@ class SeeCharacterInfoPanel:
                 # _("性格"): see_nature_draw,
                 # _("社交"): see_social_draw,
             }
-        """ 按钮文本对应属性面板 """
+        """ 按钮文本对应属性面板类，属性面板在第一次绘制时才创建 """
+        self.panel_data: Dict[str, object] = {}
+        """ 已创建的属性面板 按钮文本:属性面板 """
         self.handle_panel = panel.CenterDrawButtonListPanel()
         """ 属性列表的控制面板 """
         self.handle_panel.set(
@@ -128,9 +174,12 @@ class SeeCharacterInfoPanel:
             self.now_panel = "肉体情况"
         elif self.now_panel == "肉体情况" and "肉体情况" not in self.draw_data:
             self.now_panel = "玩家能力"
-        self.draw_data[self.now_panel].draw()
+        if self.now_panel not in self.panel_data:
+            self.panel_data[self.now_panel] = self.draw_data[self.now_panel](self.character_id, self.width)
+        now_draw = self.panel_data[self.now_panel]
+        now_draw.draw()
         self.return_list = []
-        self.return_list.extend(self.draw_data[self.now_panel].return_list)
+        self.return_list.extend(now_draw.return_list)
         line_feed.draw()
         line = draw.LineDraw("=", self.width)
         line.draw()
@@ -207,14 +256,14 @@ class SeeCharacterThirdPanel:
     def __init__(self, character_id: int, width: int):
         """初始化绘制对象"""
         head_draw = CharacterInfoHead(character_id, width)
-        body_draw = CharacterBodyText(character_id, width, 8, 0)
-        ability_draw = PlayerAbilityText(character_id, width, 8, 0)
         if character_id == 0:
+            ability_draw = PlayerAbilityText(character_id, width, 8, 0)
             self.draw_list: List[draw.NormalDraw] = [
                 head_draw,
                 ability_draw,
             ]
         else:
+            body_draw = CharacterBodyText(character_id, width, 8, 0)
             self.draw_list: List[draw.NormalDraw] = [
                 head_draw,
                 body_draw,
@@ -605,6 +654,7 @@ class SeeCharacterHStatePanel:
                 label.draw()
 
 
+@render_cache
 class CharacterInfoHead:
     """
     角色信息面板头部面板
@@ -1038,6 +1088,7 @@ class CharacterSexExperienceText:
             value.draw()
 
 
+@render_cache
 class CharacterabiText:
     """
     角色能力面板
@@ -1290,6 +1341,7 @@ class Characterabi_cmd_Text:
         for need_type_id in self.jule_dict:
             cache.character_data[self.character_id].juel[need_type_id] -= self.jule_dict[need_type_id]
         cache.character_data[self.character_id].ability[self.ability_id] += 1
+        character.refresh_character_version(self.character_id)
 
 
 class Character_talent_show_Text:
@@ -1507,8 +1559,10 @@ class Charactertal_cmd_Text:
 
     def level_up(self):
         cache.character_data[self.character_id].talent[self.talent_id] = 1
+        character.refresh_character_version(self.character_id)
 
 
+@render_cache
 class CharacterImage:
     """
     角色立绘面板
@@ -1550,6 +1604,7 @@ class CharacterImage:
             flow_handle.print_image_cmd(self.image_name, "立绘按钮")
 
 
+@render_cache
 class CharacterExperienceText:
     """
     显示角色经验面板对象
@@ -1621,6 +1676,7 @@ class CharacterExperienceText:
                 line_feed.draw()
 
 
+@render_cache
 class CharacterTalentText:
     """
     显示角色素质面板对象
@@ -1788,6 +1844,7 @@ class CharacterWorkText:
                 label.draw()
 
 
+@render_cache
 class CharacterJuelText:
     """
     显示角色宝珠面板对象
@@ -1906,6 +1963,7 @@ class CharacterTokenText:
                 label.draw()
 
 
+@render_cache
 class CharacterBodyText:
     """
     显示角色肉体面板对象
@@ -2060,6 +2118,7 @@ class CharacterBodyText:
                 label.draw()
 
 
+@render_cache
 class PlayerAbilityText:
     """
     显示玩家能力面板对象
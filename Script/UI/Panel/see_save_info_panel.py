@@ -5,12 +5,14 @@ from Script.Core import (
     cache_control,
     get_text,
     save_handle,
+    save_container,
     text_handle,
     constant,
     flow_handle,
     game_type,
     py_cmd,
 )
+from Script.Design import basement
 from Script.Config import normal_config
 from Script.UI.Moudle import panel, draw
 
@@ -107,12 +109,28 @@ class SaveInfoDraw:
         """ 存档位是否已存在 """
         save_name = _("空槽位")
         if self.save_exist_judge:
-            save_head = save_handle.load_save_info_head(self.text)
-            game_time: datetime.datetime = save_head["game_time"]
-            save_time: datetime.datetime = save_head["save_time"]
-            game_time_text = _("游戏时间:") + game_time.strftime("%Y-%m-%d %H:%M")
-            save_time_text = _("存档时间:") + save_time.strftime("%Y-%m-%d %H:%M")
-            save_name = f"No.{self.text} {save_head['game_verson']} {game_time_text} {save_head['character_name']}博士 {save_time_text}"
+            try:
+                save_head = save_handle.load_save_info_head(self.text)
+                save_handle.check_save_body(self.text, save_head)
+            except save_container.SaveContainerError:
+                # 校验失败的存档不能读取，只能覆盖
+                save_head = None
+                self.save_exist_judge = 0
+                save_name = f"No.{self.text} " + _("存档已损坏")
+            if save_head is not None:
+                game_time: datetime.datetime = save_head["game_time"]
+                save_time: datetime.datetime = save_head["save_time"]
+                game_time_text = _("游戏时间:") + game_time.strftime("%Y-%m-%d %H:%M")
+                save_time_text = _("存档时间:") + save_time.strftime("%Y-%m-%d %H:%M")
+                save_name = f"No.{self.text} {save_head['game_verson']} {game_time_text} {save_head['character_name']}博士 {save_time_text}"
+                # 旧存档的头部信息没有以下内容
+                if "npc_count" in save_head:
+                    save_name += " " + _("干员:{npc_count} 设施等级:{facility_level} 龙门币:{money} 位于{scene_name}").format(
+                        npc_count=save_head["npc_count"],
+                        facility_level=save_head["facility_level"],
+                        money=save_head["money"],
+                        scene_name=save_head["scene_name"],
+                    )
         if is_button:
             if num_button:
                 index_text = text_handle.id_index(button_id)
@@ -185,7 +203,18 @@ class SaveInfoDraw:
 
     def load_save(self):
         """载入存档"""
-        save_handle.input_load_save(str(self.text))
+        try:
+            save_handle.input_load_save(str(self.text))
+        except save_container.SaveContainerError:
+            # 存档数据损坏时不改动当前游戏，存档位显示为已损坏
+            self.save_exist_judge = 0
+            now_draw = draw.WaitDraw()
+            now_draw.text = _("\n存档已损坏，无法读取\n")
+            now_draw.width = self.width
+            now_draw.draw()
+            return
+        basement.init_work_people()
+        basement.init_book_ledger()
         cache.now_panel_id = constant.Panel.IN_SCENE
         cache.back_save_panel = 1
 
@@ -3,6 +3,7 @@ import os
 import json
 import datetime
 import ast
+import buildbundle
 
 config_dir = os.path.join("data", "csv")
 event_dir = os.path.join("data", "event")
@@ -250,4 +251,7 @@ with open(config_data_path, "w", encoding="utf-8") as config_data_file:
 #     version_data = {"version": version}
 #     json.dump(version_data, package_file, ensure_ascii=0)
 
+# 生成各语言已翻译的配置数据包
+buildbundle.build_bundle()
+
 print("Config Building End")
@@ -0,0 +1,81 @@
+import os
+import json
+import gettext
+
+po_dir = os.path.join("data", "po")
+""" po文件目录 """
+data_path = os.path.join("data", "data.json")
+""" 原始json数据文件路径 """
+character_path = os.path.join("data", "Character.json")
+""" 原始角色数据文件路径 """
+
+
+def get_source_stat(file_path: str) -> list:
+    """
+    获取源文件的修改时间与大小，载入时以此判断翻译包是否过期
+    Keyword arguments:
+    file_path -- 文件路径
+    Return arguments:
+    list -- [修改时间(ns), 大小]
+    """
+    now_stat = os.stat(file_path)
+    return [now_stat.st_mtime_ns, now_stat.st_size]
+
+
+def translate_config_data(config_data: dict, translation: gettext.GNUTranslations):
+    """
+    按指定字段翻译配置数据，翻译后删除字段标记，载入时不再翻译
+    Keyword arguments:
+    config_data -- 配置数据
+    translation -- 翻译对象
+    """
+    for now_data in config_data.values():
+        if "gettext" not in now_data:
+            continue
+        for row in now_data["data"]:
+            for key in row:
+                if now_data["gettext"].get(key) and isinstance(row[key], str):
+                    row[key] = translation.gettext(row[key])
+        del now_data["gettext"]
+
+
+def translate_character_data(character_data: dict, translation: gettext.GNUTranslations):
+    """
+    翻译角色模板数据中的全部文本
+    Keyword arguments:
+    character_data -- 角色模板数据
+    translation -- 翻译对象
+    """
+    for now_data in character_data.values():
+        for key in now_data:
+            if isinstance(now_data[key], str):
+                now_data[key] = translation.gettext(now_data[key])
+
+
+def build_bundle():
+    """为每种语言生成已翻译的配置数据包，未翻译的文本保留原文"""
+    for language in os.listdir(po_dir):
+        mo_path = os.path.join(po_dir, language, "LC_MESSAGES", "erArk.mo")
+        if not os.path.exists(mo_path):
+            continue
+        with open(mo_path, "rb") as mo_file:
+            translation = gettext.GNUTranslations(mo_file)
+        with open(data_path, "r", encoding="utf-8") as data_file:
+            config_data = json.load(data_file)
+        with open(character_path, "r", encoding="utf-8") as character_file:
+            character_data = json.load(character_file)
+        translate_config_data(config_data, translation)
+        translate_character_data(character_data, translation)
+        bundle_data = {
+            "source": {now_path: get_source_stat(now_path) for now_path in (data_path, character_path, mo_path)},
+            "config": config_data,
+            "character": character_data,
+        }
+        bundle_path = os.path.join(po_dir, language, "config.json")
+        with open(bundle_path, "w", encoding="utf-8") as bundle_file:
+            json.dump(bundle_data, bundle_file, ensure_ascii=0)
+
+
+if __name__ == "__main__":
+    build_bundle()
+    print("Bundle Building End")
@@ -14,6 +14,23 @@ logging.basicConfig(format='等级：%(levelname)s，函数名：%(funcName)s，
 
 cache_control.cache = game_type.Cache()
 normal_config.init_normal_config()
+if normal_config.config_normal.import_time_report:
+    from Script.Core import import_profile
+
+    import_profile.start()
+if normal_config.config_normal.trace_mode:
+    from Script.Core import trace_handle
+
+    trace_handle.start()
+if normal_config.config_normal.dispatch_profile:
+    from Script.Core import dispatch_profile
+
+    dispatch_profile.start()
+if normal_config.config_normal.order_replay:
+    # 回放时以丢弃全部输出的空前端代替tk窗体，需在任何模块导入main_frame前替换
+    from Script.Core import null_frame
+
+    sys.modules["Script.Core.main_frame"] = null_frame
 
 
 from Script.Core import get_text
@@ -34,14 +51,24 @@ map_config.init_map_data()
 
 from Script.Design import start_flow, handle_premise, game_time
 from Script.Core import game_init
-import Script.Settle
-import Script.StateMachine
+# Script.Settle与Script.StateMachine由constant中的注册表在首次结算时按需导入
 import Script.UI.Flow
 import multiprocessing
+from Script.Config import premise_order
+
+premise_order.init_premise_order()
 
 
 if __name__ == "__main__":
     multiprocessing.freeze_support()
 
 game_time.init_time()
+from Script.Core import record_handle
+
+if normal_config.config_normal.order_replay:
+    record_handle.start_replay(normal_config.config_normal.order_replay)
+elif normal_config.config_normal.order_record:
+    record_handle.start_record()
+if normal_config.config_normal.import_time_report:
+    import_profile.report("启动")
 game_init.run(start_flow.start_frame)
@@ -0,0 +1,68 @@
+#!/usr/bin/python3
+# -*- coding: UTF-8 -*-
+# npc决策阶段的并行扩展性基准，需在游戏根目录下运行：python tools/decision_benchmark.py 存档id [角色数] [最大进程数]
+# 读取存档后复制已有干员直到达到指定角色数，让全部npc空闲，分别用1到最大进程数查找一轮目标并对比耗时与结果
+import os
+import sys
+import copy
+import time
+import random
+import multiprocessing
+
+sys.path.insert(0, os.getcwd())
+from Script.Config import normal_config
+from Script.Core import game_type, cache_control
+
+cache_control.cache = game_type.Cache()
+normal_config.init_normal_config()
+from Script.Config import game_config, name_config, character_config, map_config
+
+game_config.init()
+name_config.init_name_data()
+character_config.init_character_tem_data()
+map_config.init_map_data()
+from Script.Core import constant, save_handle
+from Script.Design import character_behavior, map_handle
+
+if len(sys.argv) < 2:
+    print("用法：python tools/decision_benchmark.py 存档id [角色数] [最大进程数]")
+    os._exit(1)
+character_max = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+process_max = int(sys.argv[3]) if len(sys.argv) > 3 else multiprocessing.cpu_count()
+cache = cache_control.cache
+save_handle.input_load_save(sys.argv[1])
+random.seed(0)
+
+# 复制干员直到达到指定角色数
+npc_id_list = sorted(cache.npc_id_got - {0})
+new_id = max(cache.character_data) + 1
+while len(cache.npc_id_got - {0}) < character_max:
+    new_character = copy.deepcopy(cache.character_data[random.choice(npc_id_list)])
+    new_character.cid = new_id
+    cache.character_data[new_id] = new_character
+    cache.npc_id_got.add(new_id)
+    scene_path_str = map_handle.get_map_system_path_str_for_list(new_character.position)
+    cache.scene_data[scene_path_str].character_list.add(new_id)
+    new_id += 1
+
+# 让全部npc空闲
+character_seed_list = []
+for character_id in sorted(cache.npc_id_got - {0}):
+    character_data: game_type.Character = cache.character_data[character_id]
+    character_data.behavior = game_type.Behavior()
+    character_data.behavior.start_time = cache.game_time
+    character_data.state = constant.CharacterStatus.STATUS_ARDER
+    character_seed_list.append((character_id, f"0-{character_id}"))
+
+print(f"npc数：{len(character_seed_list)}，可用核心数：{multiprocessing.cpu_count()}")
+print(f"{'进程数':>6}{'耗时s':>10}{'加速比':>8}  结果一致")
+base_time, base_result = 0, None
+for process_count in sorted({min(2**i, process_max) for i in range(process_max.bit_length() + 1)}):
+    start_time = time.perf_counter()
+    result_list = character_behavior.get_decision_target_list(character_seed_list, process_count)
+    now_time = time.perf_counter() - start_time
+    if base_result is None:
+        base_time, base_result = now_time, result_list
+    print(f"{process_count:>6}{now_time:>10.3f}{base_time / now_time:>8.2f}  {result_list == base_result}")
+# 载入界面模块时启动的指令处理线程不会自行结束
+os._exit(0)
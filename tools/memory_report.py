@@ -0,0 +1,28 @@
+#!/usr/bin/python3
+# -*- coding: UTF-8 -*-
+# 统计存档中游戏缓存的内存占用，需在游戏根目录下运行：python tools/memory_report.py 存档id
+import os
+import sys
+import pickle
+
+sys.path.insert(0, os.getcwd())
+from Script.Core import memory_report, save_container, game_type
+
+if len(sys.argv) < 2:
+    print("用法：python tools/memory_report.py 存档id")
+    sys.exit(1)
+save_path = os.path.join("save", sys.argv[1], "1")
+if save_container.is_save_container(save_path):
+    save_data = save_container.read_container(save_path)
+    if "data" in save_data:
+        save_cache = save_data["data"]
+    else:
+        # 分段存档，不含读档时沿用启动数据的字段
+        save_cache = game_type.Cache.__new__(game_type.Cache)
+        save_cache.__dict__.update(save_data.pop("world"))
+        save_cache.__dict__.update(save_data)
+else:
+    with open(save_path, "rb") as save_file:
+        save_cache = pickle.load(save_file)
+for text in memory_report.get_report_text(save_cache):
+    print(text)
@@ -0,0 +1,103 @@
+#!/usr/bin/python3
+# -*- coding: UTF-8 -*-
+# 存档格式基准，需在游戏根目录下运行：python tools/save_benchmark.py 存档id [重复次数]
+# 读取存档后分别以旧格式(直接pickle整个缓存)与各压缩方式的分段存档写入临时存档位再读回，对比文件大小、写入与读取耗时和峰值内存
+import os
+import sys
+import time
+import pickle
+import tracemalloc
+
+sys.path.insert(0, os.getcwd())
+from Script.Config import normal_config
+from Script.Core import game_type, cache_control
+
+cache_control.cache = game_type.Cache()
+normal_config.init_normal_config()
+from Script.Config import game_config, map_config
+
+game_config.init()
+map_config.init_map_data()
+from Script.Core import save_handle, save_container
+
+if len(sys.argv) < 2:
+    print("用法：python tools/save_benchmark.py 存档id [重复次数]")
+    os._exit(1)
+repeat_count = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+cache = cache_control.cache
+save_handle.input_load_save(sys.argv[1])
+bench_save_id = "save_benchmark"
+old_path = os.path.join(save_handle.get_save_dir_path(bench_save_id), "old")
+
+
+def write_old():
+    """以旧格式写入"""
+    with open(old_path, "wb+") as f:
+        pickle.dump(cache, f)
+
+
+def read_old():
+    """以旧格式读取"""
+    with open(old_path, "rb") as f:
+        return pickle.load(f)
+
+
+def write_new():
+    """以分段存档写入"""
+    save_handle.write_save_data(bench_save_id, "1", save_handle.get_cache_section_data())
+
+
+def read_new():
+    """以分段存档读取"""
+    return save_handle.load_save(bench_save_id)
+
+
+def measure(func) -> (float, int):
+    """
+    测量函数的最短耗时与峰值内存
+    Keyword arguments:
+    func -- 要测量的函数
+    Return arguments:
+    float -- 最短耗时(s)
+    int -- 峰值内存(字节)
+    """
+    best_time = None
+    for _ in range(repeat_count):
+        start_time = time.perf_counter()
+        func()
+        now_time = time.perf_counter() - start_time
+        best_time = now_time if best_time is None else min(best_time, now_time)
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best_time, peak
+
+
+os.makedirs(save_handle.get_save_dir_path(bench_save_id), exist_ok=True)
+print(f"{'格式':<12}{'大小KB':>10}{'写入s':>10}{'读取s':>10}{'写入峰值MB':>12}{'读取峰值MB':>12}")
+format_list = [("旧格式", None, None)]
+for compress_name, compress_type, level_list in (
+    ("不压缩", save_container.compress_none, (0,)),
+    ("zlib", save_container.compress_zlib, (1, 6, 9)),
+    ("lzma", save_container.compress_lzma, (0, 6)),
+):
+    for compress_level in level_list:
+        format_list.append((f"{compress_name}-{compress_level}" if compress_type else compress_name, compress_type, compress_level))
+for format_name, compress_type, compress_level in format_list:
+    if compress_type is None:
+        write_func, read_func, file_path = write_old, read_old, old_path
+    else:
+        normal_config.config_normal.save_compress = compress_type
+        normal_config.config_normal.save_compress_level = compress_level
+        write_func, read_func = write_new, read_new
+        file_path = os.path.join(save_handle.get_save_dir_path(bench_save_id), "1")
+    write_time, write_peak = measure(write_func)
+    file_size = os.path.getsize(file_path)
+    read_time, read_peak = measure(read_func)
+    print(
+        f"{format_name:<12}{file_size / 1024:>10.1f}{write_time:>10.3f}{read_time:>10.3f}"
+        f"{write_peak / 1048576:>12.1f}{read_peak / 1048576:>12.1f}"
+    )
+save_handle.remove_save(bench_save_id)
+os._exit(0)